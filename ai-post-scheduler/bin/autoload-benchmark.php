@@ -0,0 +1,164 @@
+#!/usr/bin/env php
+<?php
+/**
+ * Autoload Benchmark Script
+ *
+ * Compares the cost of locating plugin class files with and without the
+ * generated classmap (includes/aips-classmap.php):
+ * - Probing: AIPS_Autoloader::find_file(), up to two file_exists() calls per
+ *   include directory
+ * - Classmap: reading the map once per request, then an array lookup
+ *
+ * Each iteration simulates one request that resolves every mapped class.
+ * Files are located but not required, so WordPress is not needed. Pass
+ * --cold to clear PHP's stat and realpath caches before every request.
+ *
+ * Regenerate the classmap with `python3 scripts/feature_scanner.py classmap`.
+ *
+ * @package AI_Post_Scheduler
+ */
+
+// Ensure we're running from command line
+if (php_sapi_name() !== 'cli') {
+	die("This script must be run from the command line.\n");
+}
+
+// Parse command line arguments
+$options = getopt('', array(
+	'iterations::',
+	'cold',
+	'output-file::',
+));
+
+$iterations = max(1, (int) ($options['iterations'] ?? 200));
+$cold = isset($options['cold']);
+$output_file = $options['output-file'] ?? '';
+
+if (!defined('ABSPATH')) {
+	define('ABSPATH', dirname(__DIR__) . '/');
+}
+if (!defined('AIPS_PLUGIN_DIR')) {
+	define('AIPS_PLUGIN_DIR', dirname(__DIR__) . '/');
+}
+
+require_once AIPS_PLUGIN_DIR . 'includes/class-aips-autoloader.php';
+
+AIPS_Autoloader::set_classmap(null);
+$classmap = AIPS_Autoloader::get_classmap();
+if (empty($classmap)) {
+	die("Error: No classmap at " . AIPS_PLUGIN_DIR . AIPS_Autoloader::CLASSMAP_FILE . "\n");
+}
+$classes = array_keys($classmap);
+
+/**
+ * Count the file_exists() calls find_file() makes for a class
+ *
+ * @param string $class_name Class name
+ * @return int Number of probes
+ */
+function count_probes($class_name) {
+	$class_file = AIPS_Autoloader::convert_class_name_to_filename($class_name);
+	$interface_file = 'interface-' . AIPS_Autoloader::convert_class_name_to_base($class_name) . '.php';
+	$probes = 0;
+
+	foreach (array('includes/', 'includes/providers/', 'includes/diagnostics/', 'includes/job/') as $dir) {
+		$probes++;
+		if (file_exists(AIPS_PLUGIN_DIR . $dir . $class_file)) {
+			return $probes;
+		}
+
+		$probes++;
+		if (file_exists(AIPS_PLUGIN_DIR . $dir . $interface_file)) {
+			return $probes;
+		}
+	}
+
+	return $probes;
+}
+
+/**
+ * Time a resolver over all classes for the configured number of requests
+ *
+ * @param callable $resolve_request Resolves every class once
+ * @return array Metrics array
+ */
+function run_autoload_benchmark($resolve_request) {
+	global $iterations, $cold, $classes;
+
+	$elapsed = 0.0;
+	for ($i = 0; $i < $iterations; $i++) {
+		if ($cold) {
+			clearstatcache(true);
+		}
+		$start = hrtime(true);
+		$resolve_request();
+		$elapsed += hrtime(true) - $start;
+	}
+
+	return array(
+		'per_request_ms' => $elapsed / $iterations / 1e6,
+		'per_class_us' => $elapsed / $iterations / count($classes) / 1e3,
+	);
+}
+
+$unresolved = 0;
+$probes = 0;
+foreach ($classes as $class_name) {
+	$probes += count_probes($class_name);
+	if (null === AIPS_Autoloader::find_file($class_name)) {
+		$unresolved++;
+	}
+}
+
+echo "========================================\n";
+echo "Autoload Benchmark\n";
+echo "========================================\n";
+echo "Classes: " . count($classes) . " | Requests: $iterations | Stat cache: " . ($cold ? 'cleared per request' : 'warm') . "\n";
+echo "Probing: $probes file_exists() calls per request; $unresolved class(es) not found by probing\n";
+echo "========================================\n\n";
+
+$benchmarks = array();
+
+$benchmarks['probing'] = run_autoload_benchmark(function() use ($classes) {
+	foreach ($classes as $class_name) {
+		AIPS_Autoloader::find_file($class_name);
+	}
+});
+
+$benchmarks['classmap'] = run_autoload_benchmark(function() use ($classes) {
+	AIPS_Autoloader::set_classmap(null);
+	$map = AIPS_Autoloader::get_classmap();
+	foreach ($classes as $class_name) {
+		if (isset($map[$class_name])) {
+			$file = AIPS_PLUGIN_DIR . $map[$class_name];
+		}
+	}
+});
+
+foreach ($benchmarks as $name => $metrics) {
+	echo sprintf(
+		"%-10s | Per request: %8.3fms | Per class: %7.2fus\n",
+		ucfirst($name),
+		$metrics['per_request_ms'],
+		$metrics['per_class_us']
+	);
+}
+
+$speedup = $benchmarks['probing']['per_request_ms'] / max($benchmarks['classmap']['per_request_ms'], 1e-9);
+echo sprintf("\nClassmap lookup is %.1fx faster and saves %d filesystem probes per request.\n", $speedup, $probes);
+
+// Save results to file if requested
+if ($output_file) {
+	$output_data = array(
+		'timestamp' => date('Y-m-d H:i:s'),
+		'php_version' => PHP_VERSION,
+		'classes' => count($classes),
+		'iterations' => $iterations,
+		'cold' => $cold,
+		'probes_per_request' => $probes,
+		'benchmarks' => $benchmarks,
+	);
+
+	file_put_contents($output_file, json_encode($output_data, JSON_PRETTY_PRINT));
+	echo "Results saved to: $output_file\n";
+}
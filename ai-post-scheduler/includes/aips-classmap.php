@@ -0,0 +1,228 @@
+<?php
+/**
+ * Autoloader classmap
+ *
+ * Maps every AIPS_* class, interface and trait to its plugin-relative file
+ * so AIPS_Autoloader can require it without probing include directories.
+ * Generated by `python3 scripts/feature_scanner.py classmap` — do not edit;
+ * regenerate after adding, renaming or moving a class.
+ *
+ * @package AI_Post_Scheduler
+ */
+
+if (!defined('ABSPATH')) {
+    exit;
+}
+
+return array(
+    'AIPS_AI_Assistance_Controller'                 => 'includes/class-aips-ai-assistance-controller.php',
+    'AIPS_AI_Assistance_Repository'                 => 'includes/class-aips-ai-assistance-repository.php',
+    'AIPS_AI_Assistance_Service'                    => 'includes/class-aips-ai-assistance-service.php',
+    'AIPS_AI_Conversation'                          => 'includes/class-aips-ai-conversation.php',
+    'AIPS_AI_Edit_Controller'                       => 'includes/class-aips-ai-edit-controller.php',
+    'AIPS_AI_Provider_Factory'                      => 'includes/class-aips-ai-provider-factory.php',
+    'AIPS_AI_Provider_Interface'                    => 'includes/interface-aips-ai-provider-interface.php',
+    'AIPS_AI_Service'                               => 'includes/class-aips-ai-service.php',
+    'AIPS_AI_Service_Interface'                     => 'includes/interface-aips-ai-service-interface.php',
+    'AIPS_Admin_Assets'                             => 'includes/class-aips-admin-assets.php',
+    'AIPS_Admin_Bar'                                => 'includes/class-aips-admin-bar.php',
+    'AIPS_Admin_Flow_Controller'                    => 'includes/class-aips-admin-flow-controller.php',
+    'AIPS_Admin_Menu'                               => 'includes/class-aips-admin-menu.php',
+    'AIPS_Admin_Menu_Helper'                        => 'includes/class-aips-admin-menu-helper.php',
+    'AIPS_Affiliate_Link_Inserter_Service'          => 'includes/class-aips-affiliate-link-inserter-service.php',
+    'AIPS_Affiliate_Links_Controller'               => 'includes/class-aips-affiliate-links-controller.php',
+    'AIPS_Affiliate_Links_Repository'               => 'includes/class-aips-affiliate-links-repository.php',
+    'AIPS_Affiliate_Links_Service'                  => 'includes/class-aips-affiliate-links-service.php',
+    'AIPS_Ajax_Registry'                            => 'includes/class-aips-ajax-registry.php',
+    'AIPS_Ajax_Response'                            => 'includes/class-aips-ajax-response.php',
+    'AIPS_Article_Structure_Manager'                => 'includes/class-aips-article-structure-manager.php',
+    'AIPS_Article_Structure_Repository'             => 'includes/class-aips-article-structure-repository.php',
+    'AIPS_Author_Post_Generator'                    => 'includes/class-aips-author-post-generator.php',
+    'AIPS_Author_Slice_Scheduler_Base'              => 'includes/class-aips-author-slice-scheduler-base.php',
+    'AIPS_Author_Suggestions_Service'               => 'includes/class-aips-author-suggestions-service.php',
+    'AIPS_Author_Topic_Logs_Repository'             => 'includes/class-aips-author-topic-logs-repository.php',
+    'AIPS_Author_Topics_Controller'                 => 'includes/class-aips-author-topics-controller.php',
+    'AIPS_Author_Topics_Generator'                  => 'includes/class-aips-author-topics-generator.php',
+    'AIPS_Author_Topics_Repository'                 => 'includes/class-aips-author-topics-repository.php',
+    'AIPS_Author_Topics_Scheduler'                  => 'includes/class-aips-author-topics-scheduler.php',
+    'AIPS_Authors_Controller'                       => 'includes/class-aips-authors-controller.php',
+    'AIPS_Authors_Repository'                       => 'includes/class-aips-authors-repository.php',
+    'AIPS_Autoloader'                               => 'includes/class-aips-autoloader.php',
+    'AIPS_Automations_Controller'                   => 'includes/class-aips-automations-controller.php',
+    'AIPS_Batch_Queue_Service'                      => 'includes/class-aips-batch-queue-service.php',
+    'AIPS_Batch_Slicer'                             => 'includes/job/class-aips-batch-slicer.php',
+    'AIPS_Bulk_Batch_Job_Store'                     => 'includes/class-aips-bulk-batch-job-store.php',
+    'AIPS_Bulk_Batch_Processor'                     => 'includes/class-aips-bulk-batch-processor.php',
+    'AIPS_Bulk_Generation_Result'                   => 'includes/class-aips-bulk-generator-service.php',
+    'AIPS_Bulk_Generator_Service'                   => 'includes/class-aips-bulk-generator-service.php',
+    'AIPS_Cache'                                    => 'includes/class-aips-cache.php',
+    'AIPS_Cache_Array_Driver'                       => 'includes/class-aips-cache-array-driver.php',
+    'AIPS_Cache_Db_Driver'                          => 'includes/class-aips-cache-db-driver.php',
+    'AIPS_Cache_Driver'                             => 'includes/interface-aips-cache-driver.php',
+    'AIPS_Cache_Factory'                            => 'includes/class-aips-cache-factory.php',
+    'AIPS_Cache_Index'                              => 'includes/class-aips-cache-index.php',
+    'AIPS_Cache_Invalidation_Bus'                   => 'includes/class-aips-cache-invalidation-bus.php',
+    'AIPS_Cache_Monitor_Controller'                 => 'includes/class-aips-cache-monitor-controller.php',
+    'AIPS_Cache_Monitor_Repository'                 => 'includes/class-aips-cache-monitor-repository.php',
+    'AIPS_Cache_Monitor_Service'                    => 'includes/class-aips-cache-monitor-service.php',
+    'AIPS_Cache_Monitorable_Driver'                 => 'includes/interface-aips-cache-monitorable-driver.php',
+    'AIPS_Cache_Policy'                             => 'includes/class-aips-cache-policy.php',
+    'AIPS_Cache_Wp_Object_Cache_Driver'             => 'includes/class-aips-cache-wp-object-cache-driver.php',
+    'AIPS_Cacheable_Repository'                     => 'includes/trait-aips-cacheable-repository.php',
+    'AIPS_Calendar_Controller'                      => 'includes/class-aips-calendar-controller.php',
+    'AIPS_Campaigns_Controller'                     => 'includes/class-aips-campaigns-controller.php',
+    'AIPS_Campaigns_Repository'                     => 'includes/class-aips-campaigns-repository.php',
+    'AIPS_Component_Regeneration_Service'           => 'includes/class-aips-component-regeneration-service.php',
+    'AIPS_Config'                                   => 'includes/class-aips-config.php',
+    'AIPS_Container'                                => 'includes/class-aips-container.php',
+    'AIPS_Content_Auditor'                          => 'includes/class-aips-content-auditor.php',
+    'AIPS_Correlation_ID'                           => 'includes/class-aips-correlation-id.php',
+    'AIPS_Cron_Generation_Handler'                  => 'includes/interface-aips-cron-generation-handler.php',
+    'AIPS_DB_Manager'                               => 'includes/class-aips-db-manager.php',
+    'AIPS_DB_Migrations'                            => 'includes/class-aips-db-migrations.php',
+    'AIPS_Dashboard_Controller'                     => 'includes/class-aips-dashboard-controller.php',
+    'AIPS_Dashboard_Repository'                     => 'includes/class-aips-dashboard-repository.php',
+    'AIPS_Data_Management_Export'                   => 'includes/class-aips-data-management-export.php',
+    'AIPS_Data_Management_Export_JSON'              => 'includes/class-aips-data-management-export-json.php',
+    'AIPS_Data_Management_Export_MySQL'             => 'includes/class-aips-data-management-export-mysql.php',
+    'AIPS_Data_Management_Import'                   => 'includes/class-aips-data-management-import.php',
+    'AIPS_Data_Management_Import_JSON'              => 'includes/class-aips-data-management-import-json.php',
+    'AIPS_Data_Management_Import_MySQL'             => 'includes/class-aips-data-management-import-mysql.php',
+    'AIPS_Data_Management_Repository'               => 'includes/class-aips-data-management-repository.php',
+    'AIPS_DateTime'                                 => 'includes/class-aips-date-time.php',
+    'AIPS_Date_Time_DB_Repair'                      => 'includes/class-aips-date-time-db-repair.php',
+    'AIPS_Dev_Tools'                                => 'includes/class-aips-dev-tools.php',
+    'AIPS_Diagnostics_Controller'                   => 'includes/class-aips-diagnostics-controller.php',
+    'AIPS_Dispatch_Summary'                         => 'includes/job/class-aips-dispatch-summary.php',
+    'AIPS_Embeddings_Cron'                          => 'includes/class-aips-embeddings-cron.php',
+    'AIPS_Embeddings_Service'                       => 'includes/class-aips-embeddings-service.php',
+    'AIPS_Error_Handler'                            => 'includes/class-aips-error-handler.php',
+    'AIPS_Feedback_Repository'                      => 'includes/class-aips-feedback-repository.php',
+    'AIPS_Generated_Posts_Controller'               => 'includes/class-aips-generated-posts-controller.php',
+    'AIPS_Generation_Context'                       => 'includes/interface-aips-generation-context.php',
+    'AIPS_Generation_Context_Factory'               => 'includes/class-aips-generation-context-factory.php',
+    'AIPS_Generation_Execution_Runner'              => 'includes/class-aips-generation-execution-runner.php',
+    'AIPS_Generation_Result'                        => 'includes/class-aips-generation-result.php',
+    'AIPS_Generation_Session'                       => 'includes/class-aips-generation-session.php',
+    'AIPS_Generator'                                => 'includes/class-aips-generator.php',
+    'AIPS_History'                                  => 'includes/class-aips-history.php',
+    'AIPS_History_Container'                        => 'includes/class-aips-history-container.php',
+    'AIPS_History_Repository'                       => 'includes/class-aips-history-repository.php',
+    'AIPS_History_Repository_Interface'             => 'includes/interface-aips-history-repository-interface.php',
+    'AIPS_History_Service'                          => 'includes/class-aips-history-service.php',
+    'AIPS_History_Service_Interface'                => 'includes/interface-aips-history-service-interface.php',
+    'AIPS_History_Type'                             => 'includes/class-aips-history-type.php',
+    'AIPS_Image_Service'                            => 'includes/class-aips-image-service.php',
+    'AIPS_Internal_Link_Inserter_Service'           => 'includes/class-aips-internal-link-inserter-service.php',
+    'AIPS_Internal_Links_Controller'                => 'includes/class-aips-internal-links-controller.php',
+    'AIPS_Internal_Links_Repository'                => 'includes/class-aips-internal-links-repository.php',
+    'AIPS_Internal_Links_Service'                   => 'includes/class-aips-internal-links-service.php',
+    'AIPS_Interval_Calculator'                      => 'includes/class-aips-interval-calculator.php',
+    'AIPS_Job_Definition'                           => 'includes/job/class-aips-job-definition.php',
+    'AIPS_Job_Dispatcher'                           => 'includes/job/class-aips-job-dispatcher.php',
+    'AIPS_Job_Progress_Tracker'                     => 'includes/job/class-aips-job-progress-tracker.php',
+    'AIPS_Job_Scheduler'                            => 'includes/job/class-aips-job-scheduler.php',
+    'AIPS_Logger'                                   => 'includes/class-aips-logger.php',
+    'AIPS_Logger_Interface'                         => 'includes/interface-aips-logger-interface.php',
+    'AIPS_Markdown_Parser'                          => 'includes/class-aips-markdown-parser.php',
+    'AIPS_Meow_AI_Provider'                         => 'includes/providers/class-aips-meow-ai-provider.php',
+    'AIPS_Metrics_Repository'                       => 'includes/class-aips-metrics-repository.php',
+    'AIPS_Notification_Registry'                    => 'includes/class-aips-notification-registry.php',
+    'AIPS_Notification_Senders'                     => 'includes/class-aips-notification-senders.php',
+    'AIPS_Notification_Template'                    => 'includes/class-aips-notification-template.php',
+    'AIPS_Notification_Templates'                   => 'includes/class-aips-notification-templates.php',
+    'AIPS_Notifications'                            => 'includes/class-aips-notifications.php',
+    'AIPS_Notifications_Event_Handler'              => 'includes/class-aips-notifications-event-handler.php',
+    'AIPS_Notifications_Repository'                 => 'includes/class-aips-notifications-repository.php',
+    'AIPS_Notifications_Repository_Interface'       => 'includes/interface-aips-notifications-repository-interface.php',
+    'AIPS_Null_AI_Provider'                         => 'includes/providers/class-aips-null-ai-provider.php',
+    'AIPS_Onboarding_Wizard'                        => 'includes/class-aips-onboarding-wizard.php',
+    'AIPS_Operations_Insights_Controller'           => 'includes/class-aips-operations-insights-controller.php',
+    'AIPS_Partial_Generation_State_Reconciler'      => 'includes/class-aips-partial-generation-state-reconciler.php',
+    'AIPS_Planner'                                  => 'includes/class-aips-planner.php',
+    'AIPS_Post_Creator'                             => 'includes/class-aips-post-creator.php',
+    'AIPS_Post_Embeddings_Repository'               => 'includes/class-aips-post-embeddings-repository.php',
+    'AIPS_Post_History_UI'                          => 'includes/class-aips-post-history-ui.php',
+    'AIPS_Post_Manager'                             => 'includes/class-aips-post-manager.php',
+    'AIPS_Post_Review'                              => 'includes/class-aips-post-review.php',
+    'AIPS_Post_Review_Repository'                   => 'includes/class-aips-post-review-repository.php',
+    'AIPS_Post_Slices_Controller'                   => 'includes/class-aips-post-slices-controller.php',
+    'AIPS_Post_Slices_Repository'                   => 'includes/class-aips-post-slices-repository.php',
+    'AIPS_Prompt_Builder'                           => 'includes/class-aips-prompt-builder.php',
+    'AIPS_Prompt_Builder_Article_Structure_Section' => 'includes/class-aips-prompt-builder-article-structure-section.php',
+    'AIPS_Prompt_Builder_Authors'                   => 'includes/class-aips-prompt-builder-authors.php',
+    'AIPS_Prompt_Builder_Diversity_Injector'        => 'includes/class-aips-prompt-builder-diversity-injector.php',
+    'AIPS_Prompt_Builder_Post_Content'              => 'includes/class-aips-prompt-builder-post-content.php',
+    'AIPS_Prompt_Builder_Post_Excerpt'              => 'includes/class-aips-prompt-builder-post-excerpt.php',
+    'AIPS_Prompt_Builder_Post_Featured_Image'       => 'includes/class-aips-prompt-builder-post-featured-image.php',
+    'AIPS_Prompt_Builder_Post_Metadata'             => 'includes/class-aips-prompt-builder-post-metadata.php',
+    'AIPS_Prompt_Builder_Post_Title'                => 'includes/class-aips-prompt-builder-post-title.php',
+    'AIPS_Prompt_Builder_Taxonomy'                  => 'includes/class-aips-prompt-builder-taxonomy.php',
+    'AIPS_Prompt_Builder_Topic'                     => 'includes/class-aips-prompt-builder-topic.php',
+    'AIPS_Prompt_Section_Repository'                => 'includes/class-aips-prompt-section-repository.php',
+    'AIPS_Prompt_Sections_Controller'               => 'includes/class-aips-prompt-sections-controller.php',
+    'AIPS_Repository_Cache_Config'                  => 'includes/class-aips-repository-cache-config.php',
+    'AIPS_Repository_Cache_Dependencies'            => 'includes/class-aips-repository-cache-dependencies.php',
+    'AIPS_Repository_Cache_Key_Builder'             => 'includes/class-aips-repository-cache-key-builder.php',
+    'AIPS_Repository_Cache_Observer'                => 'includes/class-aips-repository-cache-observer.php',
+    'AIPS_Research_Controller'                      => 'includes/class-aips-research-controller.php',
+    'AIPS_Research_Service'                         => 'includes/class-aips-research-service.php',
+    'AIPS_Resilience_Service'                       => 'includes/class-aips-resilience-service.php',
+    'AIPS_Schedule_Controller'                      => 'includes/class-aips-schedule-controller.php',
+    'AIPS_Schedule_Entry'                           => 'includes/class-aips-schedule-entry.php',
+    'AIPS_Schedule_Processor'                       => 'includes/class-aips-schedule-processor.php',
+    'AIPS_Schedule_Repository'                      => 'includes/class-aips-schedule-repository.php',
+    'AIPS_Schedule_Repository_Interface'            => 'includes/interface-aips-schedule-repository-interface.php',
+    'AIPS_Schedule_Result_Handler'                  => 'includes/class-aips-schedule-result-handler.php',
+    'AIPS_Scheduler'                                => 'includes/class-aips-scheduler.php',
+    'AIPS_Seeder_Admin'                             => 'includes/class-aips-seeder-admin.php',
+    'AIPS_Seeder_Service'                           => 'includes/class-aips-seeder-service.php',
+    'AIPS_Session_To_JSON'                          => 'includes/class-aips-session-to-json.php',
+    'AIPS_Settings'                                 => 'includes/class-aips-settings.php',
+    'AIPS_Settings_AJAX'                            => 'includes/class-aips-settings-ajax.php',
+    'AIPS_Settings_UI'                              => 'includes/class-aips-settings-ui.php',
+    'AIPS_Site_Context'                             => 'includes/class-aips-site-context.php',
+    'AIPS_Slice_Configuration'                      => 'includes/job/class-aips-slice-configuration.php',
+    'AIPS_Sources_Controller'                       => 'includes/class-aips-sources-controller.php',
+    'AIPS_Sources_Cron'                             => 'includes/class-aips-sources-cron.php',
+    'AIPS_Sources_Data_Repository'                  => 'includes/class-aips-sources-data-repository.php',
+    'AIPS_Sources_Fetcher'                          => 'includes/class-aips-sources-fetcher.php',
+    'AIPS_Sources_Repository'                       => 'includes/class-aips-sources-repository.php',
+    'AIPS_Stress_Test_Controller'                   => 'includes/class-aips-stress-test-controller.php',
+    'AIPS_Stress_Test_Resilience_Config'            => 'includes/class-aips-stress-test-service.php',
+    'AIPS_Stress_Test_Service'                      => 'includes/class-aips-stress-test-service.php',
+    'AIPS_Structures_Controller'                    => 'includes/class-aips-structures-controller.php',
+    'AIPS_System_Diagnostic_Provider_Interface'     => 'includes/diagnostics/interface-aips-system-diagnostic-provider-interface.php',
+    'AIPS_System_Diagnostics_Environment_Provider'  => 'includes/diagnostics/class-aips-system-diagnostics-environment-provider.php',
+    'AIPS_System_Diagnostics_Logs_Provider'         => 'includes/diagnostics/class-aips-system-diagnostics-logs-provider.php',
+    'AIPS_System_Diagnostics_Queue_Provider'        => 'includes/diagnostics/class-aips-system-diagnostics-queue-provider.php',
+    'AIPS_System_Diagnostics_Scheduler_Provider'    => 'includes/diagnostics/class-aips-system-diagnostics-scheduler-provider.php',
+    'AIPS_System_Diagnostics_Service'               => 'includes/class-aips-system-diagnostics-service.php',
+    'AIPS_System_Status'                            => 'includes/class-aips-system-status.php',
+    'AIPS_System_Status_Controller'                 => 'includes/class-aips-system-status-controller.php',
+    'AIPS_System_Status_Diagnostics_Service'        => 'includes/class-aips-system-status-diagnostics-service.php',
+    'AIPS_Taxonomy_Controller'                      => 'includes/class-aips-taxonomy-controller.php',
+    'AIPS_Taxonomy_Repository'                      => 'includes/class-aips-taxonomy-repository.php',
+    'AIPS_Telemetry'                                => 'includes/class-aips-telemetry.php',
+    'AIPS_Telemetry_Controller'                     => 'includes/class-aips-telemetry-controller.php',
+    'AIPS_Telemetry_Repository'                     => 'includes/class-aips-telemetry-repository.php',
+    'AIPS_Template_Context'                         => 'includes/class-aips-template-context.php',
+    'AIPS_Template_Data'                            => 'includes/class-aips-template-data.php',
+    'AIPS_Template_Entry'                           => 'includes/class-aips-template-entry.php',
+    'AIPS_Template_Helper'                          => 'includes/class-aips-template-helper.php',
+    'AIPS_Template_Processor'                       => 'includes/class-aips-template-processor.php',
+    'AIPS_Template_Repository'                      => 'includes/class-aips-template-repository.php',
+    'AIPS_Template_Type_Selector'                   => 'includes/class-aips-template-type-selector.php',
+    'AIPS_Templates'                                => 'includes/class-aips-templates.php',
+    'AIPS_Templates_Controller'                     => 'includes/class-aips-templates-controller.php',
+    'AIPS_Token_Budget'                             => 'includes/class-aips-token-budget.php',
+    'AIPS_Topic_Context'                            => 'includes/class-aips-topic-context.php',
+    'AIPS_Topic_Expansion_Service'                  => 'includes/class-aips-topic-expansion-service.php',
+    'AIPS_Topic_Penalty_Service'                    => 'includes/class-aips-topic-penalty-service.php',
+    'AIPS_Trending_Topics_Repository'               => 'includes/class-aips-trending-topics-repository.php',
+    'AIPS_Unified_Schedule_Service'                 => 'includes/class-aips-unified-schedule-service.php',
+    'AIPS_Utilities'                                => 'includes/class-aips-utilities.php',
+    'AIPS_Voices'                                   => 'includes/class-aips-voices.php',
+    'AIPS_Voices_Repository'                        => 'includes/class-aips-voices-repository.php',
+    'AIPS_WP_AI_Client_Provider'                    => 'includes/providers/class-aips-wp-ai-client-provider.php',
+);
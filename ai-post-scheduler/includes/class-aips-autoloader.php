@@ -5,10 +5,48 @@ if (!defined('ABSPATH')) {
 
 class AIPS_Autoloader {
 
+    /**
+     * Plugin-relative path of the generated classmap.
+     */
+    const CLASSMAP_FILE = 'includes/aips-classmap.php';
+
+    /**
+     * Class name => plugin-relative file, or null until first use.
+     *
+     * @var array|null
+     */
+    private static $classmap = null;
+
     public static function register() {
         spl_autoload_register(array(__CLASS__, 'load'));
     }
 
+    /**
+     * Get the classmap generated by `scripts/feature_scanner.py classmap`.
+     *
+     * Read once per request; an empty map when the file is absent, in which
+     * case every class is located by probing the include directories.
+     *
+     * @return array Class name => plugin-relative file path.
+     */
+    public static function get_classmap() {
+        if (null === self::$classmap) {
+            $file = AIPS_PLUGIN_DIR . self::CLASSMAP_FILE;
+            self::$classmap = file_exists($file) ? (array) require $file : array();
+        }
+
+        return self::$classmap;
+    }
+
+    /**
+     * Replace the classmap used by load(); null re-reads the generated file.
+     *
+     * @param array|null $classmap Class name => plugin-relative file path.
+     */
+    public static function set_classmap($classmap) {
+        self::$classmap = $classmap;
+    }
+
     /**
      * Convert class name to base name (lowercase with hyphens)
      * 
@@ -30,12 +68,13 @@ class AIPS_Autoloader {
         return 'class-' . $base_name . '.php';
     }
 
-    public static function load($class_name) {
-        // Check if class starts with AIPS_
-        if (strpos($class_name, 'AIPS_') !== 0) {
-            return;
-        }
-
+    /**
+     * Locate a class or interface file by probing the include directories.
+     *
+     * @param string $class_name The class name to locate
+     * @return string|null Absolute file path, or null when no file matches.
+     */
+    public static function find_file($class_name) {
         // Convert class name to file names using helper methods
         $class_file = self::convert_class_name_to_filename($class_name);
         $base_name = self::convert_class_name_to_base($class_name);
@@ -50,14 +89,34 @@ class AIPS_Autoloader {
 
         foreach ($paths as $path) {
             if (file_exists($path . $class_file)) {
-                require_once $path . $class_file;
-                return;
+                return $path . $class_file;
             }
 
             if (file_exists($path . $interface_file)) {
-                require_once $path . $interface_file;
-                return;
+                return $path . $interface_file;
             }
         }
+
+        return null;
+    }
+
+    public static function load($class_name) {
+        // Check if class starts with AIPS_
+        if (strpos($class_name, 'AIPS_') !== 0) {
+            return;
+        }
+
+        // Mapped classes load with a single stat; a stale entry (file renamed
+        // or removed without regenerating the map) falls back to probing
+        $classmap = self::get_classmap();
+        if (isset($classmap[$class_name]) && is_file(AIPS_PLUGIN_DIR . $classmap[$class_name])) {
+            require_once AIPS_PLUGIN_DIR . $classmap[$class_name];
+            return;
+        }
+
+        $file = self::find_file($class_name);
+        if ($file) {
+            require_once $file;
+        }
     }
 }
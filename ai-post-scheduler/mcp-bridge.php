@@ -42,6 +42,16 @@ class AIPS_MCP_Bridge {
 	 * @var string Version of the MCP bridge
 	 */
 	const VERSION = '1.0.0';
+
+	/**
+	 * @var int Maximum decoded size of a compressed request body (bytes)
+	 */
+	const MAX_REQUEST_BYTES = 10485760;
+
+	/**
+	 * @var int Responses smaller than this are sent uncompressed (bytes)
+	 */
+	const COMPRESS_MIN_BYTES = 1024;
 	
 	/**
 	 * @var array List of available tools
@@ -435,11 +445,11 @@ class AIPS_MCP_Bridge {
 			exit;
 		}
 
-		// Get request body
-		$input = file_get_contents('php://input');
-		$request = json_decode($input, true);
+		// Get request body (clients may gzip/deflate large bodies)
+		$input = $this->decode_request_body(file_get_contents('php://input'));
+		$request = null === $input ? null : json_decode($input, true);
 
-		if (json_last_error() !== JSON_ERROR_NONE) {
+		if (null === $input || json_last_error() !== JSON_ERROR_NONE) {
 			$this->send_error(-32700, 'Parse error: Invalid JSON');
 			return;
 		}
@@ -584,6 +594,33 @@ class AIPS_MCP_Bridge {
 		return $validated;
 	}
 	
+	/**
+	 * Decode a request body sent with Content-Encoding gzip or deflate
+	 *
+	 * @param string $input Raw request body
+	 * @return string|null Decoded body, or null if it could not be decoded
+	 */
+	private function decode_request_body($input) {
+		$encoding = isset($_SERVER['HTTP_CONTENT_ENCODING']) ? strtolower(trim($_SERVER['HTTP_CONTENT_ENCODING'])) : '';
+
+		if ('' === $encoding || 'identity' === $encoding) {
+			return $input;
+		}
+
+		$decoded = false;
+		if ('gzip' === $encoding && function_exists('gzdecode')) {
+			$decoded = @gzdecode($input, self::MAX_REQUEST_BYTES);
+		} elseif ('deflate' === $encoding && function_exists('gzuncompress')) {
+			// RFC 9110 "deflate" is zlib-wrapped, but some clients send raw deflate
+			$decoded = @gzuncompress($input, self::MAX_REQUEST_BYTES);
+			if (false === $decoded) {
+				$decoded = @gzinflate($input, self::MAX_REQUEST_BYTES);
+			}
+		}
+
+		return false === $decoded ? null : $decoded;
+	}
+
 	/**
 	 * Send JSON-RPC success response
 	 * 
@@ -592,13 +629,79 @@ class AIPS_MCP_Bridge {
 	 */
 	private function send_success($result, $id = null) {
 		header('Content-Type: application/json');
-		echo json_encode(array(
+		$this->send_body(json_encode(array(
 			'jsonrpc' => '2.0',
 			'result' => $result,
 			'id' => $id
-		));
+		)));
 		exit;
 	}
+
+	/**
+	 * Whether an Accept-Encoding header allows a gzip response
+	 *
+	 * Honors q-values (RFC 9110 section 12.5.3): "gzip;q=0" refuses gzip, and
+	 * when gzip is not listed a "*" entry decides.
+	 *
+	 * @param string $accept Accept-Encoding header value
+	 * @return bool
+	 */
+	private function accepts_gzip($accept) {
+		$gzip = null;
+		$wildcard = null;
+
+		foreach (explode(',', strtolower($accept)) as $entry) {
+			$parts = array_map('trim', explode(';', $entry));
+			$coding = array_shift($parts);
+			$quality = 1.0;
+			foreach ($parts as $param) {
+				if (0 === strpos($param, 'q=')) {
+					$quality = (float) substr($param, 2);
+				}
+			}
+
+			if ('gzip' === $coding || 'x-gzip' === $coding) {
+				$gzip = max((float) $gzip, $quality);
+			} elseif ('*' === $coding) {
+				$wildcard = $quality;
+			}
+		}
+
+		if (null !== $gzip) {
+			return $gzip > 0;
+		}
+
+		return null !== $wildcard && $wildcard > 0;
+	}
+
+	/**
+	 * Echo a response body, gzip-encoding it when the client accepts gzip
+	 *
+	 * Large results (export_data, get_history, system_status) are repetitive
+	 * JSON that compresses well. Compression is skipped when PHP's own
+	 * zlib.output_compression is active so the body is never encoded twice.
+	 *
+	 * @param string $body Response body
+	 */
+	private function send_body($body) {
+		$accept = isset($_SERVER['HTTP_ACCEPT_ENCODING']) ? $_SERVER['HTTP_ACCEPT_ENCODING'] : '';
+		$can_compress = strlen($body) >= self::COMPRESS_MIN_BYTES
+			&& $this->accepts_gzip($accept)
+			&& function_exists('gzencode')
+			&& !ini_get('zlib.output_compression')
+			&& !headers_sent();
+
+		header('Vary: Accept-Encoding');
+		if ($can_compress) {
+			$encoded = gzencode($body, 6);
+			if (false !== $encoded) {
+				header('Content-Encoding: gzip');
+				$body = $encoded;
+			}
+		}
+
+		echo $body;
+	}
 	
 	/**
 	 * Send JSON-RPC error response
@@ -14,6 +14,12 @@ class AIPS_Autoloader_Test extends WP_UnitTestCase {
 		$this->includes_dir = AIPS_PLUGIN_DIR . 'includes/';
 	}
 
+	public function tearDown(): void {
+		// Re-read the generated classmap on next use
+		AIPS_Autoloader::set_classmap(null);
+		parent::tearDown();
+	}
+
 	/**
 	 * Test that autoloader is registered
 	 */
@@ -249,4 +255,78 @@ class AIPS_Autoloader_Test extends WP_UnitTestCase {
 			'Path should follow expected structure'
 		);
 	}
+
+	/**
+	 * Test that every classmap entry points to the file declaring the class
+	 */
+	public function test_classmap_entries_point_to_declaring_files() {
+		$classmap = AIPS_Autoloader::get_classmap();
+
+		$this->assertNotEmpty($classmap, 'Classmap should be generated');
+		$this->assertArrayHasKey('AIPS_Config', $classmap);
+
+		foreach ($classmap as $class_name => $file) {
+			$path = AIPS_PLUGIN_DIR . $file;
+
+			$this->assertFileExists($path, "Classmap file for {$class_name} should exist");
+			$this->assertMatchesRegularExpression(
+				'/^\s*(?:(?:abstract|final|readonly)\s+)*(?:class|interface|trait|enum)\s+' . $class_name . '\b/m',
+				file_get_contents($path),
+				"{$file} should declare {$class_name}"
+			);
+		}
+	}
+
+	/**
+	 * Test that the classmap covers classes probing cannot locate
+	 */
+	public function test_classmap_maps_classes_probing_cannot_find() {
+		$classmap = AIPS_Autoloader::get_classmap();
+
+		// Declared alongside AIPS_Bulk_Generator_Service, so no file carries its name
+		$this->assertNull(AIPS_Autoloader::find_file('AIPS_Bulk_Generation_Result'));
+		$this->assertEquals(
+			'includes/class-aips-bulk-generator-service.php',
+			$classmap['AIPS_Bulk_Generation_Result']
+		);
+	}
+
+	/**
+	 * Test that a classmap entry for a missing file falls back to probing instead of a fatal error
+	 */
+	public function test_stale_classmap_entry_falls_back_to_probing() {
+		AIPS_Autoloader::set_classmap(array(
+			'AIPS_Slice_Configuration' => 'includes/class-aips-slice-configuration.php',
+			'AIPS_Missing_Class' => 'includes/class-aips-removed-class.php',
+		));
+
+		// The mapped path is wrong; probing finds the class under includes/job/
+		$this->assertEquals(
+			$this->includes_dir . 'job/class-aips-slice-configuration.php',
+			AIPS_Autoloader::find_file('AIPS_Slice_Configuration')
+		);
+
+		AIPS_Autoloader::load('AIPS_Slice_Configuration');
+		$this->assertTrue(class_exists('AIPS_Slice_Configuration', false));
+
+		AIPS_Autoloader::load('AIPS_Missing_Class');
+		$this->assertFalse(class_exists('AIPS_Missing_Class', false));
+	}
+
+	/**
+	 * Test that probing still resolves classes when no classmap is loaded
+	 */
+	public function test_find_file_without_classmap() {
+		AIPS_Autoloader::set_classmap(array());
+
+		$this->assertEquals(
+			$this->includes_dir . 'class-aips-config.php',
+			AIPS_Autoloader::find_file('AIPS_Config')
+		);
+		$this->assertEquals(
+			$this->includes_dir . 'job/class-aips-job-definition.php',
+			AIPS_Autoloader::find_file('AIPS_Job_Definition')
+		);
+		$this->assertNull(AIPS_Autoloader::find_file('AIPS_Missing_Class'));
+	}
 }
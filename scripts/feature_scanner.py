@@ -8,13 +8,71 @@ This script analyzes the plugin's PHP files to generate comprehensive documentat
 - Missing functionality and improvement recommendations
 - Codebase standards compliance report (Container DI, Config, Cache, Ajax Registry,
   Ajax Response, Logger, Correlation ID, interface contracts)
+- Query-in-loop (N+1) detection for $wpdb, meta and repository calls
+- Index coverage of repository SQL against the AIPS_DB_Manager schema
+- Repository cache coverage (AIPS_Cacheable_Repository reads, writes and invalidations)
+- aips_* option catalog with autoload flags and hot (cron/loop) writes
+- WP-Cron load model: hooks by recurrence with the AI calls, DB writes and HTTP
+  requests their handlers reach through the method call graph
+- Hot paths from request entry points (AJAX actions, REST routes, page-load and
+  cron hooks) to AI, HTTP and $wpdb write sinks
+- Admin asset weight: per-screen script/style payload from admin_enqueue_scripts
+  callbacks, with globally loaded assets that only one screen needs
+- Bootstrap cost: hook registrations and object construction performed while
+  WordPress boots, per request type (front-end, admin, AJAX, cron)
+- Outbound HTTP: every remote request with its timeout, caching and the
+  loops that issue it sequentially
+- Cache keys: transient, object-cache, AIPS_Cache and repository-cache key
+  patterns with expiry and cardinality, sized at an assumed site scale
+- Admin AJAX traffic: actions the admin scripts post to admin-ajax.php, how
+  each is triggered (page load, user event, timer or Heartbeat), the PHP
+  handler and sinks behind it, and requests per minute per open tab
+- Per-method metrics (LOC, cyclomatic complexity, nesting depth, parameters),
+  written to docs/feature-metrics.json and cached between runs by file hash
+- Trend store: each run's per-class LOC, coupling, violations by rule and
+  runtime appended to a local SQLite file keyed by commit SHA; the ``trend``
+  subcommand prints deltas and sparklines across commits
+- Batch mode: the ``batch`` subcommand scans many plugin roots concurrently,
+  parsing each distinct file content once, and writes per-root reports plus
+  a cross-root comparison
+- Autoload classmap: the ``classmap`` subcommand writes the class → file map
+  AIPS_Autoloader reads instead of probing include directories, and
+  ``classmap --check`` reports stale or missing entries
+- Test impact: the ``tests`` subcommand indexes the PHPUnit files under
+  tests/ and, for a list of changed files, selects the tests that reference
+  an affected class through the reverse dependency graph, as a file list, a
+  ``--filter`` pattern or a ``<testsuite>`` block
+- Findings store: the ``findings`` subcommand turns standards violations into
+  stable-ID findings and syncs them into ``.aips-agent/`` — appending
+  ``finding_upsert``/``finding_resolved`` events to ``scan-log.ndjson`` and
+  rewriting only the ``findings/*.json`` records that opened, changed or resolved
+- Query server: the ``serve`` subcommand keeps one scan in memory, rescans
+  when source files change (re-parsing only files whose content changed) and
+  answers JSON-RPC 2.0 queries over stdio or a Unix socket
 """
 
+import argparse
+import bisect
+import contextlib
+import hashlib
+import inspect
+import json
+import os
 import re
+import socketserver
+import sqlite3
+import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List
-from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple, Union, get_args, get_origin, get_type_hints
+from collections import defaultdict, deque
+
+# SHA-1 of this script; persisted caches and the findings ruleset are keyed by
+# it so any analyzer change invalidates them without a manual version bump
+SCANNER_HASH = hashlib.sha1(Path(__file__).read_bytes()).hexdigest()
 
 
 class FeatureScanner:
@@ -43,14 +101,102 @@ class FeatureScanner:
     # Maximum characters shown for summary text in compact tables
     MAX_SUMMARY_LENGTH = 60
 
-    def __init__(self, plugin_dir: str):
+    # Comments and string literals, blanked out before structural analysis so
+    # braces, parentheses and call-like text inside them are ignored
+    PHP_NOISE_PATTERN = re.compile(
+        r"//[^\n]*|#[^\n]*|/\*.*?\*/|'(?:\\.|[^'\\])*'|\"(?:\\.|[^\"\\])*\"",
+        re.DOTALL,
+    )
+
+    METHOD_PATTERN = re.compile(r'\bfunction\s+(\w+)\s*\(')
+
+    VISIBILITY_PATTERN = re.compile(r'\b(public|protected|private)\s+(?:(?:static|final|abstract)\s+)*$')
+
+    LOOP_PATTERN = re.compile(r'\b(foreach|while|for)\s*\(|\bdo\s*\{')
+
+    # Calls that hit the database on every execution: (pattern, severity).
+    # Matches preceded by an identifier character, -> or :: are method calls
+    # or longer names and are skipped by the caller.
+    QUERY_CALL_PATTERNS = (
+        (re.compile(r'\$(?:this->)?wpdb->(get_results|get_var|get_row|get_col|query|insert|'
+                    r'update|delete|replace)\s*\('), 'warning'),
+        (re.compile(r'(get_posts|WP_Query)\s*\('), 'warning'),
+        (re.compile(r'((?:get|update|add|delete)_(?:post|user|term)_meta)\s*\('), 'info'),
+        (re.compile(r'\$(?:this->)?(\w*repo\w*->\w+)\s*\('), 'info'),
+    )
+
+    def __init__(self, plugin_dir: str, cache_file: Optional[str] = None,
+                 parsed_files: Optional[Dict[str, Optional[Dict]]] = None,
+                 parsed_scripts: Optional[Dict[str, Dict]] = None):
         self.plugin_dir = Path(plugin_dir)
         self.includes_dir = self.plugin_dir / "includes"
         self.features = {}
         self.interfaces = {}
+        self.traits = {}
+        self.bootstrap = None
         self.class_dependencies = defaultdict(set)
         self.method_calls = defaultdict(list)
         self.standards_violations = defaultdict(list)
+        self.index_catalog = {}
+        self.index_gaps = []
+        self.index_query_stats = {'analyzed': 0, 'dynamic': 0}
+        self.cache_coverage = {}
+        self.cache_findings = []
+        self.option_catalog = {}
+        self.option_findings = []
+        self.call_graph = {}
+        self.method_effects = {}
+        self._class_methods = {}
+        self._scheduled_hooks = None
+        self._hook_callbacks = None
+        self._container_bindings = None
+        self._member_calls = None
+        self.cron_load = []
+        self.cron_findings = []
+        self.entry_points = []
+        self.hot_path_findings = []
+        self.asset_catalog = {}
+        self.asset_screens = {}
+        self.asset_findings = []
+        self.boot_registrations = []
+        self.boot_constructed = {}
+        self.boot_uses = {}
+        self.ajax_controller_costs = []
+        self.bootstrap_findings = []
+        self.lazy_plan = []
+        self.http_calls = []
+        self.http_loops = []
+        self.http_findings = []
+        self.cache_keys = []
+        self.cache_key_findings = []
+        self.ajax_calls = []
+        self.ajax_screens = {}
+        self.ajax_findings = []
+        self.method_entry_counts = defaultdict(int)
+        self.cache_file = Path(cache_file) if cache_file else None
+        cache = self.load_metrics_cache()
+        self.metrics_cache = cache.get('files', {})
+        self.cached_hashes = {entry['hash']: entry['methods'] for entry in self.metrics_cache.values()}
+        self.previous_metrics = {}
+        # Content-only analysis of class files keyed by content hash, so identical
+        # files (vendored copies, forks) are parsed once; None marks non-class files
+        self.parsed_files = parsed_files if parsed_files is not None else {}
+        # AJAX call sites of admin scripts, likewise keyed by content hash and
+        # persisted with the metrics cache
+        self.parsed_scripts = parsed_scripts if parsed_scripts is not None else cache.get('scripts', {})
+        self.script_digests = set()
+
+    @staticmethod
+    def main_plugin_file(plugin_dir: Path) -> Optional[Path]:
+        """The top-level PHP file carrying the ``Plugin Name:`` header, as WordPress finds it.
+
+        WordPress reads only the first 8 KiB of each file for headers.
+        """
+        for path in sorted(plugin_dir.glob('*.php')):
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                if re.search(r'^[ \t/*#@]*Plugin Name:', f.read(8192), re.MULTILINE | re.IGNORECASE):
+                    return path
+        return None
 
     def scan_all_files(self) -> Dict:
         """Scan all PHP files recursively under includes/ and its subdirectories."""
@@ -66,8 +212,38 @@ class FeatureScanner:
         for iface_file in sorted(self.includes_dir.rglob("interface-aips-*.php")):
             self.analyze_interface_file(iface_file)
 
+        # The main plugin file registers cron events and their hook callbacks
+        bootstrap_file = self.main_plugin_file(self.plugin_dir)
+        if bootstrap_file:
+            content = bootstrap_file.read_text(encoding='utf-8')
+            masked = self.mask_php(content)
+            declared = re.search(r'^\s*(?:final\s+|abstract\s+)?class\s+(\w+)', masked, re.MULTILINE)
+            self.bootstrap = {
+                'file': f"../{bootstrap_file.name}",
+                'class': declared.group(1) if declared else bootstrap_file.name,
+                '_raw_content': content,
+                '_masked_content': masked,
+                '_method_scopes': self.find_methods(masked),
+            }
+
+        # Recursively scan trait files under includes/
+        for trait_file in sorted(self.includes_dir.rglob("trait-aips-*.php")):
+            self.analyze_trait_file(trait_file)
+
         # Run standards compliance checks after all files are scanned
         self.check_standards_compliance()
+        self.analyze_index_coverage()
+        self.analyze_cache_coverage()
+        self.analyze_options()
+        self.build_call_graph()
+        self.analyze_cron_load()
+        self.analyze_hot_paths()
+        self.analyze_admin_assets()
+        self.analyze_bootstrap_cost()
+        self.plan_lazy_services()
+        self.analyze_http_calls()
+        self.analyze_cache_keys()
+        self.analyze_admin_ajax()
 
         return self.features
 
@@ -95,7 +271,31 @@ class FeatureScanner:
             'file': str(rel_path),
             'methods': methods,
             'summary': summary,
-            'lines_of_code': len(content.split('\n'))
+            'lines_of_code': content.count('\n') + 1
+        }
+
+    def analyze_trait_file(self, file_path: Path):
+        """Analyze a trait file to extract trait information."""
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except Exception as e:
+            print(f"Error reading {file_path}: {e}")
+            return
+
+        trait_match = re.search(r'trait\s+(AIPS_[\w_]+)', content)
+        if not trait_match:
+            return
+
+        trait_name = trait_match.group(1)
+        rel_path = file_path.relative_to(self.includes_dir)
+
+        self.traits[trait_name] = {
+            'name': trait_name,
+            'file': str(rel_path),
+            'methods': re.findall(r'(?:public|protected)\s+(?:static\s+)?function\s+(\w+)\s*\(', content),
+            'summary': self.extract_class_summary(content),
+            'lines_of_code': content.count('\n') + 1
         }
 
     def analyze_file(self, file_path: Path):
@@ -107,10 +307,43 @@ class FeatureScanner:
             print(f"Error reading {file_path}: {e}")
             return
 
+        digest = self.content_digest(content)
+        if digest not in self.parsed_files:
+            self.parsed_files[digest] = self.parse_class_file(content, digest)
+        parsed = self.parsed_files[digest]
+        if parsed is None:
+            return
+
+        # Compute relative path for diagnostics subdirectory files
+        rel_path = file_path.relative_to(self.includes_dir)
+
+        # Store feature information
+        class_name = parsed['class']
+        self.features[class_name] = dict(parsed, file=str(rel_path), _raw_content=content)
+
+        cached = self.metrics_cache.get(str(rel_path))
+        if cached:
+            self.previous_metrics[class_name] = {name: tuple(values) for name, values in cached['methods'].items()}
+
+        # Track dependencies for flowchart generation
+        for dep in parsed['dependencies']:
+            self.class_dependencies[class_name].add(dep)
+
+    @staticmethod
+    def content_digest(content: str) -> str:
+        """SHA-1 of decoded file content, the key of the parse and metrics caches."""
+        return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+    def parse_class_file(self, content: str, digest: str) -> Optional[Dict]:
+        """Everything in a feature entry that depends only on file content.
+
+        Returns ``None`` for files that declare no ``AIPS_*`` class. The path
+        and raw content are added by the caller.
+        """
         # Extract class name
         class_match = re.search(r'class\s+(AIPS_[\w_]+)', content)
         if not class_match:
-            return
+            return None
 
         class_name = class_match.group(1)
 
@@ -126,17 +359,16 @@ class FeatureScanner:
         wp_api_usage = self.extract_wp_api_usage(content)
         infrastructure_usage = self.extract_infrastructure_usage(content)
         implements = self.extract_implements(content)
+        traits = re.findall(r'^\s*use\s+(AIPS_[\w_]+)\s*;', content, re.MULTILINE)
+        parent = re.search(r'class\s+AIPS_[\w_]+\s+extends\s+([\w_]+)', content)
+        masked = self.mask_php(content)
 
         # Extract docblock summary
         summary = self.extract_class_summary(content)
+        method_scopes = self.find_methods(masked)
 
-        # Compute relative path for diagnostics subdirectory files
-        rel_path = file_path.relative_to(self.includes_dir)
-
-        # Store feature information
-        self.features[class_name] = {
+        return {
             'name': feature_name,
-            'file': str(rel_path),
             'class': class_name,
             'summary': summary,
             'methods': methods,
@@ -147,14 +379,15 @@ class FeatureScanner:
             'wp_api_usage': wp_api_usage,
             'infrastructure_usage': infrastructure_usage,
             'implements': implements,
-            'lines_of_code': len(content.split('\n')),
-            '_raw_content': content,
+            'traits': traits,
+            'extends': parent.group(1) if parent else None,
+            'lines_of_code': content.count('\n') + 1,
+            'method_metrics': self.cached_method_metrics(masked, method_scopes, digest),
+            '_metrics_hash': digest,
+            '_masked_content': masked,
+            '_method_scopes': method_scopes,
         }
 
-        # Track dependencies for flowchart generation
-        for dep in dependencies:
-            self.class_dependencies[class_name].add(dep)
-
     def extract_feature_name(self, class_name: str) -> str:
         """Convert class name to human-readable feature name."""
         # Remove AIPS_ prefix and convert to title case
@@ -250,6 +483,7 @@ class FeatureScanner:
             'uses_container': 'AIPS_Container' in content,
             'uses_config': 'AIPS_Config' in content,
             'uses_cache': bool(re.search(r'AIPS_Cache(?:_Factory)?(?:::|->)', content)),
+            'uses_repository_cache': bool(re.search(r'\buse\s+AIPS_Cacheable_Repository\s*;', content)),
             'uses_ajax_response': 'AIPS_Ajax_Response' in content,
             'uses_logger': 'AIPS_Logger' in content,
             'uses_telemetry': 'AIPS_Telemetry' in content,
@@ -288,6 +522,7 @@ class FeatureScanner:
             self._check_container_usage(class_name, content, feature)
             self._check_raw_error_log(class_name, content)
             self._check_raw_wpdb_outside_repo(class_name, content, feature)
+            self._check_query_in_loop(class_name, content, feature)
 
     def _check_ajax_constructor_hooks(self, class_name: str, content: str):
         """Flag AJAX hooks registered inside __construct instead of AIPS_Ajax_Registry."""
@@ -303,15 +538,7 @@ class FeatureScanner:
             return
         # Get content from constructor opening brace onward, then extract the body
         ctor_start = ctor_match.end()
-        brace_depth = 1
-        pos = ctor_start
-        while pos < len(content) and brace_depth > 0:
-            if content[pos] == '{':
-                brace_depth += 1
-            elif content[pos] == '}':
-                brace_depth -= 1
-            pos += 1
-        ctor_body = content[ctor_start:pos]
+        ctor_body = content[ctor_start:self.find_block_end(content, ctor_start - 1)]
         ajax_in_ctor = re.findall(r"add_action\s*\(\s*['\"]wp_ajax_(?:nopriv_)?(\w+)['\"]", ctor_body)
         if ajax_in_ctor:
             self.standards_violations[class_name].append({
@@ -419,6 +646,3214 @@ class FeatureScanner:
                 ),
             })
 
+    # Violation severities as findings-store severities
+    FINDING_SEVERITY = {'critical': 'high', 'warning': 'medium', 'info': 'low'}
+
+    def violation_findings(self) -> List[Dict]:
+        """Standards violations as findings with IDs stable across unrelated edits.
+
+        The ID hashes the rule, file, symbol and an anchor: the rule name for
+        once-per-class checks, or the message with numbers and locations
+        stripped for located ones. Counts and line numbers can therefore move
+        without a finding being resolved and re-opened under a new ID.
+        """
+        findings = []
+        for class_name, violations in sorted(self.standards_violations.items()):
+            feature = self.features.get(class_name)
+            if feature is None:
+                continue
+            path = os.path.normpath(
+                str(Path(self.plugin_dir.name) / 'includes' / feature['file'])).replace(os.sep, '/')
+            starts = self.line_starts(feature['_raw_content'])
+            seen = defaultdict(int)
+            for violation in violations:
+                symbol = class_name
+                anchor = violation['rule']
+                evidence = [path]
+                if violation.get('line'):
+                    method = self.enclosing_method(feature, starts[violation['line'] - 1])
+                    if method:
+                        symbol = f"{class_name}::{method}"
+                    anchor = re.sub(r'\d+', 'N', re.sub(r'\s*at `[^`]+:\d+`', '', violation['message']))
+                    evidence = [f"{path}:{violation['line']}"]
+                key = (symbol, anchor)
+                seen[key] += 1
+                if seen[key] > 1:
+                    anchor = f"{anchor}#{seen[key]}"
+                findings.append({
+                    'id': hashlib.sha1(f"{violation['rule']}|{path}|{symbol}|{anchor}".encode('utf-8')).hexdigest(),
+                    'type': violation['rule'],
+                    'severity': self.FINDING_SEVERITY.get(violation['severity'], violation['severity']),
+                    'path': path,
+                    'symbol': symbol,
+                    'anchor': anchor,
+                    'summary': violation['message'],
+                    'evidence': evidence,
+                })
+        return findings
+
+    # ---------------------------------------------------------------
+    # Structural helpers
+    # ---------------------------------------------------------------
+
+    @classmethod
+    def mask_php(cls, content: str) -> str:
+        """Blank out comments and string literal contents, preserving offsets and newlines."""
+        def spaces(text):
+            if '\n' not in text:
+                return ' ' * len(text)
+            return '\n'.join(' ' * len(part) for part in text.split('\n'))
+
+        def blank(match):
+            text = match.group(0)
+            if text[0] in '\'"':
+                return text[0] + spaces(text[1:-1]) + text[-1]
+            return spaces(text)
+        return cls.PHP_NOISE_PATTERN.sub(blank, content)
+
+    @staticmethod
+    def find_block_end(content: str, open_pos: int, opener: str = '{', closer: str = '}') -> int:
+        """Return the offset just past the delimiter matching the one at ``open_pos``."""
+        depth = 0
+        for match in re.compile('[' + re.escape(opener + closer) + ']').finditer(content, open_pos):
+            if match.group(0) == opener:
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return match.end()
+        return len(content)
+
+    @staticmethod
+    def line_number(line_starts: List[int], offset: int) -> int:
+        """Convert a character offset to a 1-based line number."""
+        return bisect.bisect_right(line_starts, offset)
+
+    @staticmethod
+    def line_starts(content: str) -> List[int]:
+        """Offsets at which each line of ``content`` begins."""
+        return [0] + [m.end() for m in re.finditer('\n', content)]
+
+    def find_methods(self, masked: str) -> List[Tuple[str, str, int, int]]:
+        """Find named functions in masked PHP source.
+
+        Returns ``(name, visibility, body_start, body_end)`` tuples; bodiless
+        (abstract or interface) declarations are skipped.
+        """
+        methods = []
+        for match in self.METHOD_PATTERN.finditer(masked):
+            params_end = self.find_block_end(masked, match.end() - 1, '(', ')')
+            brace = masked.find('{', params_end)
+            semi = masked.find(';', params_end)
+            if brace == -1 or -1 < semi < brace:
+                continue
+            line_start = masked.rfind('\n', 0, match.start()) + 1
+            visibility = self.VISIBILITY_PATTERN.search(masked, line_start, match.start())
+            methods.append((match.group(1), visibility.group(1) if visibility else 'public', brace,
+                            self.find_block_end(masked, brace)))
+        return methods
+
+    def string_members(self, feature: Dict) -> Dict[str, str]:
+        """Class constants and properties initialised to a string literal, by name."""
+        if '_string_members' not in feature:
+            feature['_string_members'] = dict(re.findall(
+                r"(?:\bconst\s+|(?:private|protected|public)\s+(?:static\s+)?\$)(\w+)\s*=\s*'([^'\\]*)'\s*;",
+                feature['_raw_content'],
+            ))
+        return feature['_string_members']
+
+    def resolve_string(self, feature: Dict, expr: str) -> Optional[str]:
+        """Resolve a PHP expression to a string when it is a literal or a class constant/property."""
+        expr = expr.strip()
+        literal = re.fullmatch(r"'([^'\\]*)'|\"([^\"\\$]*)\"", expr)
+        if literal:
+            return literal.group(1) if literal.group(1) is not None else literal.group(2)
+        getter = re.fullmatch(r'\$this->(\w+)\(\s*\)', expr)
+        if getter and feature.get('class') in self.features:
+            declared = self.class_methods(feature['class']).get(getter.group(1))
+            if declared:
+                owner = self.features[declared[0]]
+                returned = re.search(r'\breturn\s+([^;]+);', owner['_raw_content'][declared[1]:declared[2]])
+                if returned and '$this->' not in returned.group(1):
+                    return self.resolve_string(feature, returned.group(1))
+            return None
+        member = re.fullmatch(r'(self|static|\$this|AIPS_\w+)(?:::\$?|->)(\w+)', expr)
+        if not member:
+            return None
+        owner = member.group(1)
+        if owner.startswith('AIPS_'):
+            feature = self.features.get(owner)
+            if not feature:
+                return None
+        return self.string_members(feature).get(member.group(2))
+
+    def call_args(self, feature: Dict, open_paren: int) -> List[str]:
+        """Split the arguments of the call whose ``(`` is at ``open_paren`` into raw PHP snippets."""
+        masked = feature['_masked_content']
+        content = feature['_raw_content']
+        close = self.find_block_end(masked, open_paren, '(', ')') - 1
+        args = []
+        depth = 0
+        start = open_paren + 1
+        for pos in range(open_paren + 1, close):
+            char = masked[pos]
+            if char in '([{':
+                depth += 1
+            elif char in ')]}':
+                depth -= 1
+            elif char == ',' and depth == 0:
+                args.append(content[start:pos].strip())
+                start = pos + 1
+        last = content[start:close].strip()
+        if last or args:
+            args.append(last)
+        return args
+
+    @staticmethod
+    def enclosing_method(feature: Dict, offset: int) -> Optional[str]:
+        """Name of the innermost named function whose body contains ``offset``."""
+        name = None
+        for method, _, start, end in feature['_method_scopes']:
+            if start <= offset < end:
+                name = method
+        return name
+
+    def find_loop_scopes(self, masked: str) -> List[Tuple[str, int, int, int]]:
+        """Find loop scopes in masked PHP source.
+
+        Returns ``(keyword, loop_offset, scope_start, scope_end)`` tuples where
+        the scope covers the code executed on every iteration: the body, plus
+        the condition for ``while`` and the condition/increment for ``for``.
+        """
+        scopes = []
+        for match in self.LOOP_PATTERN.finditer(masked):
+            keyword = match.group(1) or 'do'
+            if keyword == 'do':
+                body_start = match.end() - 1
+                scopes.append((keyword, match.start(), body_start,
+                               self.find_block_end(masked, body_start)))
+                continue
+
+            header_start = match.end() - 1
+            header_end = self.find_block_end(masked, header_start, '(', ')')
+            pos = header_end
+            while pos < len(masked) and masked[pos].isspace():
+                pos += 1
+            if pos < len(masked) and masked[pos] == '{':
+                body_end = self.find_block_end(masked, pos)
+            elif pos < len(masked) and masked[pos] == ':':
+                end_match = re.compile(r'\bend' + keyword + r'\b').search(masked, pos)
+                body_end = end_match.end() if end_match else len(masked)
+            else:
+                # Single-statement body (or the trailing condition of do/while)
+                semi = masked.find(';', pos)
+                body_end = len(masked) if semi == -1 else semi + 1
+
+            if keyword == 'foreach':
+                scope_start = header_end
+            elif keyword == 'for':
+                first_semi = masked.find(';', header_start, header_end)
+                scope_start = header_start if first_semi == -1 else first_semi
+            else:
+                scope_start = header_start
+            scopes.append((keyword, match.start(), scope_start, body_end))
+        return scopes
+
+    def _check_query_in_loop(self, class_name: str, content: str, feature: Dict):
+        """Flag database, meta and repository calls executed on every loop iteration.
+
+        Each call site is reported once, against the innermost enclosing loop.
+        """
+        masked = feature['_masked_content']
+        scopes = self.find_loop_scopes(masked)
+        feature['_loop_scopes'] = scopes
+        if not scopes:
+            return
+
+        # Spans sorted by start: the innermost loop holding an offset is the
+        # last span starting at or before it that has not ended yet
+        spans = sorted((scope[2], index, scope[3]) for index, scope in enumerate(scopes))
+        span_starts = [span[0] for span in spans]
+
+        def innermost(offset: int) -> int:
+            position = bisect.bisect_right(span_starts, offset) - 1
+            while position >= 0:
+                _, index, end = spans[position]
+                if offset < end:
+                    return index
+                position -= 1
+            return -1
+
+        starts = self.line_starts(content)
+        seen = set()
+        for pattern, severity in self.QUERY_CALL_PATTERNS:
+            for match in pattern.finditer(masked):
+                offset = match.start()
+                loop = innermost(offset)
+                if loop < 0 or offset in seen:
+                    continue
+                previous = masked[offset - 1] if offset else ' '
+                if previous in '>:' or previous.isalnum() or previous == '_':
+                    continue
+                seen.add(offset)
+                keyword, loop_offset = scopes[loop][:2]
+                call_line = self.line_number(starts, offset)
+                call = match.group(0).rstrip('( \t\r\n')
+                self.standards_violations[class_name].append({
+                    'rule': 'query_in_loop',
+                    'severity': severity,
+                    'file': feature['file'],
+                    'line': call_line,
+                    'message': (
+                        f"`{call}()` inside {keyword} loop (line "
+                        f"{self.line_number(starts, loop_offset)}) at `{feature['file']}:{call_line}` — "
+                        f"batch the query outside the loop"
+                    ),
+                })
+
+    # ---------------------------------------------------------------
+    # Method metrics
+    # ---------------------------------------------------------------
+
+    # Order of the values in each per-method metrics tuple
+    METRIC_FIELDS = ('loc', 'complexity', 'nesting', 'params')
+
+    # Values above which a method is reported as over threshold
+    METRIC_THRESHOLDS = {'loc': 80, 'complexity': 15, 'nesting': 4, 'params': 5}
+
+    # Braces plus the branch points counted by cyclomatic complexity
+    METRIC_TOKEN_PATTERN = re.compile(
+        r'[{}]|&&|\|\||\?\?|\?(?![>-])|\b(?:if|elseif|for|foreach|while|case|catch|and|or)\b'
+    )
+
+    METRICS_CACHE_VERSION = 1
+
+    def method_metrics(self, masked: str, body_start: int, body_end: int) -> Tuple[int, int, int, int]:
+        """``(loc, complexity, nesting, params)`` for the method whose body spans the offsets.
+
+        One scan over the body tokens yields both the branch count and the
+        brace depth; LOC runs from the ``function`` keyword to the closing brace.
+        """
+        depth = deepest = branches = 0
+        for token in self.METRIC_TOKEN_PATTERN.finditer(masked, body_start, body_end):
+            char = token.group(0)
+            if char == '{':
+                depth += 1
+                deepest = max(deepest, depth)
+            elif char == '}':
+                depth -= 1
+            else:
+                branches += 1
+        keyword = masked.rfind('function', 0, body_start)
+        paren = masked.find('(', keyword)
+        params = masked[paren:self.find_block_end(masked, paren, '(', ')')].count('$')
+        return masked.count('\n', keyword, body_end) + 1, branches + 1, max(deepest - 1, 0), params
+
+    def load_metrics_cache(self) -> Dict:
+        """Read the persisted metrics cache; a missing cache or one from another scanner revision starts empty."""
+        if not self.cache_file or not self.cache_file.exists():
+            return {}
+        try:
+            cache = json.loads(self.cache_file.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+        if cache.get('version') != self.METRICS_CACHE_VERSION or cache.get('scanner') != SCANNER_HASH:
+            return {}
+        return cache
+
+    def cached_method_metrics(self, masked: str, method_scopes: List[Tuple[str, str, int, int]],
+                              digest: str) -> Dict[str, Tuple[int, int, int, int]]:
+        """Per-method metrics for a file, reused from the cache when its content hash is known.
+
+        The cached values stored under a file's path are kept in
+        ``previous_metrics`` by ``analyze_file`` so the report can show how
+        each method moved since the last run.
+        """
+        cached = self.cached_hashes.get(digest)
+        if cached is not None:
+            return {name: tuple(values) for name, values in cached.items()}
+        metrics = {}
+        for name, _, start, end in method_scopes:
+            metrics.setdefault(name, self.method_metrics(masked, start, end))
+        return metrics
+
+    def save_metrics_cache(self):
+        """Persist per-file hashes and method metrics for the next run."""
+        if not self.cache_file:
+            return
+        files = {
+            feature['file']: {
+                'hash': feature['_metrics_hash'],
+                'methods': {name: list(values) for name, values in feature['method_metrics'].items()},
+            }
+            for feature in self.features.values()
+        }
+        scripts = {digest: self.parsed_scripts[digest] for digest in self.script_digests}
+        self.cache_file.write_text(
+            json.dumps({'version': self.METRICS_CACHE_VERSION, 'scanner': SCANNER_HASH, 'files': files,
+                        'scripts': scripts}, separators=(',', ':'), sort_keys=True),
+            encoding='utf-8',
+        )
+
+    def write_metrics_json(self, output_file: str):
+        """Write per-class and per-method metrics as compact JSON.
+
+        Method values are arrays ordered as ``fields``; ``entry_points`` counts
+        the request entry points that reach each method.
+        """
+        classes = {}
+        for class_name, feature in sorted(self.features.items()):
+            classes[class_name] = {
+                'file': feature['file'],
+                'loc': feature['lines_of_code'],
+                'methods': {
+                    name: list(values) + [self.method_entry_counts.get((class_name, name), 0)]
+                    for name, values in sorted(feature['method_metrics'].items())
+                },
+            }
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump({'fields': list(self.METRIC_FIELDS) + ['entry_points'], 'classes': classes},
+                      f, separators=(',', ':'), sort_keys=True)
+            f.write('\n')
+        print(f"✓ Metrics written to: {output_file}")
+
+    def ranked_methods(self) -> List[Tuple[str, str, Tuple[int, int, int, int]]]:
+        """Every ``(class, method, metrics)``, most complex first (ties broken by size)."""
+        rows = [
+            (class_name, name, values)
+            for class_name, feature in self.features.items()
+            for name, values in feature['method_metrics'].items()
+        ]
+        rows.sort(key=lambda row: (-row[2][1], -row[2][0], row[0], row[1]))
+        return rows
+
+    # ---------------------------------------------------------------
+    # Index coverage
+    # ---------------------------------------------------------------
+
+    # Tables whose query volume makes a missing index most expensive; listed
+    # first in the report
+    INDEX_FOCUS_TABLES = ('aips_history', 'aips_schedule')
+
+    SQL_TABLE_REF_PATTERN = re.compile(
+        r'\b(FROM|JOIN|UPDATE)\s+'
+        r'(?:\{\$(?:this->)?wpdb->prefix\}(aips_\w+)|\{?\$((?:this->)?\w+)\}?)'
+        r'(?:\s+(?:AS\s+)?([a-z]\w*))?'
+    )
+
+    # Column predicates: (alias, column, operator)
+    SQL_PREDICATE_PATTERN = re.compile(
+        r'(?<![\w.%])(?:([a-z]\w*)\.)?([a-z_]\w*)\s*'
+        r'(<=|>=|<>|!=|=|<|>|IN\s*\(|NOT\s+IN\b|IS\s+NOT\s+NULL|IS\s+NULL|LIKE\b|BETWEEN\b)'
+    )
+
+    def parse_schema_indexes(self) -> Dict[str, Dict]:
+        """Build the index catalog from the CREATE TABLE statements in AIPS_DB_Manager.
+
+        Returns ``{table: {'columns': set, 'indexes': {name: [columns]}}}``;
+        ``PRIMARY KEY`` is recorded under the name ``PRIMARY``.
+        """
+        manager = self.features.get('AIPS_DB_Manager')
+        if not manager:
+            return {}
+        content = manager['_raw_content']
+        table_vars = dict(re.findall(r"\$(\w+)\s*=\s*\$tables\['(aips_\w+)'\]", content))
+
+        catalog = {}
+        for match in re.finditer(r'CREATE TABLE \$(\w+) \((.*?)\) \$charset_collate', content, re.DOTALL):
+            table = table_vars.get(match.group(1))
+            if not table:
+                continue
+            columns = set()
+            indexes = {}
+            for line in match.group(2).split('\n'):
+                line = line.strip().rstrip(',')
+                key = re.match(r'(PRIMARY KEY|(?:UNIQUE\s+)?(?:KEY|INDEX)\s+(\w+))\s*\((.*)\)$', line)
+                if key:
+                    name = key.group(2) or 'PRIMARY'
+                    indexes[name] = [re.sub(r'\(\d+\)', '', col).strip() for col in key.group(3).split(',')]
+                    continue
+                column = re.match(r'([a-z_]\w*)\s+[a-z]', line)
+                if column:
+                    columns.add(column.group(1))
+            catalog[table] = {'columns': columns, 'indexes': indexes}
+        return catalog
+
+    def extract_sql_queries(self, feature: Dict) -> List[Dict]:
+        """Extract per-table filter and sort columns from the SQL literals of a class.
+
+        Table expressions are resolved through ``$wpdb->prefix . 'aips_*'``
+        assignments; a local variable resolves to its nearest preceding
+        assignment. Literals whose WHERE or ORDER BY is interpolated from a
+        variable are returned with ``dynamic`` set and no columns.
+        """
+        content = feature['_raw_content']
+        assignments = [
+            (m.start(), m.group(1), m.group(2))
+            for m in re.finditer(
+                r"\$((?:this->)?\w+)\s*=\s*\$(?:this->)?wpdb->prefix\s*\.\s*['\"](aips_\w+)['\"]",
+                content,
+            )
+        ]
+
+        def resolve(variable: str, offset: int) -> Optional[str]:
+            table = None
+            for position, name, target in assignments:
+                if name != variable:
+                    continue
+                if variable.startswith('this->') or position < offset:
+                    table = target
+            return table
+
+        starts = self.line_starts(content)
+        queries = []
+        for literal in self.PHP_NOISE_PATTERN.finditer(content):
+            sql = literal.group(0)
+            if sql[0] not in '\'"' or not re.search(r'\b(SELECT|UPDATE|DELETE)\b', sql):
+                continue
+
+            aliases = {}
+            primary = None
+            for ref in self.SQL_TABLE_REF_PATTERN.finditer(sql):
+                table = ref.group(2) or resolve(ref.group(3), literal.start())
+                if not table:
+                    continue
+                primary = primary or table
+                if ref.group(4):
+                    aliases[ref.group(4)] = table
+            if not primary:
+                continue
+
+            query = {
+                'table': primary,
+                'line': self.line_number(starts, literal.start()),
+                'filters': defaultdict(dict),
+                'order': [],
+                'dynamic': False,
+            }
+            queries.append(query)
+
+            where = re.search(r'\bWHERE\b(.*?)(?=\bGROUP BY\b|\bORDER BY\b|\bLIMIT\b|\bHAVING\b|$)', sql, re.DOTALL)
+            order = re.search(r'\bORDER BY\b(.*?)(?=\bLIMIT\b|\bOFFSET\b|$)', sql, re.DOTALL)
+            if (where and '{$' in where.group(1)) or (order and '{$' in order.group(1)) \
+                    or re.search(r'\{\$\w*(?:where|order)\w*\}', sql):
+                query['dynamic'] = True
+                continue
+
+            if where:
+                for alias, column, operator in self.SQL_PREDICATE_PATTERN.findall(where.group(1)):
+                    table = aliases.get(alias) if alias else primary
+                    if not table:
+                        continue
+                    operator = ' '.join(operator.rstrip('(').split())
+                    if operator in ('=', 'IN', 'IS NULL'):
+                        kind = 'eq'
+                    elif operator in ('<', '>', '<=', '>=', 'BETWEEN', 'LIKE'):
+                        kind = 'range'
+                    else:
+                        continue
+                    # Equality wins when a column is constrained both ways
+                    if query['filters'][table].get(column) != 'eq':
+                        query['filters'][table][column] = kind
+
+            if order:
+                for part in order.group(1).split(','):
+                    term = re.match(r'\s*(?:([a-z]\w*)\.)?([a-z_]\w*)(?:\s+(?:ASC|DESC))?\s*$', part)
+                    if not term:
+                        query['order'] = []
+                        break
+                    query['order'].append((aliases.get(term.group(1), primary) if term.group(1) else primary,
+                                           term.group(2)))
+        return queries
+
+    @staticmethod
+    def index_supports(index: List[str], filters: Dict[str, str], order: List[str]) -> Tuple[bool, bool]:
+        """Check whether an index serves a query's filter and sort (leftmost-prefix rule).
+
+        Returns ``(filters_served, order_served)``. The filter is served when
+        the index leads with a filtered column. The sort is served when the
+        ORDER BY columns follow a prefix of equality-filtered index columns.
+        """
+        filters_served = bool(filters) and index[0] in filters
+        position = 0
+        while position < len(index) and filters.get(index[position]) == 'eq' \
+                and index[position] not in order:
+            position += 1
+        order_served = bool(order) and index[position:position + len(order)] == order
+        return filters_served, order_served
+
+    def analyze_index_coverage(self):
+        """Report SQL whose filter or sort columns no index in the catalog supports."""
+        self.index_catalog = self.parse_schema_indexes()
+        self.index_gaps = []
+        self.index_query_stats = {'analyzed': 0, 'dynamic': 0}
+
+        for class_name, feature in sorted(self.features.items()):
+            if '$wpdb' not in feature['_raw_content']:
+                continue
+            for query in self.extract_sql_queries(feature):
+                if query['table'] not in self.index_catalog:
+                    continue
+                if query['dynamic']:
+                    self.index_query_stats['dynamic'] += 1
+                    continue
+                self.index_query_stats['analyzed'] += 1
+
+                order_tables = {table for table, _ in query['order']}
+                for table in sorted(set(query['filters']) | {query['table']}):
+                    schema = self.index_catalog.get(table)
+                    if not schema:
+                        continue
+                    filters = {c: k for c, k in query['filters'].get(table, {}).items()
+                               if c in schema['columns']}
+                    # A sort spanning several tables can never come from one index
+                    order = [c for t, c in query['order'] if t == table and c in schema['columns']]
+                    if order_tables != {table} or len(order) != len(query['order']):
+                        order = []
+                    if not filters and not order:
+                        continue
+
+                    served = [self.index_supports(cols, filters, order)
+                              for cols in schema['indexes'].values()]
+                    location = f"{feature['file']}:{query['line']}"
+                    if filters and not any(f for f, _ in served):
+                        self.index_gaps.append({
+                            'table': table, 'class': class_name, 'location': location,
+                            'kind': 'filter', 'severity': 'warning',
+                            'columns': sorted(filters),
+                        })
+                    elif order and not any(o for _, o in served):
+                        self.index_gaps.append({
+                            'table': table, 'class': class_name, 'location': location,
+                            'kind': 'sort', 'severity': 'info',
+                            'columns': order,
+                            'filters': sorted(filters),
+                        })
+
+    # ---------------------------------------------------------------
+    # Repository cache coverage
+    # ---------------------------------------------------------------
+
+    # Call sites across the codebase at which an uncached repository read
+    # counts as a hot path
+    HOT_READ_MIN_CALL_SITES = 3
+
+    @staticmethod
+    def normalize_cache_tag(tag: str) -> str:
+        """Collapse per-entity tags (``schedule:{schedule_id}``, ``'schedule:' . $id``) to ``schedule:*``."""
+        if '{' in tag:
+            return tag[:tag.index('{')] + '*'
+        if tag.endswith(':'):
+            return tag + '*'
+        return tag
+
+    def literal_cache_tags(self, body: str, helpers: Dict[str, str]) -> Set[str]:
+        """Collect tag literals from a PHP snippet, expanding ``self::helper()`` calls once."""
+        tags = {
+            self.normalize_cache_tag(tag)
+            for tag in re.findall(r"(?<!\[)'([a-z_][\w:{}]*)'", body)
+        }
+        for helper in re.findall(r'self::(\w+)\s*\(', body):
+            if helper in helpers:
+                tags.update(self.literal_cache_tags(helpers.pop(helper), helpers))
+        return tags
+
+    def parse_cache_dependency_map(self, function_name: str) -> Dict[str, Set[str]]:
+        """Map each ``case`` label of an AIPS_Repository_Cache_Dependencies switch to its tags."""
+        feature = self.features.get('AIPS_Repository_Cache_Dependencies')
+        if not feature:
+            return {}
+        content = feature['_raw_content']
+        bodies = {name: content[start:end] for name, _, start, end in feature['_method_scopes']}
+        if function_name not in bodies:
+            return {}
+
+        tag_map = {}
+        group_pattern = re.compile(r"((?:\s*case\s+'[^']+'\s*:)+)(.*?)(?=\bcase\s+'|\bdefault\s*:|\Z)", re.DOTALL)
+        for group in group_pattern.finditer(bodies[function_name]):
+            helpers = {n: b for n, b in bodies.items() if n != function_name}
+            tags = self.literal_cache_tags(group.group(2), helpers)
+            for label in re.findall(r"case\s+'([^']+)'", group.group(1)):
+                tag_map[label] = tags
+        return tag_map
+
+    def find_repository_callers(self, repository: str, method: str) -> Tuple[int, int]:
+        """Count call sites of a repository method in other classes: ``(total, inside_loops)``."""
+        if self._member_calls is None:
+            self._member_calls = defaultdict(list)
+            pattern = re.compile(r'\$(?:this->)?(\w+)->(\w+)\s*\(')
+            for class_name, feature in self.features.items():
+                for match in pattern.finditer(feature['_masked_content']):
+                    self._member_calls[match.group(2)].append((class_name, match.group(1), match.start()))
+
+        snake = repository.replace('AIPS_', '').lower()
+        receivers = {snake, snake.replace('_repository', '_repo')}
+        total = in_loops = 0
+        for class_name, receiver, offset in self._member_calls.get(method, ()):
+            if class_name == repository:
+                continue
+            feature = self.features[class_name]
+            if receiver not in receivers and not (
+                    receiver in ('repository', 'repo') and repository in feature['_raw_content']):
+                continue
+            total += 1
+            if any(start <= offset < end for _, _, start, end in feature.get('_loop_scopes', ())):
+                in_loops += 1
+        return total, in_loops
+
+    def analyze_cache_coverage(self):
+        """Map cached reads, uncached reads and invalidating writes per cacheable repository."""
+        read_tags = self.parse_cache_dependency_map('tags_for_read')
+        domain_tags = self.parse_cache_dependency_map('tags_for_invalidation')
+        self.cache_coverage = {}
+        self.cache_findings = []
+
+        invalidated = set()
+        for class_name, feature in sorted(self.features.items()):
+            if 'AIPS_Cacheable_Repository' not in feature.get('traits', []):
+                continue
+            content = feature['_raw_content']
+            masked = feature['_masked_content']
+            bodies = {name: (visibility, content[start:end], masked[start:end])
+                      for name, visibility, start, end in feature['_method_scopes']}
+
+            policies = {}
+            if 'repository_cache_policies' in bodies:
+                policy_body = bodies['repository_cache_policies'][1]
+                for op in re.finditer(r"'([\w.]+)'\s*=>\s*array\s*\(", policy_body):
+                    end = self.find_block_end(policy_body, op.end() - 1, '(', ')')
+                    entry = policy_body[op.end():end]
+                    tags = re.search(r"'tags'\s*=>\s*array\s*\(([^)]*)\)", entry)
+                    tier = re.search(r"'tier'\s*=>\s*'(\w+)'", entry)
+                    policies[op.group(1)] = {
+                        'tier': tier.group(1) if tier else 'none',
+                        'tags': {
+                            self.normalize_cache_tag(t) for t in re.findall(r"'([^']+)'", tags.group(1))
+                        } if tags else set(),
+                    }
+
+            invalidating = {}
+            for name, (_, body, _) in bodies.items():
+                tags = set()
+                for domain in re.findall(r"invalidate_cache_domain\s*\(\s*'(\w+)'", body):
+                    tags.update(domain_tags.get(domain, {domain}))
+                for tag_list in re.findall(r"invalidate_cache_tags\s*\(\s*array\s*\(([^)]*)\)", body):
+                    tags.update(self.normalize_cache_tag(t) for t in re.findall(r"'([^']+)'", tag_list))
+                if tags:
+                    invalidating[name] = tags
+                    invalidated.update(tags)
+
+            coverage = {'file': feature['file'], 'cached': [], 'uncached': [], 'writes': []}
+            for name, (visibility, body, masked_body) in bodies.items():
+                if visibility != 'public' or name.startswith('__'):
+                    continue
+                cached = re.search(r"->cache_read\s*\(\s*'([\w.]+)'", body)
+                if cached:
+                    op = cached.group(1)
+                    policy = policies.get(op, {'tier': None, 'tags': set()})
+                    coverage['cached'].append({'method': name, 'operation': op, 'tier': policy['tier'],
+                                               'tags': read_tags.get(op, set()) | policy['tags']})
+                    continue
+                writes = re.search(r'wpdb->(insert|update|delete|replace)\s*\(', masked_body) or \
+                    re.search(r'\b(INSERT|UPDATE|DELETE)\b', body) and 'wpdb->query' in masked_body
+                if writes:
+                    tags = set(invalidating.get(name, ()))
+                    for helper in re.findall(r'\$this->(\w+)\s*\(', masked_body):
+                        tags.update(invalidating.get(helper, ()))
+                    coverage['writes'].append({'method': name, 'tags': tags})
+                elif re.search(r'wpdb->(get_results|get_row|get_var|get_col)\s*\(', masked_body) \
+                        and 'cache_bypass_read' not in masked_body:
+                    coverage['uncached'].append({'method': name})
+            self.cache_coverage[class_name] = coverage
+
+        for class_name, coverage in self.cache_coverage.items():
+            location = f"`{class_name}` (`{coverage['file']}`)"
+            for read in coverage['cached']:
+                if read['tier'] is None:
+                    self.cache_findings.append({
+                        'rule': 'missing_policy', 'severity': 'info', 'class': class_name,
+                        'message': (f"`{read['method']}()` reads through `{read['operation']}` "
+                                    f"which has no cache policy — every call bypasses the cache"),
+                    })
+                elif read['tier'] != 'none' and not read['tags'] & invalidated:
+                    tags = ', '.join(sorted(read['tags'])) or 'none'
+                    self.cache_findings.append({
+                        'rule': 'stale_risk', 'severity': 'warning', 'class': class_name,
+                        'message': (f"`{read['method']}()` caches `{read['operation']}` but none of its "
+                                    f"tags ({tags}) are ever invalidated — entries live until TTL"),
+                    })
+            for write in coverage['writes']:
+                if not write['tags']:
+                    self.cache_findings.append({
+                        'rule': 'stale_risk', 'severity': 'warning', 'class': class_name,
+                        'message': (f"`{write['method']}()` writes without invalidating a cache domain "
+                                    f"— cached reads in {location} can serve stale rows"),
+                    })
+            for read in coverage['uncached']:
+                total, in_loops = self.find_repository_callers(class_name, read['method'])
+                read['call_sites'] = total
+                if total >= self.HOT_READ_MIN_CALL_SITES or in_loops:
+                    detail = f"{total} call site(s)" + (f", {in_loops} inside loops" if in_loops else "")
+                    self.cache_findings.append({
+                        'rule': 'hot_uncached_read', 'severity': 'info', 'class': class_name,
+                        'message': f"`{read['method']}()` queries `$wpdb` directly on a hot path ({detail})",
+                    })
+
+    # ---------------------------------------------------------------
+    # Hook wiring
+    # ---------------------------------------------------------------
+
+    def hook_sources(self) -> List[Tuple[str, Dict]]:
+        """Scanned classes plus the main plugin file, as ``(owner, feature)`` pairs."""
+        sources = list(self.features.items())
+        if self.bootstrap:
+            sources.append((self.bootstrap['class'], self.bootstrap))
+        return sources
+
+    def find_scheduled_hooks(self) -> Dict[str, List[Dict]]:
+        """Hooks scheduled as WP-Cron events, by hook name.
+
+        Covers wp_schedule_event()/wp_schedule_single_event() calls with a
+        resolvable hook plus the ``get_cron_events()`` registry of the main
+        plugin file. Each entry records the scheduling owner, file, line and
+        the recurrence (``single`` for one-off events, ``None`` when computed
+        at runtime).
+        """
+        if self._scheduled_hooks is not None:
+            return self._scheduled_hooks
+        scheduled = defaultdict(list)
+        pattern = re.compile(r'\bwp_schedule_(single_)?event\s*\(')
+        for owner, feature in self.hook_sources():
+            starts = None
+            for match in pattern.finditer(feature['_masked_content']):
+                if feature['_masked_content'][match.start() - 1] in '>:$':
+                    continue
+                args = self.call_args(feature, match.end() - 1)
+                single = bool(match.group(1))
+                hook_index = 1 if single else 2
+                if len(args) <= hook_index:
+                    continue
+                hook = self.resolve_string(feature, args[hook_index])
+                if not hook:
+                    continue
+                starts = starts or self.line_starts(feature['_raw_content'])
+                scheduled[hook].append({
+                    'class': owner,
+                    'file': feature['file'],
+                    'line': self.line_number(starts, match.start()),
+                    'recurrence': 'single' if single else self.resolve_string(feature, args[1]),
+                })
+
+        if self.bootstrap:
+            content = self.bootstrap['_raw_content']
+            registry = re.search(r'function\s+get_cron_events\s*\(', content)
+            if registry:
+                starts = self.line_starts(content)
+                body_start = content.find('{', registry.end())
+                body = content[body_start:self.find_block_end(self.bootstrap['_masked_content'], body_start)]
+                for event in re.finditer(r"'(\w+)'\s*=>\s*array\s*\(\s*'schedule'\s*=>\s*'(\w+)'", body):
+                    scheduled[event.group(1)].append({
+                        'class': self.bootstrap['class'],
+                        'file': self.bootstrap['file'],
+                        'line': self.line_number(starts, body_start + event.start()),
+                        'recurrence': event.group(2),
+                    })
+        self._scheduled_hooks = scheduled
+        return scheduled
+
+    def closure_calls(self, body: str) -> List[Tuple[str, str]]:
+        """``(class, method)`` calls made on AIPS_ singletons, fresh instances or container lookups."""
+        calls = re.findall(r'(AIPS_\w+)::(?:get_)?instance\s*\(\s*\)\s*->\s*(\w+)\s*\(', body)
+        calls += re.findall(r'\(\s*new\s+(AIPS_\w+)\s*\([^()]*\)\s*\)\s*->\s*(\w+)\s*\(', body)
+        variables = dict(
+            (var, self.resolve_implementation(created or singleton or made))
+            for var, created, singleton, made in re.findall(
+                r'\$(\w+)\s*=\s*(?:new\s+(AIPS_\w+)\s*\(|(AIPS_\w+)::(?:get_)?instance\s*\(|'
+                r'\$\w+->make\s*\(\s*(AIPS_\w+)::class)', body)
+        )
+        for var, method in re.findall(r'\$(\w+)\s*->\s*(\w+)\s*\(', body):
+            if var in variables:
+                calls.append((variables[var], method))
+        return calls
+
+    def find_hook_callbacks(self) -> Dict[str, List[Tuple[str, str]]]:
+        """``(class, method)`` callbacks registered with add_action()/add_filter(), by hook name.
+
+        Closure callbacks resolve to the AIPS_ methods they call directly.
+        """
+        if self._hook_callbacks is not None:
+            return self._hook_callbacks
+        callbacks = defaultdict(list)
+        pattern = re.compile(r'\badd_(?:action|filter)\s*\(')
+        for owner_class, feature in self.hook_sources():
+            for match in pattern.finditer(feature['_masked_content']):
+                if feature['_masked_content'][match.start() - 1] in '>:$':
+                    continue
+                args = self.call_args(feature, match.end() - 1)
+                if len(args) < 2:
+                    continue
+                hook = self.resolve_string(feature, args[0])
+                if not hook:
+                    continue
+                if re.match(r'(?:static\s+)?function\b', args[1]):
+                    callbacks[hook].extend(self.closure_calls(args[1]))
+                    continue
+                target = re.fullmatch(
+                    r"(?:array\s*\(|\[)\s*(\$this|__CLASS__|self::class|static::class|'(AIPS_\w+)'|(AIPS_\w+)::class)"
+                    r"\s*,\s*'(\w+)'\s*(?:\)|\])",
+                    args[1],
+                )
+                if target:
+                    callbacks[hook].append((target.group(2) or target.group(3) or owner_class, target.group(4)))
+
+            # Declarative ``'hook' => ..., 'method' => ...`` binding maps registered on $this
+            for binding in re.finditer(r"'hook'\s*=>\s*'(\w+)'\s*,\s*'method'\s*=>\s*'(\w+)'",
+                                       feature['_raw_content']):
+                if feature['_masked_content'][binding.start()] == "'":
+                    callbacks[binding.group(1)].append((owner_class, binding.group(2)))
+        self._hook_callbacks = callbacks
+        return callbacks
+
+    def reachable_methods(self, class_name: str, roots: List[str]) -> Set[str]:
+        """Methods of ``class_name`` reachable from ``roots`` through ``$this->method()`` calls."""
+        feature = self.features.get(class_name)
+        if not feature:
+            return set()
+        masked = feature['_masked_content']
+        bodies = {name: masked[start:end] for name, _, start, end in feature['_method_scopes']}
+        reached = set()
+        pending = [root for root in roots if root in bodies]
+        while pending:
+            name = pending.pop()
+            if name in reached:
+                continue
+            reached.add(name)
+            pending.extend(
+                callee for callee in re.findall(r'\$this->(\w+)\s*\(', bodies[name])
+                if callee in bodies and callee not in reached
+            )
+        return reached
+
+    # ---------------------------------------------------------------
+    # Option autoload catalog
+    # ---------------------------------------------------------------
+
+    OPTION_CALL_PATTERN = re.compile(r'\b(add_option|update_option|get_option|set_option|delete_option)\s*\(')
+
+    # Positional index of the autoload argument, by write function
+    OPTION_AUTOLOAD_ARG = {'add_option': 3, 'update_option': 2, 'set_option': 2}
+
+    @staticmethod
+    def autoload_flag(args: List[str], index: int) -> str:
+        """Classify the autoload argument of an option write."""
+        if len(args) <= index:
+            return 'default'
+        value = args[index].strip().lower().strip('\'"')
+        if value in ('false', 'no', 'off', '0'):
+            return 'no'
+        if value in ('true', 'yes', 'on', '1'):
+            return 'yes'
+        if value == 'null':
+            return 'default'
+        return 'dynamic'
+
+    def analyze_options(self):
+        """Catalog every aips_* option with its autoload flags, writers, readers and hot writes."""
+        catalog = defaultdict(lambda: {
+            'autoload': set(), 'writers': set(), 'readers': set(),
+            'loop_writes': [], 'cron_writes': [], 'array': False, 'settings_api': False,
+        })
+
+        config = self.features.get('AIPS_Config')
+        if config:
+            defaults = re.search(r'function\s+get_default_options\s*\(', config['_raw_content'])
+            if defaults:
+                body = config['_raw_content'][defaults.end():]
+                body = body[:self.find_block_end(body, body.find('{'))]
+                for key, value in re.findall(r"'(aips_\w+)'\s*=>\s*(\w+)", body):
+                    catalog[key]['array'] = value == 'array'
+
+        settings = self.features.get('AIPS_Settings')
+        if settings:
+            for key in re.findall(r"'(aips_\w+)'\s*=>\s*array\s*\(\s*'sanitize_callback'", settings['_raw_content']):
+                catalog[key]['settings_api'] = True
+                catalog[key]['writers'].add('Settings API')
+                catalog[key]['autoload'].add('default')
+
+        cron_methods = set()
+        callbacks = self.find_hook_callbacks()
+        for hook in self.find_scheduled_hooks():
+            for owner, method in callbacks.get(hook, ()):
+                cron_methods.update((owner, m) for m in self.reachable_methods(owner, [method]))
+
+        for class_name, feature in sorted(self.features.items()):
+            starts = None
+            for match in self.OPTION_CALL_PATTERN.finditer(feature['_masked_content']):
+                function = match.group(1)
+                receiver = feature['_masked_content'][max(0, match.start() - 2):match.start()]
+                receiver = receiver if receiver in ('->', '::') else None
+                if receiver == '::' or (receiver == '->' and function not in ('get_option', 'set_option')):
+                    continue
+                if receiver is None and function == 'set_option':
+                    continue
+                args = self.call_args(feature, match.end() - 1)
+                key = self.resolve_string(feature, args[0]) if args else None
+                if not key or not key.startswith('aips_'):
+                    continue
+
+                entry = catalog[key]
+                if function == 'get_option':
+                    entry['readers'].add(class_name)
+                    continue
+                entry['writers'].add(class_name)
+                if function == 'delete_option':
+                    continue
+                entry['autoload'].add(self.autoload_flag(args, self.OPTION_AUTOLOAD_ARG[function]))
+                if len(args) > 1 and re.match(r'array\s*\(|\[', args[1]):
+                    entry['array'] = True
+
+                starts = starts or self.line_starts(feature['_raw_content'])
+                location = f"{feature['file']}:{self.line_number(starts, match.start())}"
+                if any(start <= match.start() < end for _, _, start, end in feature.get('_loop_scopes', ())):
+                    entry['loop_writes'].append(location)
+                if (class_name, self.enclosing_method(feature, match.start())) in cron_methods:
+                    entry['cron_writes'].append(location)
+
+        self.option_catalog = dict(sorted(catalog.items()))
+        self.option_findings = []
+        for key, entry in self.option_catalog.items():
+            autoloaded = not entry['autoload'] or entry['autoload'] - {'no'}
+            if not autoloaded:
+                continue
+            hot = []
+            if entry['cron_writes']:
+                hot.append(f"written from cron ({len(entry['cron_writes'])} site(s))")
+            if entry['loop_writes']:
+                hot.append(f"written inside loops ({len(entry['loop_writes'])} site(s))")
+            if hot and entry['array']:
+                self.option_findings.append({
+                    'key': key, 'severity': 'warning', 'action': 'Move to a table',
+                    'reason': f"Autoloaded array {' and '.join(hot)} — every write rewrites "
+                              f"the cached autoload set",
+                })
+            elif hot:
+                self.option_findings.append({
+                    'key': key, 'severity': 'warning', 'action': 'Set autoload to false',
+                    'reason': f"Autoloaded and {' and '.join(hot)} — every write invalidates "
+                              f"the cached autoload set",
+                })
+            elif entry['writers'] and not entry['readers'] and not entry['settings_api']:
+                self.option_findings.append({
+                    'key': key, 'severity': 'info', 'action': 'Set autoload to false',
+                    'reason': "Autoloaded but never read through get_option() — it only adds "
+                              "weight to every request",
+                })
+            elif entry['array'] and not entry['settings_api']:
+                self.option_findings.append({
+                    'key': key, 'severity': 'info', 'action': 'Set autoload to false',
+                    'reason': "Array value loaded on every request; read it on demand instead",
+                })
+
+    # ---------------------------------------------------------------
+    # Method call graph
+    # ---------------------------------------------------------------
+
+    # Direct side effects detected in a method body (masked source)
+    EFFECT_PATTERNS = (
+        ('db_write', re.compile(r'wpdb->(?:insert|update|delete|replace|query)\s*\(')),
+        ('http', re.compile(r'\b(?:wp_(?:safe_)?remote_(?:get|post|head|request)|download_url)\s*\(')),
+    )
+
+    # Methods that send a request to the configured AI provider
+    AI_SINK_METHODS = frozenset([
+        'generate_text', 'generate_json', 'generate_json_from_text', 'generate_image',
+        'generate_embedding',
+    ])
+
+    def property_types(self, feature: Dict) -> Dict[str, str]:
+        """Map ``$this->property`` names to AIPS_ classes.
+
+        Sources, weakest first: ``@var`` docblocks, constructor parameter type
+        hints assigned to the property, and ``new``/``::instance()``/``AIPS_Container``
+        ``make()`` assignments.
+        """
+        if '_property_types' in feature:
+            return feature['_property_types']
+        content = feature['_raw_content']
+        masked = feature['_masked_content']
+        types = {}
+        for doc, prop in re.findall(
+                r'/\*\*((?:(?!\*/).)*?)\*/\s*(?:private|protected|public)\s+(?:static\s+)?(?:\??\w+\s+)?\$(\w+)',
+                content, re.DOTALL):
+            var = re.search(r'@var\s+\??(AIPS_\w+)', doc)
+            if var:
+                types[prop] = var.group(1)
+        for hint, prop in re.findall(r'(?:private|protected|public)\s+\??(AIPS_\w+)\s+\$(\w+)', masked):
+            types[prop] = hint
+
+        params = {}
+        ctor = re.search(r'function\s+__construct\s*\(', masked)
+        if ctor:
+            close = self.find_block_end(masked, ctor.end() - 1, '(', ')')
+            params = dict((name, hint) for hint, name in re.findall(r'\??(AIPS_\w+)\s+\$(\w+)', masked[ctor.end():close]))
+        for prop, rhs in re.findall(r'\$this->(\w+)\s*=\s*([^;]+);', masked):
+            created = re.search(r'\bnew\s+(AIPS_\w+)|(AIPS_\w+)::(?:get_)?instance\s*\(|'
+                                r'->make\s*\(\s*(AIPS_\w+)::class', rhs)
+            if created:
+                types[prop] = created.group(1) or created.group(2) or created.group(3)
+                continue
+            param = re.match(r'\$(\w+)', rhs.strip())
+            if param and param.group(1) in params:
+                types.setdefault(prop, params[param.group(1)])
+        feature['_property_types'] = types
+        return types
+
+    def class_methods(self, class_name: str) -> Dict[str, Tuple[str, int, int]]:
+        """Method bodies of a class including inherited ones: ``{name: (declaring class, start, end)}``."""
+        if class_name in self._class_methods:
+            return self._class_methods[class_name]
+        requested = class_name
+        methods = {}
+        seen = set()
+        while class_name in self.features and class_name not in seen:
+            seen.add(class_name)
+            feature = self.features[class_name]
+            for name, _, start, end in feature['_method_scopes']:
+                methods.setdefault(name, (class_name, start, end))
+            class_name = feature['extends']
+        self._class_methods[requested] = methods
+        return methods
+
+    def container_bindings(self) -> Dict[str, str]:
+        """``AIPS_Container`` ids mapped to the class their singleton()/bind() factory returns.
+
+        Factories that build through another id (``$container->make(X::class)``)
+        map to that id; factories returning something else are left out.
+        """
+        if self._container_bindings is not None:
+            return self._container_bindings
+        bindings = {}
+        pattern = re.compile(r'->\s*(?:singleton|bind)\s*\(\s*(AIPS_\w+)::class\s*,')
+        for _, feature in self.hook_sources():
+            for match in pattern.finditer(feature['_masked_content']):
+                args = self.call_args(feature, feature['_masked_content'].index('(', match.start()))
+                if len(args) < 2:
+                    continue
+                target = re.search(r'\bnew\s+(AIPS_\w+)|(AIPS_\w+)::(?:get_)?instance\s*\(|'
+                                   r'->make\s*\(\s*(AIPS_\w+)::class', args[1])
+                if target:
+                    bindings[match.group(1)] = target.group(1) or target.group(2) or target.group(3)
+        self._container_bindings = bindings
+        return bindings
+
+    def resolve_implementation(self, class_name: str) -> str:
+        """Map a container id or interface to its concrete class; other names are returned unchanged.
+
+        Container bindings win; an interface without one resolves to its only
+        implementing class.
+        """
+        bindings = self.container_bindings()
+        seen = set()
+        while class_name in bindings and class_name not in seen:
+            seen.add(class_name)
+            class_name = bindings[class_name]
+        if class_name not in self.interfaces:
+            return class_name
+        implementors = [cn for cn, f in self.features.items() if class_name in f.get('implements', [])]
+        return implementors[0] if len(implementors) == 1 else class_name
+
+    def resolve_calls(self, class_name: str, body: str, feature: Dict) -> Set[Tuple[str, str]]:
+        """Resolve the ``(class, method)`` targets called from a masked method body."""
+        calls = set()
+        for method in re.findall(r'(?:\$this->|self::|static::|parent::)(\w+)\s*\(', body):
+            calls.add((class_name, method))
+        types = self.property_types(feature)
+        for prop, method in re.findall(r'\$this->(\w+)->(\w+)\s*\(', body):
+            if prop in types:
+                calls.add((self.resolve_implementation(types[prop]), method))
+            elif prop == 'ai_service' or prop.endswith('_ai_service'):
+                calls.add(('AIPS_AI_Service', method))
+        for target, method in re.findall(r'(AIPS_\w+)::(?:(?:get_)?instance\s*\(\s*\)\s*->\s*)?(\w+)\s*\(', body):
+            if method not in ('instance', 'get_instance', 'class'):
+                calls.add((target, method))
+        calls.update(self.closure_calls(body))
+        return calls
+
+    def build_call_graph(self):
+        """Build method-level call edges and direct side effects for every scanned class.
+
+        ``do_action()``/``apply_filters()`` on a literal hook adds edges to that
+        hook's callbacks, so plugin events fired mid-request stay on the path.
+        """
+        self.call_graph = {}
+        self.method_effects = {}
+        callbacks = self.find_hook_callbacks()
+        fired = re.compile(r'\b(?:do_action|apply_filters)\s*\(\s*\'(\w+)\'')
+        deferred = {class_name: self.deferred_closures(feature) for class_name, feature in self.hook_sources()}
+        for class_name, feature in self.hook_sources():
+            masked = feature['_masked_content']
+            content = feature['_raw_content']
+            for name, _, start, end in feature['_method_scopes']:
+                body = masked[start:end]
+                for closure_start, closure_end in deferred.get(class_name, ()):
+                    if start <= closure_start < end:
+                        offset = closure_start - start
+                        body = body[:offset] + ' ' * (closure_end - closure_start) + body[offset + closure_end - closure_start:]
+                node = (class_name, name)
+                calls = self.resolve_calls(class_name, body, feature)
+                for event in fired.finditer(content, start, end):
+                    if masked[event.start()] == content[event.start()]:
+                        calls.update(callbacks.get(event.group(1), ()))
+                self.call_graph[node] = calls
+                effects = {label for label, pattern in self.EFFECT_PATTERNS if pattern.search(body)}
+                if (class_name == 'AIPS_AI_Service' and name in self.AI_SINK_METHODS) or \
+                        feature['file'].startswith('providers/'):
+                    effects.add('ai')
+                self.method_effects[node] = effects
+
+    def deferred_closures(self, feature: Dict) -> List[Tuple[int, int]]:
+        """Spans of closures handed to add_action()/add_filter() or a ``register*()`` call.
+
+        Those closures run later, on their own hook or job, so their calls are
+        not edges of the method that registers them.
+        """
+        masked = feature['_masked_content']
+        closure_pattern = re.compile(r'\bfunction\s*\(')
+        spans = []
+        for match in re.finditer(r'(?:add_action|add_filter|register\w*)\s*\(', masked):
+            close = self.find_block_end(masked, match.end() - 1, '(', ')')
+            position = match.end()
+            for closure in closure_pattern.finditer(masked, position, close):
+                if closure.start() < position:
+                    continue
+                position = self.find_block_end(masked, masked.index('{', closure.end()))
+                spans.append((closure.start(), position))
+        return spans
+
+    def resolve_node(self, node: Tuple[str, str]) -> Optional[Tuple[str, str]]:
+        """Map a call target to the class that actually declares the method (following ``extends``)."""
+        if node in self.call_graph:
+            return node
+        declared = self.class_methods(node[0]).get(node[1])
+        return (declared[0], node[1]) if declared else None
+
+    def reachable_effects(self, roots: List[Tuple[str, str]]) -> Set[str]:
+        """Union of side effects over every method reachable from ``roots``."""
+        effects = set()
+        seen = set()
+        pending = [node for node in map(self.resolve_node, roots) if node]
+        while pending:
+            node = pending.pop()
+            if node in seen:
+                continue
+            seen.add(node)
+            effects |= self.method_effects.get(node, set())
+            for callee in self.call_graph.get(node, ()):
+                resolved = self.resolve_node(callee)
+                if resolved and resolved not in seen:
+                    pending.append(resolved)
+        return effects
+
+    # ---------------------------------------------------------------
+    # Cron load model
+    # ---------------------------------------------------------------
+
+    # WordPress core recurrences, in seconds
+    CORE_CRON_INTERVALS = {'hourly': 3600, 'twicedaily': 43200, 'daily': 86400, 'weekly': 604800}
+
+    def cron_intervals(self) -> Dict[str, int]:
+        """Recurrence name to seconds: WordPress core plus AIPS_Interval_Calculator intervals."""
+        intervals = dict(self.CORE_CRON_INTERVALS)
+        calculator = self.features.get('AIPS_Interval_Calculator')
+        if calculator:
+            for name, seconds in re.findall(r"\$intervals\['(\w+)'\]\s*=\s*array\s*\(\s*'interval'\s*=>\s*(\d+)",
+                                            calculator['_raw_content']):
+                intervals.setdefault(name, int(seconds))
+        return intervals
+
+    def find_dispatched_jobs(self) -> Dict[str, List[Dict]]:
+        """Single events queued through AIPS_Job_Scheduler or Action Scheduler, by hook name.
+
+        A hook returned by an abstract ``$this->get_*_hook()`` is resolved in
+        every subclass, and the dispatch is attributed to that subclass.
+        """
+        dispatched = defaultdict(list)
+        pattern = re.compile(r'->\s*(schedule_simple|schedule_staggered|schedule_batched)\s*\(|'
+                             r'\b(as_schedule_single_action)\s*\(|\bcall_user_func\s*\(')
+        for class_name, feature in self.features.items():
+            starts = None
+            for match in pattern.finditer(feature['_masked_content']):
+                args = self.call_args(feature, match.end() - 1)
+                kind = match.group(1) or match.group(2)
+                hook_index = 0 if match.group(1) else 1
+                if not kind:
+                    if not args or args[0].strip('\'"') != 'as_schedule_single_action':
+                        continue
+                    kind, args = 'as_schedule_single_action', args[1:]
+                if len(args) <= hook_index:
+                    continue
+                owners = [(class_name, feature)]
+                if self.resolve_string(feature, args[hook_index]) is None and args[hook_index].startswith('$this->'):
+                    owners = [(cn, f) for cn, f in self.features.items() if f['extends'] == class_name]
+                starts = starts or self.line_starts(feature['_raw_content'])
+                for owner, owner_feature in owners:
+                    hook = self.resolve_string(owner_feature, args[hook_index])
+                    if hook:
+                        dispatched[hook].append({
+                            'class': owner,
+                            'file': feature['file'],
+                            'line': self.line_number(starts, match.start()),
+                            'kind': kind,
+                        })
+        return dispatched
+
+    def analyze_cron_load(self):
+        """Tabulate WP-Cron hooks by recurrence with the side effects their handlers reach."""
+        intervals = self.cron_intervals()
+        scheduled = self.find_scheduled_hooks()
+        dispatched = self.find_dispatched_jobs()
+        callbacks = self.find_hook_callbacks()
+        self.cron_load = []
+        self.cron_findings = []
+
+        for hook in sorted(set(scheduled) | set(dispatched)):
+            handlers = sorted(set(callbacks.get(hook, ())))
+            effects = self.reachable_effects(handlers)
+            recurrences = {entry['recurrence'] or 'runtime' for entry in scheduled.get(hook, ())}
+            if dispatched.get(hook):
+                recurrences.add('single')
+            for recurrence in recurrences:
+                entries = scheduled.get(hook, []) + (dispatched.get(hook, []) if recurrence == 'single' else [])
+                entries = [e for e in entries if (e.get('recurrence') or 'runtime') == recurrence or 'kind' in e]
+                self.cron_load.append({
+                    'hook': hook,
+                    'recurrence': recurrence,
+                    'seconds': intervals.get(recurrence),
+                    'handlers': handlers,
+                    'effects': effects,
+                    'scheduled_by': sorted({e['class'] for e in entries}),
+                    'dispatch': sorted({e['kind'] for e in entries if 'kind' in e}),
+                })
+            if not handlers:
+                self.cron_findings.append({
+                    'severity': 'info',
+                    'message': f"`{hook}` is scheduled but no add_action() callback was resolved for it",
+                })
+
+        # Sort recurring hooks by frequency; one-off and runtime events last
+        self.cron_load.sort(key=lambda row: (row['seconds'] is None, row['seconds'] or 0,
+                                             row['recurrence'], row['hook']))
+
+        by_interval = defaultdict(list)
+        for row in self.cron_load:
+            if row['seconds'] and 'ai' in row['effects']:
+                by_interval[row['recurrence']].append(row['hook'])
+        for recurrence, hooks in by_interval.items():
+            if len(hooks) > 1:
+                self.cron_findings.append({
+                    'severity': 'warning',
+                    'message': (
+                        f"{len(hooks)} AI-calling hooks share the `{recurrence}` recurrence "
+                        f"({', '.join(f'`{h}`' for h in hooks)}) — when due together they run "
+                        f"back to back in one WP-Cron request; offset their start times"
+                    ),
+                })
+        for row in self.cron_load:
+            if {'schedule_staggered', 'schedule_batched'} & set(row['dispatch']) and 'ai' in row['effects']:
+                self.cron_findings.append({
+                    'severity': 'info',
+                    'message': (
+                        f"`{row['hook']}` fans out AI work as staggered single events — the stagger "
+                        f"spacing bounds how many AI calls overlap"
+                    ),
+                })
+
+    # ---------------------------------------------------------------
+    # Hot paths
+    # ---------------------------------------------------------------
+
+    # Entry point kinds, in report order; the first three run while a user waits
+    ENTRY_KINDS = ('ajax', 'rest', 'request', 'cron', 'event')
+    INTERACTIVE_ENTRY_KINDS = frozenset(['ajax', 'rest', 'request'])
+
+    def find_entry_points(self) -> List[Dict]:
+        """Request entry points as ``{kind, trigger, handler}`` entries.
+
+        Hook callbacks are classed as ``cron`` (scheduled hooks), ``ajax``
+        (``wp_ajax_*``), ``event`` (plugin ``aips_*`` hooks) or ``request``
+        (WordPress core hooks fired while a page loads); REST routes come from
+        register_rest_route() ``callback`` entries on ``$this``.
+        """
+        cron_hooks = {row['hook'] for row in self.cron_load}
+        entries = set()
+        for hook, handlers in self.find_hook_callbacks().items():
+            if hook in cron_hooks:
+                kind = 'cron'
+            elif hook.startswith('wp_ajax_'):
+                kind = 'ajax'
+            elif hook.startswith('aips_'):
+                kind = 'event'
+            else:
+                kind = 'request'
+            entries.update((kind, hook, handler) for handler in handlers)
+
+        pattern = re.compile(r'\bregister_rest_route\s*\(')
+        for owner, feature in self.hook_sources():
+            for match in pattern.finditer(feature['_masked_content']):
+                args = self.call_args(feature, match.end() - 1)
+                if len(args) < 3:
+                    continue
+                route = (self.resolve_string(feature, args[0]) or '?') + (self.resolve_string(feature, args[1]) or '?')
+                for method in re.findall(r"'callback'\s*=>\s*(?:array\s*\(|\[)\s*\$this\s*,\s*'(\w+)'", args[2]):
+                    entries.add(('rest', route, (owner, method)))
+
+        return [{'kind': kind, 'trigger': trigger, 'handler': handler}
+                for kind, trigger, handler in sorted(
+                    entries, key=lambda e: (self.ENTRY_KINDS.index(e[0]), e[1], e[2]))]
+
+    def sink_paths(self, root: Tuple[str, str], reached: Optional[Set[Tuple[str, str]]] = None
+                   ) -> Tuple[Dict[str, List[Tuple[str, str]]], Dict[str, int]]:
+        """Shortest call path from ``root`` to each kind of sink, plus how many sink methods it reaches.
+
+        Enumerating every simple path is exponential in a graph this size, so
+        one witness path per effect is kept (breadth-first, so the shortest).
+        Every method visited is added to ``reached`` when given.
+        """
+        start = self.resolve_node(root)
+        if not start:
+            return {}, {}
+        parents = {start: None}
+        queue = deque([start])
+        paths = {}
+        sinks = defaultdict(int)
+        while queue:
+            node = queue.popleft()
+            for effect in self.method_effects.get(node, ()):
+                sinks[effect] += 1
+                if effect not in paths:
+                    path = []
+                    step = node
+                    while step:
+                        path.append(step)
+                        step = parents[step]
+                    paths[effect] = path[::-1]
+            for callee in sorted(self.call_graph.get(node, ())):
+                resolved = self.resolve_node(callee)
+                if resolved and resolved not in parents:
+                    parents[resolved] = node
+                    queue.append(resolved)
+        if reached is not None:
+            reached.update(parents)
+        return paths, dict(sinks)
+
+    def analyze_hot_paths(self):
+        """Trace every entry point to the AI, HTTP and database-write sinks it reaches."""
+        self.entry_points = []
+        self.hot_path_findings = []
+        self.method_entry_counts = defaultdict(int)
+        for entry in self.find_entry_points():
+            reached = set()
+            entry['paths'], entry['sinks'] = self.sink_paths(entry['handler'], reached)
+            for node in reached:
+                self.method_entry_counts[node] += 1
+            self.entry_points.append(entry)
+            if entry['kind'] not in self.INTERACTIVE_ENTRY_KINDS:
+                continue
+            if 'ai' in entry['paths']:
+                self.hot_path_findings.append({
+                    'severity': 'critical' if entry['kind'] == 'request' else 'warning',
+                    'effect': 'ai',
+                    'entry': entry,
+                })
+            if 'http' in entry['paths'] and entry['kind'] == 'request':
+                self.hot_path_findings.append({'severity': 'warning', 'effect': 'http', 'entry': entry})
+        self.hot_path_findings.sort(key=lambda f: (f['severity'] != 'critical', f['effect'],
+                                                   self.ENTRY_KINDS.index(f['entry']['kind']),
+                                                   f['entry']['trigger']))
+
+    # ---------------------------------------------------------------
+    # Admin asset weight
+    # ---------------------------------------------------------------
+
+    ASSET_CALL_PATTERN = re.compile(r'\b(?:wp_enqueue_(script|style)|wp_register_(script|style))\s*\(|\$this->(\w+)\s*\(')
+    ASSET_SRC_PATTERN = re.compile(r"AIPS_PLUGIN_URL\s*\.\s*'([^']+)'")
+
+    # Pseudo-screens for assets not tied to one page
+    ALL_PLUGIN_SCREENS = '*plugin'
+    ALL_ADMIN_SCREENS = '*admin'
+
+    # A globally loaded asset used by at most this many screens should be
+    # enqueued in those screens' branches instead
+    NARROW_ASSET_MAX_SCREENS = 2
+
+    def enqueue_calls(self, feature: Dict, method: str, scopes: Dict[str, Tuple[int, int]],
+                      seen: Optional[Set[str]] = None) -> List[Dict]:
+        """Assets enqueued by ``method``, following ``$this->`` helper calls.
+
+        Each entry records the handle, kind, plugin-relative path (``None`` for
+        core or pre-registered handles), dependency handles, whether it is only
+        registered, whether an ``if`` inside a helper guards it, and the offset
+        of the call made directly from ``method``.
+        """
+        top = seen is None
+        seen = seen if seen is not None else set()
+        if method in seen or method not in scopes:
+            return []
+        seen.add(method)
+        masked = feature['_masked_content']
+        start, end = scopes[method]
+        assets = []
+        for match in self.ASSET_CALL_PATTERN.finditer(masked, start, end):
+            nested = not top and masked.count('{', start, match.start()) - masked.count('}', start, match.start()) > 1
+            helper = match.group(3)
+            if helper:
+                for asset in self.enqueue_calls(feature, helper, scopes, seen):
+                    assets.append(dict(asset, conditional=asset['conditional'] or nested, offset=match.start()))
+                continue
+            args = self.call_args(feature, match.end() - 1)
+            handle = self.resolve_string(feature, args[0]) if args else None
+            if not handle:
+                continue
+            src = self.ASSET_SRC_PATTERN.search(args[1]) if len(args) > 1 else None
+            assets.append({
+                'handle': handle,
+                'kind': match.group(1) or match.group(2),
+                'path': src.group(1) if src else None,
+                'deps': re.findall(r"'([\w.-]+)'", args[2]) if len(args) > 2 else [],
+                'registered_only': bool(match.group(2)),
+                'conditional': nested,
+                'offset': match.start(),
+            })
+        return assets
+
+    def condition_screens(self, feature: Dict, condition: str,
+                          scopes: Dict[str, Tuple[int, int]]) -> Set[str]:
+        """Admin screens named by a PHP condition.
+
+        Recognises page-slug constants compared to ``$page`` or passed to
+        ``hook_contains()``, ``is_*_tab($page, ...)`` helpers, ``'aips-*'``
+        literals (paired with a ``$tab`` comparison when present) and
+        ``$this->is_*()`` helpers that whitelist ``*.php`` screens.
+        """
+        screens = set()
+        for expr in re.findall(r'((?:self|AIPS_\w+)::\w+)\s*===\s*\$page', condition) + \
+                re.findall(r'(?<!!)\$this->hook_contains\(\s*\$hook\s*,\s*((?:self|AIPS_\w+)::\w+)\s*\)', condition):
+            slug = self.resolve_string(feature, expr)
+            if slug:
+                screens.add(slug[len('toplevel_page_'):] if slug.startswith('toplevel_page_') else slug)
+        for area, tab in re.findall(r'\$this->is_(\w+)_tab\(\s*\$page\s*,\s*([^)]+)\)', condition):
+            tab = self.resolve_string(feature, tab)
+            if tab:
+                screens.add(f"aips-{area}&tab={tab}")
+        paired = re.findall(r"'(aips-[\w-]+)'\s*===\s*\$page\s*&&\s*'([\w-]+)'\s*===\s*\$tab", condition)
+        screens.update(f"{page}&tab={tab}" for page, tab in paired)
+        screens.update(set(re.findall(r"'(aips-[\w-]+)'", condition)) - {page for page, _ in paired})
+        for helper in re.findall(r'(?<!!)\$this->(is_\w+)\s*\(', condition):
+            if helper in scopes:
+                screens.update(re.findall(r"'([\w-]+\.php)'", feature['_raw_content'][slice(*scopes[helper])]))
+        return screens
+
+    def enclosing_conditions(self, feature: Dict, start: int, end: int, offset: int) -> List[Tuple[str, bool]]:
+        """``if`` conditions in ``[start, end)`` whose block contains ``offset``, innermost first.
+
+        Also returns the conditions of earlier ``if`` blocks that ``return``
+        (guards), flagged ``True``.
+        """
+        masked = feature['_masked_content']
+        content = feature['_raw_content']
+        conditions = []
+        for match in re.compile(r'\bif\s*\(').finditer(masked, start, offset):
+            close = self.find_block_end(masked, match.end() - 1, '(', ')')
+            brace = close + len(masked[close:close + 200]) - len(masked[close:close + 200].lstrip())
+            if brace >= len(masked) or masked[brace] != '{':
+                continue
+            block_end = self.find_block_end(masked, brace)
+            condition = content[match.end():close - 1]
+            if brace < offset < block_end:
+                conditions.append((condition, False))
+            elif block_end <= offset and re.search(r'\breturn\s*;\s*\}$', masked[brace:block_end]):
+                conditions.append((condition, True))
+        conditions.reverse()
+        return conditions
+
+    def analyze_admin_assets(self):
+        """Model the scripts and styles each admin screen ships, and flag over-broad enqueues."""
+        self.asset_catalog = {}
+        self.asset_screens = {}
+        self.asset_findings = []
+        placements = defaultdict(set)
+        for class_name, handler in sorted(set(self.find_hook_callbacks().get('admin_enqueue_scripts', ()))):
+            feature = self.features.get(class_name)
+            if not feature:
+                continue
+            scopes = {name: (start, end) for name, _, start, end in feature['_method_scopes']}
+            if handler not in scopes:
+                continue
+            start, end = scopes[handler]
+            for asset in self.enqueue_calls(feature, handler, scopes):
+                if asset['path']:
+                    path = self.plugin_dir / asset['path']
+                    self.asset_catalog.setdefault((asset['kind'], asset['handle']), {
+                        'path': asset['path'],
+                        'bytes': path.stat().st_size if path.exists() else 0,
+                        'deps': [(asset['kind'], dep) for dep in asset['deps']],
+                        'owner': class_name,
+                    })
+                if asset['registered_only']:
+                    continue
+                screens = set()
+                guarded = False
+                for condition, is_guard in self.enclosing_conditions(feature, start, end, asset['offset']):
+                    if is_guard:
+                        guarded = guarded or 'is_plugin_admin_page' in condition or \
+                            bool(re.search(r'\$(?:hook|page)\b', condition))
+                        if 'is_plugin_admin_page' in condition:
+                            continue
+                    screens = self.condition_screens(feature, condition, scopes)
+                    if screens:
+                        break
+                if not screens:
+                    screens = {self.ALL_PLUGIN_SCREENS if guarded else self.ALL_ADMIN_SCREENS}
+                for screen in screens:
+                    placements[screen].add(((asset['kind'], asset['handle']), asset['conditional']))
+
+            # Screens whose branch only localizes strings still ship the shared payload
+            for match in re.finditer(r'\$this->\w+\s*\(', feature['_masked_content'][start:end]):
+                for condition, is_guard in self.enclosing_conditions(feature, start, end, start + match.start()):
+                    if not is_guard:
+                        for screen in self.condition_screens(feature, condition, scopes):
+                            placements.setdefault(screen, set())
+                        break
+
+        def payload(handles: Set[Tuple[str, str]], kind: Optional[str] = None) -> int:
+            # Bytes of the distinct files behind ``handles``; two handles may share a file
+            return sum(dict((self.asset_catalog[h]['path'], self.asset_catalog[h]['bytes'])
+                            for h in handles if kind in (None, h[0])).values())
+
+        def closure(handles: Set[Tuple[str, str]]) -> Set[Tuple[str, str]]:
+            pending = list(handles)
+            resolved = set()
+            while pending:
+                handle = pending.pop()
+                if handle in resolved or handle not in self.asset_catalog:
+                    continue
+                resolved.add(handle)
+                pending.extend(self.asset_catalog[handle]['deps'])
+            return resolved
+
+        baseline = {h for h, _ in placements.get(self.ALL_ADMIN_SCREENS, ())}
+        shared = {h for h, _ in placements.get(self.ALL_PLUGIN_SCREENS, ())}
+        for screen, entries in placements.items():
+            own = {h for h, _ in entries}
+            plugin_screen = screen == self.ALL_PLUGIN_SCREENS or screen.startswith('aips-') or \
+                screen == 'ai-post-scheduler'
+            inherited = baseline | (shared if plugin_screen else set())
+            if screen == self.ALL_ADMIN_SCREENS:
+                inherited = set()
+            handles = closure(own | inherited)
+            specific = handles - closure(inherited) if not screen.startswith('*') else handles
+            self.asset_screens[screen] = {
+                'handles': handles,
+                'specific': specific,
+                'conditional': {h for h, conditional in entries if conditional},
+                'bytes': {kind: payload(handles, kind) for kind in ('script', 'style')},
+                'specific_bytes': payload(specific),
+            }
+            paths = defaultdict(list)
+            for key in handles:
+                paths[self.asset_catalog[key]['path']].append(key[1])
+            for path, aliases in paths.items():
+                if len(aliases) > 1:
+                    self.asset_findings.append({
+                        'severity': 'info',
+                        'message': (
+                            f"`{screen}` enqueues {path} under {len(aliases)} handles "
+                            f"({', '.join(f'`{a}`' for a in sorted(aliases))}) — WordPress prints it once per handle"
+                        ),
+                    })
+
+        # Globally loaded assets that name, or are only depended on by, a single screen
+        # A tab of a hub page (``aips-automations&tab=templates``) is the same UI
+        # as the standalone page (``aips-templates``), so both share a stem
+        def screen_stem(screen: str) -> str:
+            page, _, tab = screen.partition('&tab=')
+            return tab or page[len('aips-'):]
+
+        # Screens served by the same enqueue branch count once
+        def screen_group(screen: str):
+            return frozenset(self.asset_screens[screen]['specific']) or screen_stem(screen)
+
+        page_screens = [s for s in self.asset_screens if not s.startswith('*')]
+        global_assets = closure(shared) | closure(baseline)
+        for key in sorted(global_assets):
+            if any(key in self.asset_catalog[other]['deps'] for other in global_assets):
+                continue
+            asset = self.asset_catalog[key]
+            handle = key[1]
+            stem = Path(asset['path']).stem.split('.')[0]
+            stem = stem[len('admin-'):] if stem.startswith('admin-') else stem
+            named = {s for s in page_screens if screen_stem(s) == stem}
+            dependents = {s for s in page_screens
+                          if any(key in self.asset_catalog[h]['deps'] for h in self.asset_screens[s]['specific'])}
+            needed = named | dependents
+            every_admin_screen = key in closure(baseline)
+            if 0 < len({screen_group(s) for s in needed}) <= self.NARROW_ASSET_MAX_SCREENS:
+                self.asset_findings.append({
+                    'severity': 'warning',
+                    'message': (
+                        f"`{handle}` ({asset['path']}, {asset['bytes'] / 1024:.1f} KB) loads on every "
+                        f"{'admin' if every_admin_screen else 'plugin'} screen but only "
+                        f"{', '.join(f'`{s}`' for s in sorted(needed))} uses it — move it into that "
+                        f"screen's enqueue branch"
+                    ),
+                })
+            elif every_admin_screen:
+                self.asset_findings.append({
+                    'severity': 'info',
+                    'message': (
+                        f"`{handle}` ({asset['path']}, {asset['bytes'] / 1024:.1f} KB) is enqueued by "
+                        f"`{asset['owner']}` on every wp-admin screen, including ones outside the plugin"
+                    ),
+                })
+
+    # ---------------------------------------------------------------
+    # Bootstrap cost
+    # ---------------------------------------------------------------
+
+    # Request types the main plugin file boots separately via boot_<context>()
+    REQUEST_CONTEXTS = ('frontend', 'admin', 'ajax', 'cron')
+
+    # Request-type checks and the contexts in which each is true
+    REQUEST_GUARDS = (
+        (re.compile(r'\bwp_doing_ajax\s*\(|\bDOING_AJAX\b'), frozenset(['ajax'])),
+        (re.compile(r'\bwp_doing_cron\s*\(|\bDOING_CRON\b'), frozenset(['cron'])),
+        (re.compile(r'\bis_admin\s*\('), frozenset(['admin', 'ajax'])),
+    )
+
+    # Estimated callback invocations per request for core hooks; per-post,
+    # per-string and per-capability-check hooks multiply every callback. Hooks
+    # not listed fire only on specific events (saves, option writes, plugin events)
+    HOOK_FIRES = {
+        'plugins_loaded': 1, 'init': 1, 'wp_loaded': 1, 'widgets_init': 1, 'rest_api_init': 1,
+        'cron_schedules': 1, 'admin_init': 1, 'admin_menu': 1, 'current_screen': 1,
+        'admin_enqueue_scripts': 1, 'admin_head': 1, 'admin_footer': 1, 'admin_notices': 1,
+        'parent_file': 1, 'submenu_file': 1, 'admin_bar_menu': 1, 'wp_enqueue_scripts': 1,
+        'template_redirect': 1, 'wp_head': 1, 'wp_footer': 1, 'shutdown': 1,
+        'the_content': 10, 'the_excerpt': 10, 'post_class': 10, 'post_link': 10, 'the_title': 20,
+        'post_row_actions': 20, 'get_post_metadata': 50, 'map_meta_cap': 50, 'user_has_cap': 50,
+        'gettext': 500,
+    }
+
+    # Hooks fired only on wp-admin screens
+    ADMIN_SCREEN_HOOKS = frozenset([
+        'admin_menu', 'current_screen', 'parent_file', 'submenu_file', 'post_row_actions',
+        'post_submitbox_misc_actions', 'admin_enqueue_scripts', 'admin_head', 'admin_footer', 'admin_notices',
+    ])
+
+    # Hooks fired only on front-end page loads
+    FRONTEND_HOOKS = frozenset(['wp_enqueue_scripts', 'template_redirect', 'wp_head', 'wp_footer'])
+
+    @classmethod
+    def hook_contexts(cls, hook: str) -> Set[str]:
+        """Request contexts in which ``hook`` can fire."""
+        if hook.startswith('wp_ajax_'):
+            return {'ajax'}
+        if hook == 'admin_init' or hook.startswith('admin_post_'):
+            return {'admin', 'ajax'}
+        if hook in cls.ADMIN_SCREEN_HOOKS or hook.startswith(('manage_', 'load-')):
+            return {'admin'}
+        if hook in cls.FRONTEND_HOOKS:
+            return {'frontend'}
+        return set(cls.REQUEST_CONTEXTS)
+
+    def guard_contexts(self, conditions: List[Tuple[str, bool]], contexts: Set[str]) -> Tuple[Set[str], bool]:
+        """Narrow ``contexts`` by enclosing ``if`` conditions; also reports whether any condition applies.
+
+        ``is_admin()``, ``wp_doing_ajax()`` and ``wp_doing_cron()`` checks (and
+        their negations) narrow the request types; any other condition, such
+        as a capability check, only marks the code as guarded.
+        """
+        for condition, is_return_guard in conditions:
+            for pattern, true_in in self.REQUEST_GUARDS:
+                match = pattern.search(condition)
+                if not match:
+                    continue
+                negated = bool(re.search(r'!\s*(?:defined\s*\(\s*[\'"])?$', condition[:match.start()]))
+                # Code after ``if (...) return;`` runs only when the condition is false
+                if negated != is_return_guard:
+                    contexts = contexts - true_in
+                else:
+                    contexts = contexts & true_in
+                break
+        return contexts, bool(conditions)
+
+    def closure_spans(self, masked: str, start: int, end: int) -> List[Tuple[int, int]]:
+        """Spans of anonymous functions in ``[start, end)``, outermost only."""
+        spans = []
+        position = start
+        for match in re.compile(r'\bfunction\s*\(').finditer(masked, start, end):
+            if match.start() < position:
+                continue
+            position = self.find_block_end(masked, masked.index('{', match.end()))
+            spans.append((match.start(), position))
+        return spans
+
+    def method_source(self, owner: str, method: str) -> Optional[Tuple[Dict, int, int]]:
+        """``(feature, start, end)`` of a method of ``owner`` (inherited or in the main plugin file)."""
+        if self.bootstrap and owner == self.bootstrap['class']:
+            for name, _, start, end in self.bootstrap['_method_scopes']:
+                if name == method:
+                    return self.bootstrap, start, end
+            return None
+        declared = self.class_methods(owner).get(method)
+        return (self.features[declared[0]], declared[1], declared[2]) if declared else None
+
+    BOOT_CALL_PATTERN = re.compile(
+        r'(?:\$this->|self::|static::)(\w+)\s*\(|\$this->(\w+)->(\w+)\s*\(|'
+        r'(AIPS_\w+)::(?:(?:get_)?instance\s*\(\s*\)\s*->\s*)?(\w+)\s*\('
+    )
+    BOOT_CONSTRUCT_PATTERN = re.compile(
+        r'\bnew\s+(AIPS_\w+)|(AIPS_\w+)::(?:get_)?instance\s*\(|->\s*make\s*\(\s*(AIPS_\w+)::class'
+    )
+
+    def walk_bootstrap(self, seeds: List[Tuple[str, str, Set[str]]]) -> Tuple[
+            List[Dict], Dict[str, Dict[str, str]], Dict[str, Set[Tuple[str, str]]]]:
+        """Follow the code that runs while WordPress boots, from ``(class, method, contexts)`` seeds.
+
+        Walks constructors of instantiated classes, direct calls and the
+        callbacks of hooks that fire on every request (``HOOK_FIRES``),
+        including closure callbacks. Other closures run later and are skipped.
+        Returns the hook registrations made and, per context, each class
+        constructed with the class that first constructs it and the
+        ``(caller, callee)`` class pairs of cross-class method calls.
+        """
+        reached = defaultdict(set)
+        registrations = {}
+        constructed = {context: {} for context in self.REQUEST_CONTEXTS}
+        uses = {context: set() for context in self.REQUEST_CONTEXTS}
+        hook_pattern = re.compile(r'\badd_(?:action|filter)\s*\(')
+        pending = deque((owner, method, set(contexts), None) for owner, method, contexts in seeds)
+        while pending:
+            owner, method, contexts, span = pending.popleft()
+            source = self.method_source(owner, method)
+            if not source:
+                continue
+            feature, start, end = source
+            if span:
+                start, end = span
+            key = (owner, method, span)
+            contexts = contexts - reached[key]
+            if not contexts:
+                continue
+            reached[key] |= contexts
+            masked = feature['_masked_content']
+            spans = self.closure_spans(masked, masked.index('{', start) + 1 if span else start, end)
+
+            def deferred(offset: int) -> bool:
+                return any(s <= offset < e for s, e in spans)
+
+            def narrowed(offset: int) -> Tuple[Set[str], bool]:
+                return self.guard_contexts(self.enclosing_conditions(feature, start, end, offset), contexts)
+
+            def call(target: str, target_method: str, active: Set[str]):
+                # Calls through an interface may reach any implementation
+                targets = [cn for cn, f in self.features.items() if target in f.get('implements', [])] \
+                    if target in self.interfaces else [target]
+                for callee in targets:
+                    if callee != owner:
+                        for context in active:
+                            uses[context].add((owner, callee))
+                    pending.append((callee, target_method, active, None))
+
+            for match in hook_pattern.finditer(masked, start, end):
+                if masked[match.start() - 1] in '>:$' or deferred(match.start()):
+                    continue
+                active, guarded = narrowed(match.start())
+                args = self.call_args(feature, match.end() - 1)
+                if not active or len(args) < 2:
+                    continue
+                hook = self.resolve_string(feature, args[0])
+                # Declarative ``'hook' => '...'`` bindings looped over by the registering method
+                bindings = [m.group(1) for m in re.finditer(r"'hook'\s*=>\s*'(\w+)'", feature['_raw_content'])
+                            if masked[m.start()] == "'"] if "['hook']" in args[0] else []
+                hooks = [hook] if hook else bindings or ['(dynamic)']
+                for index, name in enumerate(hooks):
+                    firing = active & self.hook_contexts(name)
+                    registration = registrations.setdefault((owner, method, match.start(), index), {
+                        'class': owner,
+                        'method': method,
+                        'hook': name,
+                        'registered_in': set(),
+                        'contexts': set(),
+                        'guarded': guarded,
+                        'file': feature['file'],
+                        'line': self.line_number(self.line_starts(feature['_raw_content']), match.start()),
+                    })
+                    registration['registered_in'] |= active
+                    registration['contexts'] |= firing
+                    if name not in self.HOOK_FIRES or not firing:
+                        continue
+                    # Callbacks of per-request hooks run during this request too
+                    callback = args[1]
+                    if re.match(r'(?:static\s+)?function\b', callback):
+                        closure = re.compile(r'\bfunction\s*\(').search(masked, match.end()).start()
+                        body = masked.index('{', closure)
+                        pending.append((owner, method, firing, (closure, self.find_block_end(masked, body))))
+                        continue
+                    target = re.fullmatch(
+                        r"(?:array\s*\(|\[)\s*(\$this|__CLASS__|self::class|static::class|'(AIPS_\w+)'|"
+                        r"(AIPS_\w+)::class)\s*,\s*'(\w+)'\s*(?:\)|\])|'(\w+)'",
+                        callback,
+                    )
+                    if target and target.group(5):
+                        call(self.bootstrap['class'] if self.bootstrap else owner, target.group(5), firing)
+                    elif target:
+                        call(target.group(2) or target.group(3) or owner, target.group(4), firing)
+
+            for match in self.BOOT_CONSTRUCT_PATTERN.finditer(masked, start, end):
+                if deferred(match.start()):
+                    continue
+                created = self.resolve_implementation(match.group(1) or match.group(2) or match.group(3))
+                if created not in self.features:
+                    continue
+                active, _ = narrowed(match.start())
+                for context in active:
+                    constructed[context].setdefault(created, owner)
+                if active:
+                    pending.append((created, '__construct', active, None))
+
+            types = self.property_types(feature) if feature is not self.bootstrap else {}
+            for match in self.BOOT_CALL_PATTERN.finditer(masked, start, end):
+                if deferred(match.start()):
+                    continue
+                active, _ = narrowed(match.start())
+                own, prop, prop_method, target, static_method = match.groups()
+                if own:
+                    boot = re.fullmatch(r'boot_(\w+)', own)
+                    if boot and boot.group(1) in self.REQUEST_CONTEXTS:
+                        active = active & {boot.group(1)}
+                    call(owner, own, active)
+                elif prop and prop in types:
+                    call(self.resolve_implementation(types[prop]), prop_method, active)
+                elif target and static_method not in ('instance', 'get_instance', 'class'):
+                    call(self.resolve_implementation(target), static_method, active)
+
+            blanked = masked[start:end]
+            for s, e in spans:
+                blanked = blanked[:s - start] + ' ' * (e - s) + blanked[e - start:]
+            for target, target_method in self.closure_calls(blanked):
+                call(target, target_method, contexts)
+
+        return list(registrations.values()), constructed, uses
+
+    def ajax_registry_controllers(self) -> List[str]:
+        """Controller classes named in ``AIPS_Ajax_Registry``'s action map."""
+        registry = self.features.get('AIPS_Ajax_Registry')
+        if not registry:
+            return []
+        return sorted(set(re.findall(r"'\w+'\s*=>\s*'(AIPS_\w+)'", registry['_raw_content'])) & set(self.features))
+
+    def analyze_bootstrap_cost(self):
+        """Model hook registrations and object construction made while each request type boots."""
+        self.boot_registrations = []
+        self.boot_constructed = {}
+        self.boot_uses = {}
+        self.ajax_controller_costs = []
+        self.bootstrap_findings = []
+        if not self.bootstrap:
+            return
+        everywhere = set(self.REQUEST_CONTEXTS)
+        owner = self.bootstrap['class']
+        masked = self.bootstrap['_masked_content']
+
+        # The main plugin file's top-level registrations and its constructor run on every request
+        seeds = [(owner, '__construct', everywhere)]
+        scopes = [(start, end) for _, _, start, end in self.bootstrap['_method_scopes']]
+        for match in re.finditer(r'\badd_(?:action|filter)\s*\(', masked):
+            if any(start <= match.start() < end for start, end in scopes):
+                continue
+            args = self.call_args(self.bootstrap, match.end() - 1)
+            hook = self.resolve_string(self.bootstrap, args[0]) if args else None
+            callback = re.fullmatch(r"'(\w+)'", args[1]) if len(args) > 1 else None
+            self.boot_registrations.append({
+                'class': owner, 'method': '(main file)', 'hook': hook or '(dynamic)',
+                'registered_in': everywhere, 'contexts': self.hook_contexts(hook) if hook else everywhere,
+                'guarded': False,
+                'file': self.bootstrap['file'],
+                'line': self.line_number(self.line_starts(self.bootstrap['_raw_content']), match.start()),
+            })
+            if hook in self.HOOK_FIRES and callback:
+                seeds.append((owner, callback.group(1), self.hook_contexts(hook)))
+
+        registrations, self.boot_constructed, self.boot_uses = self.walk_bootstrap(seeds)
+        self.boot_registrations.extend(registrations)
+
+        # boot_ajax() constructs the one controller AIPS_Ajax_Registry maps the action to
+        if 'AIPS_Ajax_Registry::get_controller_for' in masked:
+            for controller in self.ajax_registry_controllers():
+                extra, constructed, _ = self.walk_bootstrap([(controller, '__construct', {'ajax'})])
+                self.ajax_controller_costs.append({
+                    'class': controller,
+                    'registrations': len(extra),
+                    'fires': sum(self.HOOK_FIRES.get(r['hook'], 0) for r in extra),
+                    'constructed': len(set(constructed['ajax']) - set(self.boot_constructed['ajax'])),
+                })
+            self.ajax_controller_costs.sort(key=lambda c: (-c['registrations'] - c['constructed'], c['class']))
+
+        # Hooks registered on request types where they can never fire
+        misplaced = defaultdict(lambda: defaultdict(set))
+        for registration in self.boot_registrations:
+            if registration['hook'] == '(dynamic)':
+                continue
+            for context in registration['registered_in'] - registration['contexts']:
+                misplaced[(registration['class'], registration['method'])][context].add(registration['hook'])
+        for (class_name, method), contexts in sorted(misplaced.items()):
+            wasted = '; '.join(
+                f"{context}: {', '.join(f'`{h}`' for h in sorted(contexts[context])[:4])}"
+                f"{f' +{len(contexts[context]) - 4} more' if len(contexts[context]) > 4 else ''}"
+                for context in self.REQUEST_CONTEXTS if context in contexts
+            )
+            self.bootstrap_findings.append({
+                'severity': 'warning' if len(contexts.get('frontend', ())) > 1 else 'info',
+                'class': class_name,
+                'message': (
+                    f"`{class_name}::{method}()` registers hooks on request types where they never fire "
+                    f"({wasted}) — register them from the boot path of the request type that fires them"
+                ),
+            })
+
+        # Per-item hooks registered unconditionally on front-end requests
+        for registration in self.boot_registrations:
+            fires = self.HOOK_FIRES.get(registration['hook'], 0)
+            if fires > 1 and not registration['guarded'] and 'frontend' in registration['contexts']:
+                self.bootstrap_findings.append({
+                    'severity': 'warning',
+                    'class': registration['class'],
+                    'message': (
+                        f"`{registration['class']}::{registration['method']}()` hooks `{registration['hook']}` "
+                        f"unconditionally ({registration['file']}:{registration['line']}); it fires ~{fires} "
+                        f"times per front-end page"
+                    ),
+                })
+
+    def plan_lazy_services(self):
+        """Find classes constructed while booting that no per-request work of that request type uses.
+
+        A class is needed on a request type when it registers a callback on a
+        hook that fires every request (``HOOK_FIRES``) or when a needed class,
+        or the main plugin file, calls one of its methods while booting.
+        Anything else constructed at boot only serves event hooks (saves,
+        scheduled events, one AJAX action) or nothing at all, and can be
+        resolved from ``AIPS_Container`` when first used. Deferrable classes
+        are grouped under the outermost one, whose construction pulls in the
+        rest.
+        """
+        self.lazy_plan = []
+        if not self.bootstrap or not self.boot_constructed:
+            return
+        per_request = defaultdict(set)
+        events = defaultdict(lambda: defaultdict(set))
+        for registration in self.boot_registrations:
+            for context in registration['contexts']:
+                if self.HOOK_FIRES.get(registration['hook'], 0):
+                    per_request[context].add(registration['class'])
+                else:
+                    events[context][registration['class']].add(registration['hook'])
+        bound = set(self.container_bindings()) | set(self.container_bindings().values())
+
+        plan = {}
+        for context in self.REQUEST_CONTEXTS:
+            constructed = self.boot_constructed[context]
+            needed = {self.bootstrap['class']} | per_request[context]
+            while True:
+                used = {callee for caller, callee in self.boot_uses[context] if caller in needed} - needed
+                if not used:
+                    break
+                needed |= used
+            deferrable = set(constructed) - needed
+            for class_name in sorted(deferrable):
+                # Attribute each deferrable class to its outermost deferrable constructor
+                root, seen = class_name, set()
+                while constructed.get(root) in deferrable and root not in seen:
+                    seen.add(root)
+                    root = constructed[root]
+                entry = plan.setdefault(root, {
+                    'class': root,
+                    'constructed_by': constructed.get(root),
+                    'avoided': defaultdict(int),
+                    'events': set(),
+                    'bound': root in bound,
+                })
+                entry['avoided'][context] += 1
+                if class_name == root:
+                    entry['events'] |= events[context].get(root, set())
+        self.lazy_plan = sorted(plan.values(), key=lambda e: (-sum(e['avoided'].values()), e['class']))
+
+    def bootstrap_class_costs(self) -> List[Dict]:
+        """Per-class bootstrap work: registrations and estimated callback fires per request type."""
+        costs = {}
+        for registration in self.boot_registrations:
+            cost = costs.setdefault(registration['class'], {
+                'class': registration['class'],
+                'registrations': defaultdict(int),
+                'fires': defaultdict(int),
+                'constructor': 0,
+                'method': 0,
+                'guarded': 0,
+                'hooks': set(),
+            })
+            for context in registration['registered_in']:
+                cost['registrations'][context] += 1
+            for context in registration['contexts']:
+                cost['fires'][context] += self.HOOK_FIRES.get(registration['hook'], 0)
+            cost['constructor' if registration['method'] == '__construct' else 'method'] += 1
+            cost['guarded'] += registration['guarded']
+            if self.HOOK_FIRES.get(registration['hook'], 0):
+                cost['hooks'].add(registration['hook'])
+        for cost in costs.values():
+            cost['contexts'] = [c for c in self.REQUEST_CONTEXTS
+                                if cost['class'] in self.boot_constructed.get(c, {}) or cost['registrations'][c]]
+            cost['score'] = sum(cost['registrations'].values()) + sum(cost['fires'].values())
+        return sorted(costs.values(), key=lambda c: (-c['score'], c['class']))
+
+    # ---------------------------------------------------------------
+    # Outbound HTTP
+    # ---------------------------------------------------------------
+
+    # Functions that send a request over the network, with the timeout in
+    # seconds WordPress (or the AI client) applies when none is passed
+    HTTP_FUNCTIONS = {
+        'wp_remote_get': 5, 'wp_remote_post': 5, 'wp_remote_head': 5, 'wp_remote_request': 5,
+        'wp_safe_remote_get': 5, 'wp_safe_remote_post': 5, 'wp_safe_remote_head': 5,
+        'wp_safe_remote_request': 5, 'download_url': 300, 'wp_ai_client_prompt': None,
+    }
+    HTTP_CALL_PATTERN = re.compile(r'\b(' + '|'.join(HTTP_FUNCTIONS) + r')\s*\(')
+
+    # Timeouts above this many seconds hold a PHP worker for too long
+    HTTP_TIMEOUT_LIMIT = 30
+
+    # Reads through a cache layer, by kind
+    HTTP_CACHE_PATTERNS = (
+        ('transient', re.compile(r'\b(?:get|set)_(?:site_)?transient\s*\(')),
+        ('object cache', re.compile(r'\bwp_cache_(?:get|set|add)\s*\(')),
+        ('AIPS_Cache', re.compile(r'(?:cache|AIPS_Cache_Factory::\w+\s*\([^()]*\))\s*->\s*(?:get|remember|has)\s*\(')),
+        ('repository cache', re.compile(r'\bcache_read\s*\(')),
+    )
+
+    def numeric_member(self, feature: Dict, name: str) -> Optional[float]:
+        """Value of a class constant or property initialised to a number."""
+        match = re.search(r'(?:\bconst\s+|\$)' + re.escape(name) + r'\s*=\s*(\d+(?:\.\d+)?)\s*;', feature['_raw_content'])
+        return float(match.group(1)) if match else None
+
+    def numeric_value(self, feature: Dict, expr: str) -> Optional[float]:
+        """Resolve a PHP expression to a number when it is a literal or a class constant."""
+        expr = expr.strip()
+        if re.fullmatch(r'\d+(?:\.\d+)?', expr):
+            return float(expr)
+        member = re.fullmatch(r'(?:\(\w+\)\s*)?(self|static|AIPS_\w+)::(\w+)', expr)
+        if not member:
+            return None
+        owner = member.group(1)
+        if owner not in ('self', 'static'):
+            # Another class's constant resolves against that class's source
+            feature = self.features.get(owner)
+            if feature is None:
+                return None
+        return self.numeric_member(feature, member.group(2))
+
+    def http_timeout(self, feature: Dict, function: str, args: List[str], start: int, offset: int
+                     ) -> Tuple[Optional[float], str]:
+        """Timeout of an outbound call in seconds and where it comes from (argument, default or dynamic)."""
+        content = feature['_raw_content']
+        default = self.HTTP_FUNCTIONS[function]
+        if function == 'download_url':
+            if len(args) < 2:
+                return default, 'default'
+            value = self.numeric_value(feature, args[1])
+            return value, 'argument' if value is not None else 'dynamic'
+        if function == 'wp_ai_client_prompt':
+            # The provider raises the client's default through a filter around the call
+            before = content[start:offset]
+            if 'wp_ai_client_default_request_timeout' not in before:
+                return default, 'default'
+            constant = re.search(r'(?:self|static)::(\w*TIMEOUT\w*)', before)
+            value = self.numeric_member(feature, constant.group(1)) if constant else None
+            return value, 'filter' if value is not None else 'dynamic'
+        if len(args) < 2:
+            return default, 'default'
+        options = args[1]
+        variable = re.fullmatch(r'\$(\w+)', options)
+        if variable:
+            # Options built earlier in the method: $args = array(... 'timeout' => ...) or $args['timeout'] = ...
+            before = content[start:offset]
+            assigned = re.findall(r"\$" + variable.group(1) + r"\s*\[\s*'timeout'\s*\]\s*=\s*([^;]+);", before)
+            options = assigned[-1] if assigned else before
+            if assigned:
+                value = self.numeric_value(feature, options)
+                return value, 'argument' if value is not None else 'dynamic'
+        timeout = re.search(r"'timeout'\s*=>\s*([^,\)\]]+)", options)
+        if not timeout:
+            return default, 'default'
+        value = self.numeric_value(feature, timeout.group(1))
+        return value, 'argument' if value is not None else 'dynamic'
+
+    def outbound_callers(self) -> Dict[Tuple[str, str], Set[Tuple[str, str]]]:
+        """Reverse call graph: callers of each method, with interface calls reaching every implementation."""
+        callers = defaultdict(set)
+        implementors = defaultdict(list)
+        for class_name, feature in self.features.items():
+            for interface in feature.get('implements', []):
+                implementors[interface].append(class_name)
+        for caller, callees in self.call_graph.items():
+            for callee in callees:
+                targets = [(cn, callee[1]) for cn in implementors[callee[0]]] \
+                    if callee[0] in self.interfaces else [callee]
+                for target in targets:
+                    resolved = self.resolve_node(target)
+                    if resolved:
+                        callers[resolved].add(caller)
+        return callers
+
+    def analyze_http_calls(self):
+        """Inventory outbound requests and flag slow timeouts, missing caches and sequential fetch loops."""
+        self.http_calls = []
+        self.http_loops = []
+        self.http_findings = []
+        callers = self.outbound_callers()
+
+        def ancestors(node: Tuple[str, str]) -> Set[Tuple[str, str]]:
+            seen = {node}
+            pending = [node]
+            while pending:
+                for caller in callers.get(pending.pop(), ()):
+                    if caller not in seen:
+                        seen.add(caller)
+                        pending.append(caller)
+            return seen
+
+        handlers = defaultdict(set)
+        for entry in self.entry_points:
+            resolved = self.resolve_node(entry['handler'])
+            if resolved:
+                handlers[resolved].add(entry['kind'])
+
+        def cache_kinds(node: Tuple[str, str]) -> Set[str]:
+            source = self.method_source(*node)
+            if not source:
+                return set()
+            feature, start, end = source
+            body = feature['_raw_content'][start:end]
+            return {kind for kind, pattern in self.HTTP_CACHE_PATTERNS if pattern.search(body)}
+
+        loop_scopes = {owner: [scope[1:] for scope in self.find_loop_scopes(feature['_masked_content'])]
+                       for owner, feature in self.hook_sources()}
+        for owner, feature in self.hook_sources():
+            masked = feature['_masked_content']
+            starts = None
+            for name, _, start, end in feature['_method_scopes']:
+                for match in self.HTTP_CALL_PATTERN.finditer(masked, start, end):
+                    if masked[match.start() - 1] in '>:$':
+                        continue
+                    function = match.group(1)
+                    args = self.call_args(feature, match.end() - 1)
+                    timeout, source = self.http_timeout(feature, function, args, start, match.start())
+                    starts = starts or self.line_starts(feature['_raw_content'])
+                    node = (owner, name)
+                    reach = ancestors(node)
+                    cached = set().union(*(cache_kinds(n) for n in {node} | callers.get(node, set())))
+                    self.http_calls.append({
+                        'class': owner,
+                        'method': name,
+                        'function': function,
+                        'file': feature['file'],
+                        'line': self.line_number(starts, match.start()),
+                        'timeout': timeout,
+                        'timeout_source': source,
+                        'in_loop': any(scope <= match.start() < close and start <= keyword < end
+                                       for keyword, scope, close in loop_scopes[owner]),
+                        'cached': sorted(cached),
+                        'entry_kinds': sorted(set().union(*(handlers.get(n, set()) for n in reach)),
+                                              key=self.ENTRY_KINDS.index),
+                        'callers': len(reach) - 1,
+                    })
+
+        # Outbound call sites reachable from each method
+        reaches = defaultdict(list)
+        for call in self.http_calls:
+            for node in ancestors((call['class'], call['method'])):
+                reaches[node].append(call)
+
+        # Loops whose body issues an outbound call per iteration
+        for owner, feature in self.hook_sources():
+            masked = feature['_masked_content']
+            starts = None
+            for name, _, start, end in feature['_method_scopes']:
+                for keyword, body, close in loop_scopes[owner]:
+                    if not start <= keyword < end:
+                        continue
+                    direct = self.HTTP_CALL_PATTERN.search(masked, body, close)
+                    if direct and masked[direct.start() - 1] not in '>:$':
+                        calls, via = reaches[(owner, name)], None
+                    else:
+                        targets = sorted(filter(None, map(self.resolve_node,
+                                                          self.resolve_calls(owner, masked[body:close], feature))))
+                        via = next((t for t in targets if t in reaches and t != (owner, name)), None)
+                        if not via:
+                            continue
+                        calls = [c for t in targets if t != (owner, name) for c in reaches.get(t, ())]
+                    starts = starts or self.line_starts(feature['_raw_content'])
+                    self.http_loops.append({
+                        'class': owner,
+                        'method': name,
+                        'file': feature['file'],
+                        'line': self.line_number(starts, keyword),
+                        'via': via,
+                        'calls': calls,
+                    })
+
+        seen_loops = set()
+        for loop in self.http_loops:
+            key = (loop['class'], loop['method'], loop['via'])
+            if key in seen_loops:
+                continue
+            seen_loops.add(key)
+            functions = sorted({c['function'] for c in loop['calls']})
+            slowest = max(loop['calls'], key=lambda c: c['timeout'] or 0)
+            through = f" through `{loop['via'][0]}::{loop['via'][1]}()`" if loop['via'] else ""
+            self.http_findings.append({
+                'severity': 'warning',
+                'message': (
+                    f"`{loop['class']}::{loop['method']}()` can make outbound calls "
+                    f"({', '.join(f'`{f}()`' for f in functions)}) on every iteration of the loop at "
+                    f"{loop['file']}:{loop['line']}{through}, each waiting up to {self.format_timeout(slowest)} — "
+                    f"batch the requests (`Requests::request_multiple()`) or fan them out as separate jobs"
+                ),
+            })
+        for call in self.http_calls:
+            where = f"`{call['class']}::{call['method']}()` ({call['file']}:{call['line']})"
+            interactive = [k for k in call['entry_kinds'] if k in self.INTERACTIVE_ENTRY_KINDS]
+            if call['timeout_source'] == 'default' and call['function'] != 'wp_ai_client_prompt':
+                self.http_findings.append({
+                    'severity': 'info',
+                    'message': (
+                        f"{where} calls `{call['function']}()` without a timeout and inherits the "
+                        f"{self.format_timeout(call)} default — set one sized to the endpoint"
+                    ),
+                })
+            elif call['timeout'] is not None and call['timeout'] > self.HTTP_TIMEOUT_LIMIT:
+                self.http_findings.append({
+                    'severity': 'warning' if interactive else 'info',
+                    'message': (
+                        f"{where} allows `{call['function']}()` {self.format_timeout(call)}, over the "
+                        f"{self.HTTP_TIMEOUT_LIMIT} s limit"
+                        + (f"; reachable from {'/'.join(interactive)} requests, where a user waits on the worker"
+                           if interactive else "")
+                    ),
+                })
+            if interactive and not call['cached'] and call['function'] != 'wp_ai_client_prompt':
+                self.http_findings.append({
+                    'severity': 'info',
+                    'message': (
+                        f"{where} fetches without a cache layer on a path reachable from "
+                        f"{'/'.join(interactive)} requests — cache the response (transient or `AIPS_Cache`) "
+                        f"if it is not unique per request"
+                    ),
+                })
+
+    @staticmethod
+    def format_timeout(call: Dict) -> str:
+        """Human-readable timeout of an outbound call."""
+        if call['timeout'] is None:
+            return 'the client default' if call['timeout_source'] == 'default' else 'a computed timeout'
+        return f"{call['timeout']:g} s"
+
+    # ---------------------------------------------------------------
+    # Cache key cardinality
+    # ---------------------------------------------------------------
+
+    # Plugin-root files outside includes/ whose classes read or clear cached state
+    ROOT_CLASS_FILES = ('mcp-bridge.php',)
+
+    TIME_CONSTANTS = {
+        'MINUTE_IN_SECONDS': 60, 'HOUR_IN_SECONDS': 3600, 'DAY_IN_SECONDS': 86400,
+        'WEEK_IN_SECONDS': 604800, 'MONTH_IN_SECONDS': 2592000, 'YEAR_IN_SECONDS': 31536000,
+    }
+
+    # Cache calls: (store, pattern, argument index of the expiry by operation);
+    # the operation is the pattern's first group and the key its first argument
+    CACHE_KEY_CALLS = (
+        ('transient', re.compile(r'\b(set|get|delete)_(?:site_)?transient\s*\('), {'set': 2}),
+        ('object cache', re.compile(r'\bwp_cache_(set|add|replace|get|delete)\s*\('),
+         {'set': 3, 'add': 3, 'replace': 3}),
+        ('AIPS_Cache', re.compile(r'(?:\$\w*cache\w*|\$this->\w*cache\w*|AIPS_Cache_Factory::\w+\s*\([^()]*\))'
+                                  r'\s*->\s*(set|remember|get|has|delete)\s*\('), {'set': 2, 'remember': 1}),
+    )
+    CACHE_WRITE_OPS = frozenset(['set', 'add', 'replace', 'remember', 'read'])
+
+    # Placeholder names mapped to the entity they multiply keys by; unbounded
+    # entities grow with site content or traffic rather than plugin settings
+    KEY_CARDINALITY = (
+        (re.compile(r'md5|sha1|hash|crc32|serialize|json_encode'), 'input', False),
+        (re.compile(r'_only$|^is_|^has_'), 'flag', True),
+        (re.compile(r'time|_ts$|date|^from|^start'), 'timestamp', False),
+        (re.compile(r'post'), 'post', False),
+        (re.compile(r'user'), 'user', False),
+        (re.compile(r'schedule'), 'schedule', True),
+        (re.compile(r'author'), 'author', True),
+        (re.compile(r'template'), 'template', True),
+        (re.compile(r'option'), 'option', True),
+    )
+
+    # Assumed entity counts for the sizing model (a mid-sized site)
+    KEY_SCALE = {'post': 10000, 'user': 100, 'schedule': 50, 'author': 20, 'template': 50, 'option': 100,
+                 'flag': 2}
+    KEY_SCALE_DEFAULT = 50
+    KEY_ENTRY_BYTES = 1024
+
+    # Repository tiers that never reach the persistent cache
+    UNCACHED_STORES = frozenset(['repository (request)', 'repository (none)'])
+
+    def root_class_sources(self) -> List[Tuple[str, Dict]]:
+        """Classes declared in ``ROOT_CLASS_FILES``, as ``(owner, feature)`` pairs."""
+        sources = []
+        for name in self.ROOT_CLASS_FILES:
+            path = self.plugin_dir / name
+            if not path.exists():
+                continue
+            content = path.read_text(encoding='utf-8')
+            declared = re.search(r'^\s*class\s+(\w+)', content, re.MULTILINE)
+            if not declared:
+                continue
+            masked = self.mask_php(content)
+            sources.append((declared.group(1), {
+                'file': f"../{name}",
+                'class': declared.group(1),
+                '_raw_content': content,
+                '_masked_content': masked,
+                '_method_scopes': self.find_methods(masked),
+            }))
+        return sources
+
+    @staticmethod
+    def split_concatenation(expr: str) -> List[str]:
+        """Split a PHP expression on top-level ``.`` concatenation operators."""
+        parts, depth, quote, current = [], 0, None, ''
+        for index, char in enumerate(expr):
+            if quote:
+                current += char
+                if char == quote and expr[index - 1] != '\\':
+                    quote = None
+                continue
+            if char in '\'"':
+                quote = char
+            elif char in '([':
+                depth += 1
+            elif char in ')]':
+                depth -= 1
+            elif char == '.' and depth == 0 and not (expr[index - 1:index].isdigit()
+                                                     and expr[index + 1:index + 2].isdigit()):
+                parts.append(current)
+                current = ''
+                continue
+            current += char
+        parts.append(current)
+        return [part.strip() for part in parts]
+
+    def cache_key_pattern(self, feature: Dict, expr: str, start: int, offset: int, depth: int = 0) -> str:
+        """Render a cache key expression as a pattern with ``{name}`` placeholders for its variable parts."""
+        expr = expr.strip()
+        while re.fullmatch(r'\((?:int|string)\)\s*.+', expr):
+            expr = re.sub(r'^\((?:int|string)\)\s*', '', expr)
+        literal = self.resolve_string(feature, expr)
+        if literal is not None:
+            return literal
+        if depth > 3:
+            return '{' + re.sub(r'\W+', '_', expr).strip('_')[:24] + '}'
+        if expr.startswith('"') and expr.endswith('"'):
+            return re.sub(r'\{?\$(?:this->)?(\w+)\}?', r'{\1}', expr[1:-1])
+        parts = self.split_concatenation(expr)
+        if len(parts) > 1:
+            return ''.join(self.cache_key_pattern(feature, part, start, offset, depth + 1) for part in parts)
+        content = feature['_raw_content']
+        variable = re.fullmatch(r'\$(\w+)', expr)
+        if variable:
+            assigned = re.findall(r'\$' + variable.group(1) + r'\s*=\s*([^;]+);', content[start:offset])
+            if assigned and not re.search(r'\$' + variable.group(1) + r'\b|\?|\$\w+\s*\[', assigned[-1]):
+                return self.cache_key_pattern(feature, assigned[-1], start, offset, depth + 1)
+            return '{' + variable.group(1) + '}'
+        member = re.fullmatch(r'\$this->(\w+)', expr)
+        if member:
+            return '{' + member.group(1) + '}'
+        policy = re.fullmatch(r'AIPS_Cache_Policy::key\s*\((.*)\)', expr, re.DOTALL)
+        if policy and 'AIPS_Cache_Policy' in self.features:
+            args = self.split_arguments(policy.group(1))
+            owner = self.features['AIPS_Cache_Policy']
+            names = [self.resolve_string(owner, re.sub(r'^AIPS_Cache_Policy::', 'self::', a)) or '?' for a in args[:2]]
+            context = re.findall(r"'(\w+)'\s*=>", args[2]) if len(args) > 2 else []
+            return ':'.join(names + ['{' + name + '}' for name in context])
+        method = re.fullmatch(r'\$this->(\w+)\s*\((.*)\)', expr, re.DOTALL)
+        if method and feature.get('class') in self.features:
+            declared = self.class_methods(feature['class']).get(method.group(1))
+            if declared:
+                owner = self.features[declared[0]]
+                body = owner['_raw_content'][declared[1]:declared[2]]
+                returned = re.findall(r'\breturn\s+([^;]+);', body)
+                signature = owner['_raw_content'][:declared[1]]
+                params = re.findall(r'\$(\w+)', signature[signature.rindex('function'):])
+                if len(returned) == 1:
+                    pattern = self.cache_key_pattern(owner, returned[0], declared[1], declared[1] + len(body),
+                                                     depth + 1)
+                    for param, arg in zip(params, self.split_arguments(method.group(2))):
+                        pattern = pattern.replace('{' + param + '}', self.cache_key_pattern(
+                            feature, arg, start, offset, depth + 1))
+                    return pattern
+        call = re.fullmatch(r'(\w+)\s*\((.*)\)', expr, re.DOTALL)
+        if call:
+            inner = self.cache_key_pattern(feature, call.group(2), start, offset, depth + 1) if call.group(2).strip() else ''
+            if call.group(1) in ('absint', 'intval', 'sanitize_key', 'strval', 'sanitize_title'):
+                return inner
+            names = '_'.join(re.findall(r'\{(\w+)\}', inner))
+            return '{' + call.group(1) + (f"({names})" if names else '') + '}'
+        return '{' + re.sub(r'\W+', '_', expr).strip('_')[:24] + '}'
+
+    def split_arguments(self, args: str) -> List[str]:
+        """Split a raw PHP argument list on top-level commas."""
+        parts, depth, quote, current = [], 0, None, ''
+        for index, char in enumerate(args):
+            if quote:
+                if char == quote and args[index - 1] != '\\':
+                    quote = None
+            elif char in '\'"':
+                quote = char
+            elif char in '([{':
+                depth += 1
+            elif char in ')]}':
+                depth -= 1
+            elif char == ',' and depth == 0:
+                parts.append(current.strip())
+                current = ''
+                continue
+            current += char
+        if current.strip():
+            parts.append(current.strip())
+        return parts
+
+    def cache_expiry(self, feature: Dict, expr: Optional[str], start: int, offset: int) -> Tuple[Optional[int], str]:
+        """Expiry of a cache write in seconds (``0`` = never) and a label; ``None`` when computed at runtime."""
+        if expr is None:
+            return 0, 'never'
+        expr = expr.strip()
+        variable = re.fullmatch(r'\$(\w+)', expr)
+        if variable:
+            assigned = re.findall(r'\$' + variable.group(1) + r'\s*=\s*([^;]+);', feature['_raw_content'][start:offset])
+            expr = assigned[-1].strip() if assigned else expr
+        seconds = 1
+        for factor in re.split(r'\s*\*\s*', expr.strip('() ')):
+            factor = re.sub(r'^\(int\)\s*', '', factor)
+            if re.fullmatch(r'\d+', factor):
+                seconds *= int(factor)
+            elif factor in self.TIME_CONSTANTS:
+                seconds *= self.TIME_CONSTANTS[factor]
+            else:
+                return None, 'policy default' if 'default_ttl' in expr else 'computed'
+        return seconds, 'never' if seconds == 0 else self.format_duration(seconds)
+
+    @staticmethod
+    def format_duration(seconds: int) -> str:
+        """Compact duration, e.g. ``90 s``, ``10 min``, ``1 h``, ``1 d``."""
+        for unit, size in (('d', 86400), ('h', 3600), ('min', 60)):
+            if seconds >= size and seconds % size == 0:
+                return f"{seconds // size} {unit}"
+        return f"{seconds} s"
+
+    def key_cardinality(self, pattern: str) -> Tuple[str, Optional[int]]:
+        """Cardinality label of a key pattern and its entry count at ``KEY_SCALE`` (``None`` = unbounded)."""
+        placeholders = re.findall(r'\{([^}]+)\}', pattern)
+        if not placeholders:
+            return 'constant', 1
+        labels, entries = [], 1
+        for name in placeholders:
+            for rule, entity, bounded in self.KEY_CARDINALITY:
+                if rule.search(name.lower()):
+                    break
+            else:
+                entity, bounded = re.sub(r'_?ids?$', '', name) or name, True
+            labels.append(f"per-{entity}")
+            if entries is not None:
+                entries = entries * self.KEY_SCALE.get(entity, self.KEY_SCALE_DEFAULT) if bounded or entity in self.KEY_SCALE \
+                    else None
+        return ' × '.join(labels), entries
+
+    def repository_tier_ttls(self) -> Dict[str, int]:
+        """Default TTL in seconds of each repository cache tier (``AIPS_Repository_Cache_Config``)."""
+        config = self.features.get('AIPS_Repository_Cache_Config')
+        if not config:
+            return {}
+        ttls = {}
+        for tier, ttl in re.findall(r"self::TIER_(\w+)\s*=>\s*array\s*\([^;]*?'default_ttl'\s*=>\s*([^,]+),",
+                                    config['_raw_content']):
+            seconds, _ = self.cache_expiry(config, ttl, 0, 0)
+            if seconds is not None:
+                ttls[tier.lower()] = seconds
+        return ttls
+
+    def analyze_cache_keys(self):
+        """Inventory cache key patterns with expiry and cardinality, and flag unbounded or non-expiring keys."""
+        self.cache_keys = []
+        self.cache_key_findings = []
+        uses = []
+        for owner, feature in self.hook_sources() + self.root_class_sources():
+            if owner.startswith(('AIPS_Cache', 'AIPS_Repository_Cache')):
+                continue
+            masked = feature['_masked_content']
+            starts = None
+            for name, _, start, end in feature['_method_scopes']:
+                for store, pattern, expiry_index in self.CACHE_KEY_CALLS:
+                    for match in pattern.finditer(masked, start, end):
+                        if store != 'AIPS_Cache' and masked[match.start() - 1] in '>:$':
+                            continue
+                        args = self.call_args(feature, match.end() - 1)
+                        if not args:
+                            continue
+                        operation = match.group(1)
+                        index = expiry_index.get(operation)
+                        expiry = self.cache_expiry(feature, args[index] if index is not None and len(args) > index
+                                                   else None, start, match.start()) if index is not None else None
+                        starts = starts or self.line_starts(feature['_raw_content'])
+                        uses.append({
+                            'store': store,
+                            'operation': operation,
+                            'pattern': self.cache_key_pattern(feature, args[0], start, match.start()),
+                            'expiry': expiry,
+                            'location': f"{feature['file']}:{self.line_number(starts, match.start())}",
+                            'class': owner,
+                        })
+
+        # Repository reads key on the operation id plus the argument names
+        tier_ttls = self.repository_tier_ttls()
+        for class_name, coverage in self.cache_coverage.items():
+            feature = self.features[class_name]
+            group = self.resolve_string(feature, '$this->repository_cache_group()') or class_name
+            for read in coverage['cached']:
+                declared = self.class_methods(class_name).get(read['method'])
+                body = feature['_raw_content'][declared[1]:declared[2]] if declared else ''
+                call = re.search(r"cache_read\s*\(\s*'[\w.]+'\s*,\s*array\s*\(([^)]*)\)", body)
+                names = re.findall(r"'(\w+)'\s*=>", call.group(1)) if call else []
+                tier = read['tier'] or 'none'
+                ttl = tier_ttls.get(tier)
+                uses.append({
+                    'store': f"repository ({tier})",
+                    'operation': 'read',
+                    'pattern': ':'.join([group, read['operation']] + ['{' + n + '}' for n in names]),
+                    'expiry': (ttl, 'request' if tier == 'request' else
+                               'never' if not ttl else self.format_duration(ttl)) if ttl is not None else None,
+                    'location': f"{feature['file']}",
+                    'class': class_name,
+                })
+
+        keys = {}
+        for use in uses:
+            entry = keys.setdefault((use['store'], use['pattern']), {
+                'store': use['store'],
+                'pattern': use['pattern'],
+                'operations': set(),
+                'expiries': set(),
+                'locations': [],
+                'classes': set(),
+            })
+            entry['operations'].add(use['operation'])
+            if use['expiry']:
+                entry['expiries'].add(use['expiry'])
+            entry['locations'].append(use['location'])
+            entry['classes'].add(use['class'])
+        for entry in keys.values():
+            entry['cardinality'], entry['entries'] = self.key_cardinality(entry['pattern'])
+        self.cache_keys = sorted(keys.values(), key=lambda e: (e['entries'] is not None, -(e['entries'] or 0),
+                                                               e['store'], e['pattern']))
+
+        unbounded = defaultdict(list)
+        verbs = {'get': 'read', 'has': 'checked', 'delete': 'deleted'}
+        for entry in self.cache_keys:
+            key = f"`{entry['pattern']}` ({entry['store']}, {entry['locations'][0]})"
+            persistent = entry['store'] not in self.UNCACHED_STORES
+            never = any(seconds == 0 for seconds, _ in entry['expiries'])
+            if not entry['operations'] & self.CACHE_WRITE_OPS:
+                if re.fullmatch(r'(?:\{[^}]+\})+', entry['pattern']):
+                    continue
+                self.cache_key_findings.append({
+                    'severity': 'info',
+                    'message': (
+                        f"{key} is only {' and '.join(sorted(verbs.get(op, op) for op in entry['operations']))} and "
+                        f"never written — "
+                        f"a leftover key or one written outside the plugin"
+                    ),
+                })
+            elif never and persistent:
+                self.cache_key_findings.append({
+                    'severity': 'warning' if entry['store'] == 'transient' or entry['entries'] is None else 'info',
+                    'message': (
+                        f"{key} is written without an expiry"
+                        + (" — transients without one are autoloaded from `wp_options` on every request"
+                           if entry['store'] == 'transient' else " and stays until evicted or deleted")
+                        + (f"; with {entry['cardinality']} keys that set grows without bound"
+                           if entry['entries'] is None else "")
+                    ),
+                })
+            elif entry['entries'] is None and persistent:
+                unbounded[(entry['store'], entry['locations'][0], entry['cardinality'])].append(entry)
+
+        # Keys of one class sharing a store and cardinality are reported together
+        for (store, location, cardinality), entries in unbounded.items():
+            expiry = ', '.join(sorted({label for e in entries for _, label in e['expiries']})) or 'a computed expiry'
+            patterns = ', '.join(f"`{e['pattern']}`" for e in entries)
+            self.cache_key_findings.append({
+                'severity': 'info',
+                'message': (
+                    f"{patterns} ({store}, {location}) {'have' if len(entries) > 1 else 'has'} {cardinality} "
+                    f"cardinality — one entry per distinct value until it expires ({expiry}); bound the "
+                    f"values or keep the key out of the persistent cache"
+                ),
+            })
+
+    # ---------------------------------------------------------------
+    # Admin AJAX traffic
+    # ---------------------------------------------------------------
+
+    JS_NOISE_PATTERN = re.compile(
+        r"//[^\n]*|/\*.*?\*/|'(?:\\.|[^'\\\n])*'|\"(?:\\.|[^\"\\\n])*\"|`(?:\\.|[^`\\])*`",
+        re.DOTALL,
+    )
+
+    # Named functions: object-literal methods, declarations, assigned
+    # functions and arrows, and ES6 method shorthand
+    JS_FUNCTION_PATTERN = re.compile(
+        r'(\w+)\s*:\s*(?:async\s+)?function\s*\*?\s*\w*\s*\([^)]*\)\s*\{'
+        r'|\bfunction\s+(\w+)\s*\([^)]*\)\s*\{'
+        r'|\b(?:const|let|var)\s+(\w+)\s*=\s*(?:async\s*)?(?:function\s*\([^)]*\)|\([^)]*\)\s*=>|\w+\s*=>)\s*\{'
+        r'|(\w+)\s*:\s*(?:async\s*)?\([^)]*\)\s*=>\s*\{'
+        r'|^[ \t]*(?:async\s+)?(\w+)\s*\([^)]*\)\s*\{',
+        re.MULTILINE,
+    )
+    JS_KEYWORDS = frozenset(['if', 'for', 'while', 'switch', 'catch', 'function', 'return', 'with'])
+
+    # Callback arguments that run on user interaction rather than when reached
+    JS_EVENT_BINDING = re.compile(
+        r'\.(?:on|one|click|change|submit|keyup|keydown|input|blur|focus|addEventListener)\s*\(')
+    JS_ACTION_PATTERN = re.compile(r'\baction\s*:\s*([\w$.]+|\'[^\'\n]*\'|"[^"\n]*")')
+    JS_URL_ACTION_PATTERN = re.compile(r'[&?]action=(aips_\w+)')
+
+    # WordPress's default admin Heartbeat period, used when a script hooks
+    # heartbeat-tick without setting its own interval
+    HEARTBEAT_DEFAULT_SECONDS = 60
+
+    # Polls faster than this are flagged regardless of the handler's sinks
+    POLL_WARN_SECONDS = 15
+
+    @classmethod
+    def mask_js(cls, content: str) -> str:
+        """Blank out JavaScript comments and string/template contents, preserving offsets and newlines."""
+        def blank(match):
+            text = match.group(0)
+            kept = text[0] if text[0] in '\'"`' else ''
+            inner = text[len(kept):len(text) - len(kept)]
+            return kept + re.sub(r'[^\n]', ' ', inner) + kept
+        return cls.JS_NOISE_PATTERN.sub(blank, content)
+
+    def js_functions(self, masked: str) -> Tuple[List[Tuple[str, int, int]], Set[int]]:
+        """Named functions in masked JavaScript as ``(name, body_start, body_end)``, plus the name offsets."""
+        functions, declared = [], set()
+        for match in self.JS_FUNCTION_PATTERN.finditer(masked):
+            group = next(i for i, g in enumerate(match.groups(), 1) if g)
+            declared.add(match.start(group))
+            name = match.group(group)
+            if name in self.JS_KEYWORDS:
+                continue
+            functions.append((name, match.end() - 1, self.find_block_end(masked, match.end() - 1)))
+        return functions, declared
+
+    def js_callback_spans(self, masked: str, pattern) -> List[Tuple[int, int, int]]:
+        """Argument spans ``(match_start, args_start, args_end)`` of calls matching ``pattern``."""
+        spans = []
+        for match in pattern.finditer(masked):
+            spans.append((match.start(), match.end() - 1, self.find_block_end(masked, match.end() - 1, '(', ')')))
+        return spans
+
+    @staticmethod
+    def js_numbers(content: str, expr: str, depth: int = 0) -> List[float]:
+        """Numeric values an expression can take, following ``name = ...`` and ``name: ...`` definitions."""
+        expr = re.sub(r'parseInt\s*\(([^,()]+),\s*\d+\s*\)', r'\1', expr)
+        values = [float(v) for v in re.findall(r'(?<![\w.])(\d+(?:\.\d+)?)(?![\w.])', expr)]
+        if depth < 3:
+            for name in set(re.findall(r'(?<![\w$])([A-Za-z_]\w*)\b', expr)) - {'Math', 'max', 'min', 'this', 'self'}:
+                for match in re.finditer(r'\b' + name + r'\s*[:=](?!=)\s*', content):
+                    # The definition runs to the first top-level ``;``, ``,`` or line end
+                    level, end = 0, match.end()
+                    while end < len(content) and (level or content[end] not in ';,\n'):
+                        level += {'(': 1, ')': -1}.get(content[end], 0)
+                        if level < 0:
+                            break
+                        end += 1
+                    values.extend(FeatureScanner.js_numbers(content, content[match.end():end], depth + 1))
+        return values
+
+    def js_script_ajax(self, content: str) -> Dict:
+        """AJAX call sites in one admin script with their triggers and polling periods.
+
+        A call site is triggered on ``load`` when reached from top-level code
+        outside event-binding callbacks, on a ``timer`` or ``heartbeat`` when
+        reached from a setInterval callback, a self-rescheduling setTimeout or
+        a ``heartbeat-tick`` handler, and by a ``user`` event otherwise.
+        """
+        masked = self.mask_js(content)
+        functions, declared = self.js_functions(masked)
+        bindings = self.js_callback_spans(masked, self.JS_EVENT_BINDING)
+        names = {name for name, _, _ in functions}
+        starts = self.line_starts(content)
+
+        def innermost(offset: int) -> Optional[Tuple[str, int, int]]:
+            enclosing = [f for f in functions if f[1] <= offset < f[2]]
+            return max(enclosing, key=lambda f: f[1]) if enclosing else None
+
+        def in_binding(offset: int, floor: int) -> bool:
+            return any(floor <= start and args_start < offset < args_end for start, args_start, args_end in bindings)
+
+        def calls_in(start: int, end: int, skip_bindings: bool) -> Set[str]:
+            # Calls made directly in [start, end), not from nested named functions
+            called = set()
+            for match in re.finditer(r'(?<![\w$])(\w+)\s*\(', masked[start:end]):
+                offset = start + match.start()
+                if match.group(1) not in names or offset in declared:
+                    continue
+                owner = innermost(offset)
+                if owner and owner[1] > start:
+                    continue
+                if skip_bindings and in_binding(offset, start):
+                    continue
+                called.add(match.group(1))
+            return called
+
+        def closure(roots: Dict[str, float]) -> Dict[str, Tuple[float, str]]:
+            # Fastest period at which each function runs, and the periodic root it runs from
+            reached = {name: (period, name) for name, period in roots.items()}
+            pending = list(roots)
+            while pending:
+                name = pending.pop()
+                for _, start, end in (f for f in functions if f[0] == name):
+                    for callee in calls_in(start, end, True):
+                        if reached.get(callee, (float('inf'),))[0] > reached[name][0]:
+                            reached[callee] = reached[name]
+                            pending.append(callee)
+            return reached
+
+        # Periodic roots: setInterval callbacks, self-rescheduling setTimeouts, heartbeat-tick handlers
+        timer_roots = {}
+        timer_spans = []
+        for start, args_start, args_end in self.js_callback_spans(masked, re.compile(r'\bset(Interval|Timeout)\s*\(')):
+            args = self.split_arguments(content[args_start + 1:args_end - 1])
+            if len(args) < 2:
+                continue
+            periods = [v for v in self.js_numbers(content, args[-1]) if v > 0]
+            if not periods:
+                continue
+            period = min(periods) / 1000
+            called = calls_in(args_start, args_end, True) | set(re.findall(r'^(?:this\.|self\.)?(\w+)', args[0]))
+            owner = innermost(start)
+            if masked[start + 3:start + 11] == 'Interval':
+                timer_spans.append((args_start, args_end, period))
+                timer_roots.update({name: min(period, timer_roots.get(name, period)) for name in called & names})
+            elif owner and owner[0] in called:
+                timer_roots[owner[0]] = min(period, timer_roots.get(owner[0], period))
+        heartbeat_roots = {}
+        heartbeat = [v for match in re.finditer(r'wp\.heartbeat\.interval\s*\(([^)]+)\)', masked)
+                     for v in self.js_numbers(content, content[match.start(1):match.end(1)]) if v >= 1]
+        heartbeat_period = min(heartbeat) if heartbeat else self.HEARTBEAT_DEFAULT_SECONDS
+        for match in re.finditer(r"\.on\s*\(\s*'heartbeat-tick[\w.]*'\s*,", content):
+            close = self.find_block_end(masked, masked.index('(', match.start()), '(', ')')
+            for name in re.findall(r'(?:this\.|self\.)?(\w+)', content[match.end():close]):
+                if name in names:
+                    heartbeat_roots[name] = heartbeat_period
+        timers = closure(timer_roots)
+        heartbeats = closure(heartbeat_roots)
+
+        load = set()
+        pending = list(calls_in(0, len(masked), True))
+        while pending:
+            name = pending.pop()
+            if name in load:
+                continue
+            load.add(name)
+            for _, start, end in (f for f in functions if f[0] == name):
+                pending.extend(calls_in(start, end, True) - load)
+
+        sites = []
+        for match in list(self.JS_ACTION_PATTERN.finditer(masked)) + list(self.JS_URL_ACTION_PATTERN.finditer(content)):
+            offset = match.start()
+            if match.re is self.JS_ACTION_PATTERN:
+                value = content[match.start(1):match.end(1)]
+                if value[0] in '\'"':
+                    actions = [value[1:-1]]
+                else:
+                    variable = re.escape(value.split('.')[-1])
+                    actions = sorted(set(re.findall(
+                        r'\b' + variable + r'\s*[:=](?!=)[^;]*?[\'"](aips_\w+)[\'"]', content)))
+            else:
+                actions = [match.group(1)]
+            if not actions or any(not re.fullmatch(r'\w+', a) for a in actions):
+                continue
+            owner = innermost(offset)
+            floor = owner[1] if owner else 0
+            # Trigger → (fastest period in seconds, periodic root); ``None`` for load and user
+            triggers = {}
+            interval = next((period for a, b, period in timer_spans if a > floor and a < offset < b), None)
+            if interval is not None:
+                triggers['timer'] = (interval, owner[0] if owner else None)
+            elif in_binding(offset, floor):
+                triggers['user'] = None
+            elif not owner:
+                triggers['load'] = None
+            else:
+                if owner[0] in timers:
+                    triggers['timer'] = timers[owner[0]]
+                if owner[0] in heartbeats:
+                    triggers['heartbeat'] = heartbeats[owner[0]]
+                if owner[0] in load:
+                    triggers['load'] = None
+                if not triggers or owner[0] not in load:
+                    triggers.setdefault('user', None)
+            for action in actions:
+                sites.append({
+                    'action': action,
+                    'function': owner[0] if owner else None,
+                    'line': self.line_number(starts, offset),
+                    'triggers': triggers,
+                })
+        return {'sites': sites}
+
+    def analyze_admin_ajax(self):
+        """Map admin-script AJAX actions to PHP handlers and model per-screen request rates."""
+        self.ajax_calls = []
+        self.ajax_screens = {}
+        self.ajax_findings = []
+        handlers = defaultdict(list)
+        for entry in self.entry_points:
+            if entry['kind'] == 'ajax':
+                handlers[entry['trigger'][len('wp_ajax_'):]].append(entry)
+
+        scripts = {}
+        for (kind, handle), asset in self.asset_catalog.items():
+            path = self.plugin_dir / asset['path']
+            if kind != 'script' or '/vendor/' in asset['path'] or not path.exists():
+                continue
+            content = path.read_text(encoding='utf-8')
+            digest = self.content_digest(content)
+            if digest not in self.parsed_scripts:
+                self.parsed_scripts[digest] = self.js_script_ajax(content)
+            self.script_digests.add(digest)
+            scripts[handle] = self.parsed_scripts[digest]
+            for site in scripts[handle]['sites']:
+                entries = handlers.get(site['action'], [])
+                self.ajax_calls.append(dict(
+                    site,
+                    script=asset['path'],
+                    handle=handle,
+                    handlers=sorted({e['handler'] for e in entries}),
+                    sinks=sorted({effect for e in entries for effect in e['paths']}),
+                ))
+
+        for screen, assets in self.asset_screens.items():
+            if screen.startswith('*'):
+                continue
+            handles = {handle for kind, handle in assets['handles'] if kind == 'script'}
+            calls = [c for c in self.ajax_calls if c['handle'] in handles]
+            polls = defaultdict(lambda: {'period': None, 'actions': set(), 'sinks': set()})
+            for call in calls:
+                for trigger in ('timer', 'heartbeat'):
+                    if trigger in call['triggers']:
+                        period, root = call['triggers'][trigger]
+                        poll = polls[(call['handle'], trigger, root)]
+                        poll['period'] = period
+                        poll['actions'].add(call['action'])
+                        poll['sinks'].update(call['sinks'])
+            per_minute = 0.0
+            for (handle, trigger, _), poll in polls.items():
+                # Each Heartbeat tick is itself an admin-ajax request
+                per_minute += 60 / poll['period'] * (len(poll['actions']) + (trigger == 'heartbeat'))
+            self.ajax_screens[screen] = {
+                'load': sorted({c['action'] for c in calls if 'load' in c['triggers']}),
+                'user': len({c['action'] for c in calls if 'user' in c['triggers']}),
+                'polls': dict(polls),
+                'per_minute': per_minute,
+            }
+
+        unhandled = defaultdict(list)
+        for call in self.ajax_calls:
+            if not call['handlers']:
+                unhandled[call['action']].append(f"{call['script']}:{call['line']}")
+        for action, locations in sorted(unhandled.items()):
+            self.ajax_findings.append({
+                'severity': 'warning',
+                'message': (
+                    f"`{action}` is posted from {', '.join(locations)} but no `wp_ajax_{action}` handler is "
+                    f"registered — admin-ajax.php boots WordPress and answers `0`"
+                ),
+            })
+        seen = set()
+        for screen, row in sorted(self.ajax_screens.items()):
+            for (handle, trigger, function), poll in sorted(row['polls'].items(), key=lambda p: p[0][:2]):
+                key = (handle, trigger, function)
+                if key in seen:
+                    continue
+                seen.add(key)
+                screens = sorted(s for s, r in self.ajax_screens.items() if key in r['polls'])
+                heavy = sorted(poll['sinks'] & {'ai', 'http', 'db_write'})
+                fast = poll['period'] < self.POLL_WARN_SECONDS
+                self.ajax_findings.append({
+                    'severity': 'warning' if fast or heavy else 'info',
+                    'message': (
+                        f"{handle} polls {', '.join(f'`{a}`' for a in sorted(poll['actions']))} "
+                        f"{'on every Heartbeat tick' if trigger == 'heartbeat' else 'on a timer'} "
+                        f"({'via ' + function + '(), ' if function else ''}as often as every "
+                        f"{poll['period']:g} s) on {', '.join(f'`{s}`' for s in screens)}"
+                        + (f"; the handler reaches {', '.join(heavy)} sinks" if heavy else "")
+                        + (" — each open tab adds "
+                           f"{60 / poll['period'] * (len(poll['actions']) + (trigger == 'heartbeat')):g} "
+                           "admin-ajax requests per minute")
+                    ),
+                })
+
+    # ---------------------------------------------------------------
+    # Test impact
+    # ---------------------------------------------------------------
+
+    TESTS_DIR = 'tests'
+
+    # Plugin files every test loads; a change to any of them selects the full suite
+    TEST_RUN_ALL_FILES = frozenset([
+        'phpunit.xml', 'composer.json', 'composer.lock', 'tests/bootstrap.php',
+        'ai-post-scheduler.php', 'includes/class-aips-autoloader.php', 'includes/aips-classmap.php',
+    ])
+
+    PHP_COMMENT_PATTERN = re.compile(r"//[^\n]*|#[^\n]*|/\*.*?\*/|'(?:\\.|[^'\\])*'|\"(?:\\.|[^\"\\])*\"", re.DOTALL)
+
+    def test_files(self) -> List[Path]:
+        """PHPUnit test files under tests/, less the bootstrap and phpunit.xml ``<exclude>`` entries."""
+        tests_dir = self.plugin_dir / self.TESTS_DIR
+        if not tests_dir.exists():
+            return []
+        excluded = {'bootstrap.php', 'index.php'}
+        config = self.plugin_dir / 'phpunit.xml'
+        if config.exists():
+            excluded.update(Path(path).name for path in re.findall(
+                r'<exclude>\s*([^<]+?)\s*</exclude>', config.read_text(encoding='utf-8')))
+        return [path for path in sorted(tests_dir.glob('*.php')) if path.name not in excluded]
+
+    def index_tests(self) -> Dict[str, Dict]:
+        """Test case classes of each test file and the plugin classes it references, constructs and mocks.
+
+        Keyed by plugin-relative path. References are ``AIPS_*`` names outside
+        comments (class-name strings passed to mock builders count) plus class
+        files named by path.
+        """
+        known = set(self.features) | set(self.interfaces) | set(self.traits)
+        by_file = {f"includes/{entry['file']}": name
+                   for catalog in (self.features, self.interfaces, self.traits) for name, entry in catalog.items()}
+        index = {}
+        for path in self.test_files():
+            content = path.read_text(encoding='utf-8')
+            code = self.PHP_COMMENT_PATTERN.sub(
+                lambda m: m.group(0) if m.group(0)[0] in '\'"' else ' ', content)
+            referenced = set(re.findall(r'\b(AIPS_\w+)\b', code)) & known
+            referenced.update(name for file, name in by_file.items() if Path(file).name in code)
+            index[str(path.relative_to(self.plugin_dir))] = {
+                'classes': sorted(re.findall(r'^\s*(?:final\s+)?class\s+(\w+)\s+extends\s+[\w\\]*TestCase\b',
+                                             code, re.MULTILINE)),
+                'tests': len(re.findall(r'\bfunction\s+test\w*\s*\(', code)),
+                'referenced': sorted(referenced),
+                'constructed': sorted(set(re.findall(r'\bnew\s+(AIPS_\w+)', code)) & known),
+                'mocked': sorted(set(re.findall(
+                    r'(?:createMock|createStub|createPartialMock|getMockBuilder|getMockForAbstractClass)\s*\(\s*'
+                    r'[\'"]?(AIPS_\w+)', code)) & known),
+                'paths': sorted(set(re.findall(r'[\'"/]((?:templates|includes)/[\w/.-]+\.php|[\w-]+\.php)[\'"]', code))),
+            }
+        return index
+
+    def reverse_class_graph(self) -> Dict[str, Set[str]]:
+        """Classes, interfaces and traits mapped to the classes that depend on them.
+
+        A class depends on what it constructs, references statically
+        (``X::class`` container lookups included), type-hints, holds as a
+        typed property, extends, implements or uses as a trait. Hook dispatch
+        edges from the call graph are left out: following them would tie every
+        class that fires a shared event to every listener.
+        """
+        dependents = defaultdict(set)
+        for name, feature in self.features.items():
+            uses = set(feature['dependencies']) | set(feature.get('implements', [])) | set(feature.get('traits', []))
+            uses.update(self.property_types(feature).values())
+            if feature.get('extends'):
+                uses.add(feature['extends'])
+            for used in uses - {name}:
+                dependents[used].add(name)
+        return dependents
+
+    def select_tests(self, changed: List[str]) -> Dict:
+        """Tests affected by ``changed`` plugin-relative paths.
+
+        A test is selected when it references a changed class, or constructs
+        or mocks a direct dependent of one (``affected``). Dependents further
+        up the graph are returned as ``deeper``, and the tests reaching only
+        those as ``related``, without being selected: following the full
+        closure pulls in most of the suite for any repository change.
+
+        Returns the selected test files, the classes changed, affected and
+        deeper, why each test was picked, and ``run_all`` with its reason when
+        a change touches a file every test loads.
+        """
+        index = self.index_tests()
+        by_file = {f"includes/{entry['file']}": name
+                   for catalog in (self.features, self.interfaces, self.traits) for name, entry in catalog.items()}
+        result = {'run_all': None, 'changed': set(), 'affected': set(), 'deeper': set(), 'selected': {},
+                  'related': {}, 'untracked': []}
+        for path in changed:
+            if path in self.TEST_RUN_ALL_FILES:
+                result['run_all'] = path
+            elif path in index:
+                result['selected'][path] = 'changed'
+            elif path in by_file:
+                result['changed'].add(by_file[path])
+            elif path.endswith('.php'):
+                named = [test for test, entry in index.items()
+                         if any(p == path or Path(p).name == Path(path).name for p in entry['paths'])]
+                for test in named:
+                    result['selected'].setdefault(test, f"names {path}")
+                if not named:
+                    result['untracked'].append(path)
+        if result['run_all']:
+            result['selected'] = {test: f"{result['run_all']} changed" for test in index}
+            return result
+
+        dependents = self.reverse_class_graph()
+        changed_classes = result['changed']
+        affected = set().union(*(dependents.get(name, ()) for name in changed_classes)) - changed_classes
+        reached = changed_classes | affected
+        pending = list(affected)
+        while pending:
+            for dependent in dependents.get(pending.pop(), ()):
+                if dependent not in reached:
+                    reached.add(dependent)
+                    pending.append(dependent)
+        result['affected'] = affected
+        result['deeper'] = reached - changed_classes - affected
+        for test, entry in index.items():
+            if test in result['selected']:
+                continue
+            direct = sorted(set(entry['referenced']) & changed_classes)
+            built = sorted((set(entry['constructed']) | set(entry['mocked'])) & affected)
+            if direct:
+                result['selected'][test] = f"references {', '.join(direct)}"
+            elif built:
+                result['selected'][test] = (f"constructs or mocks {', '.join(built[:3])}"
+                                            f"{' …' if len(built) > 3 else ''} (depends on a changed class)")
+            else:
+                hits = sorted(set(entry['referenced']) & (affected | result['deeper']))
+                if hits:
+                    result['related'][test] = f"references {', '.join(hits[:3])}{' …' if len(hits) > 3 else ''}"
+        return result
+
+    @staticmethod
+    def phpunit_filter(index: Dict[str, Dict], tests: List[str]) -> str:
+        """A PHPUnit ``--filter`` pattern matching every test in the given files."""
+        classes = sorted({cls for test in tests for cls in index[test]['classes']})
+        return f"/^(?:{'|'.join(classes)})::/" if classes else ''
+
+    @staticmethod
+    def phpunit_suite(tests: List[str], name: str = 'Affected') -> str:
+        """A phpunit.xml ``<testsuite>`` block listing the given files."""
+        lines = [f'        <testsuite name="{name}">']
+        lines.extend(f'            <file>./{test}</file>' for test in tests)
+        lines.append('        </testsuite>')
+        return '\n'.join(lines)
+
+    # ---------------------------------------------------------------
+    # Autoload classmap
+    # ---------------------------------------------------------------
+
+    # Plugin-relative location read by AIPS_Autoloader::get_classmap()
+    CLASSMAP_FILE = 'includes/aips-classmap.php'
+
+    DECLARATION_PATTERN = re.compile(
+        r'^[ \t]*(?:(?:abstract|final|readonly)\s+)*(?:class|interface|trait|enum)\s+(AIPS_\w+)', re.MULTILINE
+    )
+
+    CLASSMAP_ENTRY_PATTERN = re.compile(r"'(AIPS_\w+)'\s*=>\s*'([^']+)'")
+
+    def build_classmap(self) -> Dict[str, str]:
+        """Every ``AIPS_*`` class, interface and trait under includes/, mapped to its plugin-relative file.
+
+        Unlike the feature scan this covers every declaration in a file, so
+        helper classes declared next to their main class are mapped too.
+        """
+        scanned = {feature['file']: feature['_masked_content'] for feature in self.features.values()}
+        classmap = {}
+        for php_file in sorted(self.includes_dir.rglob("*.php")):
+            masked = scanned.get(str(php_file.relative_to(self.includes_dir)))
+            if masked is None:
+                masked = self.mask_php(php_file.read_text(encoding='utf-8'))
+            for name in self.DECLARATION_PATTERN.findall(masked):
+                classmap.setdefault(name, php_file.relative_to(self.plugin_dir).as_posix())
+        return dict(sorted(classmap.items()))
+
+    def read_classmap(self) -> Optional[Dict[str, str]]:
+        """Entries of the committed classmap, or ``None`` when there is none."""
+        classmap_file = self.plugin_dir / self.CLASSMAP_FILE
+        if not classmap_file.exists():
+            return None
+        return dict(self.CLASSMAP_ENTRY_PATTERN.findall(classmap_file.read_text(encoding='utf-8')))
+
+    def classmap_drift(self, classmap: Dict[str, str]) -> Dict[str, List[str]]:
+        """Compare the committed classmap with ``classmap``.
+
+        ``stale`` entries name a class that is gone or has moved (the autoloader
+        would require the wrong file); ``missing`` classes fall back to probing.
+        """
+        committed = self.read_classmap() or {}
+        return {
+            'stale': [f"{name} => {path}" for name, path in committed.items() if classmap.get(name) != path],
+            'missing': [name for name in classmap if name not in committed],
+        }
+
+    def write_classmap(self, classmap: Dict[str, str]) -> bool:
+        """Write the classmap PHP file; returns False when it was already up to date."""
+        width = max(len(name) for name in classmap) + 2
+        lines = [
+            "<?php",
+            "/**",
+            " * Autoloader classmap",
+            " *",
+            " * Maps every AIPS_* class, interface and trait to its plugin-relative file",
+            " * so AIPS_Autoloader can require it without probing include directories.",
+            " * Generated by `python3 scripts/feature_scanner.py classmap` — do not edit;",
+            " * regenerate after adding, renaming or moving a class.",
+            " *",
+            " * @package AI_Post_Scheduler",
+            " */",
+            "",
+            "if (!defined('ABSPATH')) {",
+            "    exit;",
+            "}",
+            "",
+            "return array(",
+        ]
+        lines += [f"    {repr(name):<{width}} => '{path}'," for name, path in classmap.items()]
+        lines += [");", ""]
+        content = "\n".join(lines)
+
+        classmap_file = self.plugin_dir / self.CLASSMAP_FILE
+        if classmap_file.exists() and classmap_file.read_text(encoding='utf-8') == content:
+            return False
+        classmap_file.write_text(content, encoding='utf-8')
+        return True
+
     def categorize_features(self) -> Dict[str, List[str]]:
         """Categorize features into logical groups."""
         categories = {
@@ -576,6 +4011,17 @@ class FeatureScanner:
                 f"Consider refactoring — class has {feature['lines_of_code']} lines (may violate SRP)"
             )
 
+        # Check method complexity
+        complex_methods = sorted(
+            ((values[1], name) for name, values in feature.get('method_metrics', {}).items()
+             if values[1] > self.METRIC_THRESHOLDS['complexity']),
+            reverse=True,
+        )
+        if complex_methods:
+            improvements.append(
+                f"Split complex methods — {', '.join(f'`{name}()` (CCN {ccn})' for ccn, name in complex_methods[:3])}"
+            )
+
         # Check method count
         if len(feature['methods']) > 20:
             improvements.append(
@@ -631,64 +4077,220 @@ class FeatureScanner:
 
         return improvements[:8]  # Return top 8 suggestions
 
-    def generate_mermaid_flowchart(self, category: str, classes: List[str]) -> str:
-        """Generate a Mermaid flowchart for a feature category."""
-        chart = f"```mermaid\nflowchart TD\n"
-        chart += f"    %% {category} Architecture\n\n"
-        
-        # Track node types for styling
-        repository_nodes = []
-        service_nodes = []
-        controller_nodes = []
-        
-        # Create nodes
-        for class_name in classes:
-            feature = self.features.get(class_name, {})
-            # Keep underscores to avoid ID collisions and make nodes traceable
-            node_id = class_name.replace('AIPS_', '')
-            display_name = feature.get('name', class_name)
-            
-            # Use different shapes for different types
-            if 'Repository' in class_name:
-                chart += f"    {node_id}[(\"{display_name}\")]\n"
-                repository_nodes.append(node_id)
-            elif 'Controller' in class_name:
-                chart += f"    {node_id}[\"{display_name}\"]\n"
-                controller_nodes.append(node_id)
-            elif 'Service' in class_name:
-                chart += f"    {node_id}{{\"{display_name}\"}}\n"
-                service_nodes.append(node_id)
+    # Largest diagram drawn in one piece; bigger categories are partitioned
+    MERMAID_NODE_BUDGET = 20
+    MERMAID_EDGE_BUDGET = 40
+
+    MERMAID_CLASS_DEFS = (
+        "    classDef repository fill:#e1f5ff,stroke:#01579b,stroke-width:2px\n",
+        "    classDef service fill:#fff3e0,stroke:#e65100,stroke-width:2px\n",
+        "    classDef controller fill:#f3e5f5,stroke:#4a148c,stroke-width:2px\n",
+        "    classDef cycle fill:#ffebee,stroke:#b71c1c,stroke-width:2px,stroke-dasharray:4\n",
+        "    classDef external fill:#fafafa,stroke:#9e9e9e,stroke-dasharray:3\n",
+    )
+
+    @staticmethod
+    def strongly_connected_components(nodes: List[str], edges: Dict[str, Set[str]]) -> List[List[str]]:
+        """Tarjan's algorithm, iterative; components are returned in reverse topological order."""
+        index, low, on_stack = {}, {}, set()
+        stack, components = [], []
+        for root in nodes:
+            if root in index:
+                continue
+            work = [(root, iter(sorted(edges.get(root, ()))))]
+            index[root] = low[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                node, successors = work[-1]
+                advanced = False
+                for successor in successors:
+                    if successor not in index:
+                        index[successor] = low[successor] = len(index)
+                        stack.append(successor)
+                        on_stack.add(successor)
+                        work.append((successor, iter(sorted(edges.get(successor, ())))))
+                        advanced = True
+                        break
+                    if successor in on_stack:
+                        low[node] = min(low[node], index[successor])
+                if advanced:
+                    continue
+                work.pop()
+                if work:
+                    low[work[-1][0]] = min(low[work[-1][0]], low[node])
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(sorted(component))
+        return components
+
+    @staticmethod
+    def transitive_reduction(order: List[int], edges: Dict[int, Set[int]]) -> Dict[int, Set[int]]:
+        """Drop DAG edges implied by a longer path; ``order`` is a topological order of the nodes."""
+        reachable = {}
+        reduced = {}
+        for node in reversed(order):
+            successors = sorted(edges.get(node, ()), key=order.index)
+            kept, covered = set(), set()
+            for successor in successors:
+                if successor not in covered:
+                    kept.add(successor)
+                covered |= reachable[successor] | {successor}
+            # A successor reached through an earlier-ordered sibling is implied
+            reduced[node] = {s for s in kept if not any(s in reachable[k] for k in kept if k != s)}
+            reachable[node] = covered
+        return reduced
+
+    def condensed_dependency_graph(self, classes: List[str]) -> Tuple[List[List[str]], Dict[int, Set[int]], int]:
+        """Collapse dependency cycles among ``classes`` and transitively reduce the result.
+
+        Returns ``(components, edges, omitted)``: components in topological order
+        (dependents first), reduced edges between component indexes, and how many
+        condensed edges were implied by longer paths.
+        """
+        members = set(classes)
+        edges = {c: {d for d in self.class_dependencies.get(c, ()) if d in members and d != c} for c in classes}
+        components = list(reversed(self.strongly_connected_components(sorted(classes), edges)))
+        owner = {member: i for i, component in enumerate(components) for member in component}
+        condensed = defaultdict(set)
+        for source, targets in edges.items():
+            for target in targets:
+                if owner[source] != owner[target]:
+                    condensed[owner[source]].add(owner[target])
+        order = list(range(len(components)))
+        reduced = self.transitive_reduction(order, condensed)
+        omitted = sum(len(t) for t in condensed.values()) - sum(len(t) for t in reduced.values())
+        return components, reduced, omitted
+
+    def partition_graph(self, count: int, edges: Dict[int, Set[int]]) -> List[List[int]]:
+        """Split nodes ``0..count-1`` into parts within the node and edge budgets.
+
+        Connected clusters are grown breadth-first from each unassigned node in
+        topological order, then small clusters (isolated classes included) are
+        packed together first-fit so they do not each get a diagram.
+        """
+        neighbours = defaultdict(set)
+        for source, targets in edges.items():
+            for target in targets:
+                neighbours[source].add(target)
+                neighbours[target].add(source)
+        part_of, parts = {}, []
+        for seed in range(count):
+            if seed in part_of:
+                continue
+            part, part_edges = [], 0
+            queue = deque([seed])
+            while queue and len(part) < self.MERMAID_NODE_BUDGET:
+                node = queue.popleft()
+                if node in part_of:
+                    continue
+                added = sum(1 for n in neighbours[node] if part_of.get(n) == len(parts))
+                if part and part_edges + added > self.MERMAID_EDGE_BUDGET:
+                    continue
+                part_of[node] = len(parts)
+                part.append(node)
+                part_edges += added
+                queue.extend(n for n in sorted(neighbours[node]) if n not in part_of)
+            parts.append(sorted(part))
+
+        def edge_count(nodes: Set[int]) -> int:
+            return sum(1 for n in nodes for t in edges.get(n, ()) if t in nodes)
+
+        bins = []
+        for part in parts:
+            for packed in bins:
+                merged = packed | set(part)
+                if len(merged) <= self.MERMAID_NODE_BUDGET and edge_count(merged) <= self.MERMAID_EDGE_BUDGET:
+                    packed.update(part)
+                    break
             else:
-                chart += f"    {node_id}[\"{display_name}\"]\n"
-        
-        chart += "\n"
-        
-        # Create edges based on dependencies (sorted for deterministic output)
-        for class_name in classes:
-            source_id = class_name.replace('AIPS_', '')
-            dependencies = self.class_dependencies.get(class_name, set())
-
-            for dep in sorted(dependencies):
-                if dep in classes:  # Only show dependencies within this category
-                    target_id = dep.replace('AIPS_', '')
-                    chart += f"    {source_id} --> {target_id}\n"
-        
-        # Add styling definitions
-        chart += "\n    classDef repository fill:#e1f5ff,stroke:#01579b,stroke-width:2px\n"
-        chart += "    classDef service fill:#fff3e0,stroke:#e65100,stroke-width:2px\n"
-        chart += "    classDef controller fill:#f3e5f5,stroke:#4a148c,stroke-width:2px\n"
-        
-        # Apply styles to nodes
-        if repository_nodes:
-            chart += f"    class {','.join(repository_nodes)} repository\n"
-        if service_nodes:
-            chart += f"    class {','.join(service_nodes)} service\n"
-        if controller_nodes:
-            chart += f"    class {','.join(controller_nodes)} controller\n"
-        
-        chart += "```\n"
-        
-        return chart
+                bins.append(set(part))
+        return [sorted(packed) for packed in bins]
+
+    def generate_mermaid_flowchart(self, category: str, classes: List[str]) -> str:
+        """Generate Mermaid flowcharts for a feature category.
+
+        Dependency cycles are drawn as one node and edges implied by longer
+        paths are omitted. Categories over the node or edge budget are split
+        into several diagrams, each linking to the parts it depends on or is
+        used by through dotted ``Part N`` nodes.
+        """
+        components, edges, omitted = self.condensed_dependency_graph(classes)
+        parts = self.partition_graph(len(components), edges)
+        part_of = {node: i for i, part in enumerate(parts) for node in part}
+        node_ids = [component[0].replace('AIPS_', '') if len(component) == 1
+                    else "Cycle_" + component[0].replace('AIPS_', '') for component in components]
+
+        out = []
+        for number, part in enumerate(parts, 1):
+            if len(parts) > 1:
+                out.append(f"**Part {number} of {len(parts)}** — {len(part)} node(s)\n\n")
+            out.append("```mermaid\nflowchart TD\n")
+            out.append(f"    %% {category} Architecture"
+                       + (f" (part {number} of {len(parts)})" if len(parts) > 1 else "") + "\n")
+            if omitted and number == 1:
+                out.append(f"    %% {omitted} dependency edge(s) implied by longer paths omitted\n")
+            out.append("\n")
+
+            styled = defaultdict(list)
+            for node in part:
+                component = components[node]
+                node_id = node_ids[node]
+                if len(component) > 1:
+                    names = "<br/>".join(self.features.get(c, {}).get('name', c) for c in component)
+                    out.append(f"    {node_id}[\"Cycle:<br/>{names}\"]\n")
+                    styled['cycle'].append(node_id)
+                    continue
+                class_name = component[0]
+                display_name = self.features.get(class_name, {}).get('name', class_name)
+                # Use different shapes for different types
+                if 'Repository' in class_name:
+                    out.append(f"    {node_id}[(\"{display_name}\")]\n")
+                    styled['repository'].append(node_id)
+                elif 'Controller' in class_name:
+                    out.append(f"    {node_id}[\"{display_name}\"]\n")
+                    styled['controller'].append(node_id)
+                elif 'Service' in class_name:
+                    out.append(f"    {node_id}{{\"{display_name}\"}}\n")
+                    styled['service'].append(node_id)
+                else:
+                    out.append(f"    {node_id}[\"{display_name}\"]\n")
+
+            links, external = [], set()
+            for source in range(len(components)):
+                for target in sorted(edges.get(source, ())):
+                    inside = (part_of[source] == number - 1, part_of[target] == number - 1)
+                    if all(inside):
+                        links.append(f"    {node_ids[source]} --> {node_ids[target]}\n")
+                    elif inside[0]:
+                        external.add(part_of[target] + 1)
+                        links.append(f"    {node_ids[source]} -.-> Part{part_of[target] + 1}\n")
+                    elif inside[1]:
+                        external.add(part_of[source] + 1)
+                        links.append(f"    Part{part_of[source] + 1} -.-> {node_ids[target]}\n")
+            links = list(dict.fromkeys(links))
+            for other in sorted(external):
+                out.append(f"    Part{other}([\"Part {other}\"])\n")
+                styled['external'].append(f"Part{other}")
+            out.append("\n")
+            out.extend(links)
+
+            out.append("\n")
+            out.extend(self.MERMAID_CLASS_DEFS)
+            for style in ('repository', 'service', 'controller', 'cycle', 'external'):
+                if styled[style]:
+                    out.append(f"    class {','.join(styled[style])} {style}\n")
+            out.append("```\n")
+            if number < len(parts):
+                out.append("\n")
+
+        return "".join(out)
 
     def generate_detailed_architecture_diagram(self) -> str:
         """Generate a comprehensive architecture diagram showing all major components."""
@@ -732,41 +4334,22 @@ class FeatureScanner:
         chart += "    TEL -.-> SVC\n"
         chart += "    RES -.-> AI\n\n"
 
-        # Add subgraphs for each layer
+        # Add subgraphs for each layer, one node per category with its class count
         categories = self.categorize_features()
-
-        if 'User Interface & Admin' in categories:
-            chart += "    subgraph Controllers\n"
-            for cls in categories['User Interface & Admin'][:4]:
-                node_id = cls.replace('AIPS_', '').replace('_', '')
-                chart += f"        {node_id}\n"
-            chart += "    end\n\n"
-
-        svc_classes = []
-        for cat in ('AI Integration', 'Core Generation', 'Resilience & Reliability'):
-            svc_classes.extend(categories.get(cat, []))
-        if svc_classes:
-            chart += "    subgraph Services\n"
-            for cls in svc_classes[:4]:
-                node_id = cls.replace('AIPS_', '').replace('_', '')
-                chart += f"        {node_id}\n"
-            chart += "    end\n\n"
-
-        repo_classes = categories.get('Database & Repositories', [])
-        if repo_classes:
-            chart += "    subgraph Repositories\n"
-            for cls in repo_classes[:4]:
-                node_id = cls.replace('AIPS_', '').replace('_', '')
-                chart += f"        {node_id}\n"
-            chart += "    end\n\n"
-
-        infra_classes = (categories.get('Infrastructure & DI', [])
-                         + categories.get('Caching', []))
-        if infra_classes:
-            chart += "    subgraph Infrastructure\n"
-            for cls in infra_classes[:5]:
-                node_id = cls.replace('AIPS_', '').replace('_', '')
-                chart += f"        {node_id}\n"
+        layers = (
+            ('Controllers', ('User Interface & Admin',)),
+            ('Services', ('AI Integration', 'Core Generation', 'Resilience & Reliability')),
+            ('Repositories', ('Database & Repositories',)),
+            ('Infrastructure', ('Infrastructure & DI', 'Caching')),
+        )
+        for layer, layer_categories in layers:
+            present = [cat for cat in layer_categories if categories.get(cat)]
+            if not present:
+                continue
+            chart += f"    subgraph {layer}\n"
+            for cat in present:
+                node_id = 'CAT_' + re.sub(r'\W+', '_', cat)
+                chart += f"        {node_id}[\"{cat}<br/>{len(categories[cat])} class(es)\"]\n"
             chart += "    end\n\n"
 
         chart += "    Controllers --> Services\n"
@@ -874,8 +4457,19 @@ class FeatureScanner:
         report_lines.append("4. [Interface Contracts](#interface-contracts)\n")
         report_lines.append("5. [Feature Profiles](#feature-profiles)\n")
         report_lines.append("6. [Codebase Standards Compliance](#codebase-standards-compliance)\n")
-        report_lines.append("7. [Infrastructure Adoption](#infrastructure-adoption)\n")
-        report_lines.append("8. [Summary Statistics](#summary-statistics)\n\n")
+        report_lines.append("7. [Index Coverage](#index-coverage)\n")
+        report_lines.append("8. [Repository Cache Coverage](#repository-cache-coverage)\n")
+        report_lines.append("9. [Option Autoload Catalog](#option-autoload-catalog)\n")
+        report_lines.append("10. [Cron Load Model](#cron-load-model)\n")
+        report_lines.append("11. [Hot Paths](#hot-paths)\n")
+        report_lines.append("12. [Admin Asset Weight](#admin-asset-weight)\n")
+        report_lines.append("13. [Bootstrap Cost](#bootstrap-cost)\n")
+        report_lines.append("14. [Outbound HTTP](#outbound-http)\n")
+        report_lines.append("15. [Cache Key Cardinality](#cache-key-cardinality)\n")
+        report_lines.append("16. [Admin AJAX Traffic](#admin-ajax-traffic)\n")
+        report_lines.append("17. [Method Complexity](#method-complexity)\n")
+        report_lines.append("18. [Infrastructure Adoption](#infrastructure-adoption)\n")
+        report_lines.append("19. [Summary Statistics](#summary-statistics)\n\n")
 
         # Overview
         report_lines.append("## Overview\n\n")
@@ -950,6 +4544,20 @@ class FeatureScanner:
             report_lines.append("No interfaces found.\n")
         report_lines.append("\n")
 
+        if self.traits:
+            report_lines.append("### Traits\n\n")
+            report_lines.append("| Trait | File | Methods | Used By |\n")
+            report_lines.append("|-------|------|---------|---------|\n")
+            for trait_name in sorted(self.traits.keys()):
+                trait = self.traits[trait_name]
+                users = sorted(cn for cn, f in self.features.items()
+                               if trait_name in f.get('traits', []))
+                report_lines.append(
+                    f"| `{trait_name}` | `{trait['file']}` | {len(trait['methods'])} | "
+                    f"{len(users)} class(es) |\n"
+                )
+            report_lines.append("\n")
+
         # Feature Profiles
         report_lines.append("## Feature Profiles\n\n")
         report_lines.append(
@@ -1115,6 +4723,13 @@ class FeatureScanner:
                     '$wpdb queries should only appear in Repository or DB_Manager classes.'
                 ),
             },
+            'query_in_loop': {
+                'title': 'No Queries Inside Loops (N+1)',
+                'description': (
+                    '$wpdb, WP_Query/get_posts, *_meta and repository calls should not run '
+                    'once per loop iteration; fetch the data in one batched query instead.'
+                ),
+            },
         }
 
         for rule_key, rule_meta in standards_rules.items():
@@ -1138,6 +4753,548 @@ class FeatureScanner:
                     )
                 report_lines.append("\n")
 
+        # Index Coverage
+        report_lines.append("## Index Coverage\n\n")
+        report_lines.append(
+            "Filter and sort columns of repository SQL checked against the indexes declared in "
+            "`AIPS_DB_Manager::get_schema()`. An index serves a filter when it leads with a "
+            "filtered column, and a sort when the ORDER BY columns follow its equality-filtered "
+            "prefix.\n\n"
+        )
+        stats = self.index_query_stats
+        report_lines.append(
+            f"**Queries analyzed**: {stats['analyzed']} "
+            f"({stats['dynamic']} with interpolated WHERE/ORDER BY skipped)\n\n"
+        )
+
+        report_lines.append("### Index Catalog\n\n")
+        report_lines.append("| Table | Indexes |\n")
+        report_lines.append("|-------|---------|\n")
+        catalog_order = sorted(
+            self.index_catalog,
+            key=lambda t: (t not in self.INDEX_FOCUS_TABLES, t)
+        )
+        for table in catalog_order:
+            indexes = ", ".join(
+                f"`{name}` ({', '.join(cols)})"
+                for name, cols in self.index_catalog[table]['indexes'].items()
+            )
+            report_lines.append(f"| `{table}` | {indexes} |\n")
+        report_lines.append("\n")
+
+        report_lines.append("### Queries Without a Supporting Index\n\n")
+        if not self.index_gaps:
+            report_lines.append("**Status**: ✅ PASS\n\n")
+        else:
+            report_lines.append(f"**Status**: ⚠️ {len(self.index_gaps)} finding(s)\n\n")
+            report_lines.append("| Table | Class | Severity | Unindexed | Location |\n")
+            report_lines.append("|-------|-------|----------|-----------|----------|\n")
+            gaps = sorted(
+                self.index_gaps,
+                key=lambda g: (g['table'] not in self.INDEX_FOCUS_TABLES, g['table'], g['location'])
+            )
+            for gap in gaps:
+                if gap['kind'] == 'filter':
+                    detail = f"WHERE on {', '.join(gap['columns'])}"
+                else:
+                    detail = f"ORDER BY {', '.join(gap['columns'])}"
+                    if gap['filters']:
+                        detail += f" after filtering on {', '.join(gap['filters'])}"
+                report_lines.append(
+                    f"| `{gap['table']}` | `{gap['class']}` | {gap['severity']} | "
+                    f"{detail} | `{gap['location']}` |\n"
+                )
+            report_lines.append("\n")
+
+        # Repository Cache Coverage
+        report_lines.append("## Repository Cache Coverage\n\n")
+        report_lines.append(
+            "Public methods of repositories using `AIPS_Cacheable_Repository`, split into reads "
+            "served through `cache_read()` (with their policy tier), reads that query `$wpdb` "
+            "directly, and writes with (✅) or without (⚠️) a cache invalidation.\n\n"
+        )
+        report_lines.append("| Repository | Cached Reads | Uncached Reads | Writes |\n")
+        report_lines.append("|------------|--------------|----------------|--------|\n")
+        for class_name, coverage in self.cache_coverage.items():
+            cached = ", ".join(
+                f"`{r['method']}` ({r['tier'] or 'no policy'})" for r in coverage['cached']
+            ) or "—"
+            uncached = ", ".join(f"`{r['method']}`" for r in coverage['uncached']) or "—"
+            writes = ", ".join(
+                f"`{w['method']}` {'✅' if w['tags'] else '⚠️'}" for w in coverage['writes']
+            ) or "—"
+            report_lines.append(f"| `{class_name}` | {cached} | {uncached} | {writes} |\n")
+        report_lines.append("\n")
+
+        cache_rules = (
+            ('stale_risk', 'Stale Risk'),
+            ('missing_policy', 'Cached Reads Without a Policy'),
+            ('hot_uncached_read', 'Hot Reads Bypassing the Cache'),
+        )
+        for rule_key, title in cache_rules:
+            findings = [f for f in self.cache_findings if f['rule'] == rule_key]
+            status = "✅ PASS" if not findings else f"⚠️ {len(findings)} finding(s)"
+            report_lines.append(f"### {title}\n\n")
+            report_lines.append(f"**Status**: {status}\n\n")
+            if findings:
+                report_lines.append("| Class | Severity | Details |\n")
+                report_lines.append("|-------|----------|---------|\n")
+                for finding in findings:
+                    report_lines.append(
+                        f"| `{finding['class']}` | {finding['severity']} | {finding['message']} |\n"
+                    )
+                report_lines.append("\n")
+
+        # Option Autoload Catalog
+        report_lines.append("## Option Autoload Catalog\n\n")
+        report_lines.append(
+            "Every `aips_*` option written or read through `add_option()`, `update_option()`, "
+            "`get_option()`, `AIPS_Config` or the Settings API. Autoloaded options are loaded "
+            "on every request; `default` means no autoload argument was passed.\n\n"
+        )
+        report_lines.append("| Option | Autoload | Array | Writers | Readers | Hot Writes |\n")
+        report_lines.append("|--------|----------|-------|---------|---------|------------|\n")
+        for key, entry in self.option_catalog.items():
+            autoload = ", ".join(sorted(entry['autoload'])) or "—"
+            writers = ", ".join(sorted(w.replace('AIPS_', '') for w in entry['writers'])) or "—"
+            hot = []
+            if entry['cron_writes']:
+                hot.append(f"cron ×{len(entry['cron_writes'])}")
+            if entry['loop_writes']:
+                hot.append(f"loop ×{len(entry['loop_writes'])}")
+            report_lines.append(
+                f"| `{key}` | {autoload} | {'yes' if entry['array'] else ''} | {writers} | "
+                f"{len(entry['readers'])} | {', '.join(hot)} |\n"
+            )
+        report_lines.append("\n")
+
+        report_lines.append("### Autoload Recommendations\n\n")
+        if not self.option_findings:
+            report_lines.append("**Status**: ✅ PASS\n\n")
+        else:
+            report_lines.append(f"**Status**: ⚠️ {len(self.option_findings)} finding(s)\n\n")
+            report_lines.append("| Option | Severity | Recommendation | Reason |\n")
+            report_lines.append("|--------|----------|----------------|--------|\n")
+            for finding in sorted(self.option_findings, key=lambda x: (x['severity'] != 'warning', x['key'])):
+                report_lines.append(
+                    f"| `{finding['key']}` | {finding['severity']} | {finding['action']} | "
+                    f"{finding['reason']} |\n"
+                )
+            report_lines.append("\n")
+
+        # Cron Load Model
+        report_lines.append("## Cron Load Model\n\n")
+        report_lines.append(
+            "WP-Cron hooks grouped by recurrence. Recurring events come from `wp_schedule_event()` "
+            "and `get_cron_events()`; `single` events are queued by `wp_schedule_single_event()`, "
+            "`AIPS_Job_Scheduler` or Action Scheduler. Effects are collected over every method "
+            "the handler reaches.\n\n"
+        )
+        report_lines.append("| Recurrence | Interval (s) | Hook | Handler | AI | DB Writes | HTTP | Scheduled By |\n")
+        report_lines.append("|------------|--------------|------|---------|----|-----------|------|--------------|\n")
+        for row in self.cron_load:
+            handlers = "<br>".join(
+                f"`{cls.replace('AIPS_', '')}::{method}()`" for cls, method in row['handlers']
+            ) or "*(none)*"
+            scheduled_by = ", ".join(c.replace('AIPS_', '') for c in row['scheduled_by'])
+            if row['dispatch']:
+                scheduled_by += f" ({', '.join(row['dispatch'])})"
+            marks = ["✓" if effect in row['effects'] else "" for effect in ('ai', 'db_write', 'http')]
+            report_lines.append(
+                f"| {row['recurrence']} | {row['seconds'] or '—'} | `{row['hook']}` | {handlers} | "
+                f"{' | '.join(marks)} | {scheduled_by} |\n"
+            )
+        report_lines.append("\n")
+
+        report_lines.append("### Cron Findings\n\n")
+        if not self.cron_findings:
+            report_lines.append("**Status**: ✅ PASS\n\n")
+        else:
+            report_lines.append(f"**Status**: ⚠️ {len(self.cron_findings)} finding(s)\n\n")
+            for finding in self.cron_findings:
+                report_lines.append(f"- **{finding['severity']}**: {finding['message']}\n")
+            report_lines.append("\n")
+
+        # Hot Paths
+        report_lines.append("## Hot Paths\n\n")
+        report_lines.append(
+            "Method-level reachability from request entry points to expensive sinks. Calls resolve "
+            "through `$this->`, constructor type hints, `AIPS_Container` bindings, static calls and "
+            "`do_action()` callbacks; `ajax`, `rest` and `request` entry points run while a user "
+            "waits.\n\n"
+        )
+        report_lines.append("| Entry Kind | Entry Points | Reach AI | Reach HTTP | Reach DB Writes |\n")
+        report_lines.append("|------------|--------------|----------|------------|-----------------|\n")
+        for kind in self.ENTRY_KINDS:
+            entries = [e for e in self.entry_points if e['kind'] == kind]
+            if not entries:
+                continue
+            counts = [sum(1 for e in entries if effect in e['paths']) for effect in ('ai', 'http', 'db_write')]
+            report_lines.append(f"| {kind} | {len(entries)} | {' | '.join(map(str, counts))} |\n")
+        report_lines.append("\n")
+
+        report_lines.append("### Interactive Requests Reaching Slow Sinks\n\n")
+        if not self.hot_path_findings:
+            report_lines.append("**Status**: ✅ PASS\n\n")
+        else:
+            report_lines.append(
+                f"**Status**: ⚠️ {len(self.hot_path_findings)} entry point(s) call an AI provider or remote "
+                f"URL synchronously\n\n"
+            )
+            report_lines.append("| Severity | Sink | Kind | Trigger | Call Path | Sink Methods |\n")
+            report_lines.append("|----------|------|------|---------|-----------|--------------|\n")
+            for finding in self.hot_path_findings:
+                entry = finding['entry']
+                path = " → ".join(
+                    f"`{cls.replace('AIPS_', '')}::{method}()`" for cls, method in entry['paths'][finding['effect']]
+                )
+                report_lines.append(
+                    f"| {finding['severity']} | {finding['effect']} | {entry['kind']} | `{entry['trigger']}` | "
+                    f"{path} | {entry['sinks'][finding['effect']]} |\n"
+                )
+            report_lines.append("\n")
+
+        # Admin Asset Weight
+        report_lines.append("## Admin Asset Weight\n\n")
+        report_lines.append(
+            "Scripts and styles shipped per admin screen by `admin_enqueue_scripts` callbacks, including "
+            "plugin-local dependencies. Sizes are the unminified, uncompressed bytes on disk; core "
+            "handles such as `jquery` are not counted.\n\n"
+        )
+        screen_labels = {
+            self.ALL_ADMIN_SCREENS: "*(every admin screen)*",
+            self.ALL_PLUGIN_SCREENS: "*(every plugin screen)*",
+        }
+        report_lines.append("| Screen | Scripts | Styles | JS (KB) | CSS (KB) | Total (KB) | Screen-Specific (KB) |\n")
+        report_lines.append("|--------|---------|--------|---------|----------|------------|---------------------|\n")
+        for screen, data in sorted(self.asset_screens.items(),
+                                   key=lambda item: (-sum(item[1]['bytes'].values()), item[0])):
+            label = screen_labels.get(screen, f"`{screen}`")
+            scripts = sum(1 for kind, _ in data['handles'] if kind == 'script')
+            report_lines.append(
+                f"| {label} | {scripts} | {len(data['handles']) - scripts} | "
+                f"{data['bytes']['script'] / 1024:.1f} | {data['bytes']['style'] / 1024:.1f} | "
+                f"{sum(data['bytes'].values()) / 1024:.1f} | {data['specific_bytes'] / 1024:.1f} |\n"
+            )
+        report_lines.append("\n")
+
+        report_lines.append("### Asset Catalog\n\n")
+        report_lines.append("| Handle | Type | File | KB | Screens |\n")
+        report_lines.append("|--------|------|------|----|---------|\n")
+        for (kind, handle), asset in sorted(self.asset_catalog.items(), key=lambda item: -item[1]['bytes']):
+            screens = sum(1 for s, data in self.asset_screens.items()
+                          if not s.startswith('*') and (kind, handle) in data['handles'])
+            report_lines.append(
+                f"| `{handle}` | {kind} | {asset['path']} | {asset['bytes'] / 1024:.1f} | {screens} |\n"
+            )
+        report_lines.append("\n")
+
+        report_lines.append("### Asset Findings\n\n")
+        if not self.asset_findings:
+            report_lines.append("**Status**: ✅ PASS\n\n")
+        else:
+            report_lines.append(f"**Status**: ⚠️ {len(self.asset_findings)} finding(s)\n\n")
+            for finding in self.asset_findings:
+                report_lines.append(f"- **{finding['severity']}**: {finding['message']}\n")
+            report_lines.append("\n")
+
+        # Bootstrap Cost
+        report_lines.append("## Bootstrap Cost\n\n")
+        report_lines.append(
+            "Hook registrations and object construction performed while WordPress boots, followed from "
+            "the main plugin file through constructors, direct calls and the callbacks of hooks that fire "
+            "on every request. Estimated fires weight each registration by how often its hook runs per "
+            "request (`the_content` ~10, `gettext` ~500); event hooks count as 0.\n\n"
+        )
+        class_costs = self.bootstrap_class_costs()
+        report_lines.append("| Request | Classes Constructed | Registrations | Est. Callback Fires | Per-Item Hooks |\n")
+        report_lines.append("|---------|---------------------|---------------|---------------------|----------------|\n")
+        for context in self.REQUEST_CONTEXTS:
+            registered = [r for r in self.boot_registrations if context in r['registered_in']]
+            per_item = sorted({r['hook'] for r in registered
+                               if context in r['contexts'] and self.HOOK_FIRES.get(r['hook'], 0) > 1})
+            report_lines.append(
+                f"| {context} | {len(self.boot_constructed.get(context, {}))} | {len(registered)} | "
+                f"{sum(c['fires'][context] for c in class_costs)} | "
+                f"{', '.join(f'`{h}`' for h in per_item) or '—'} |\n"
+            )
+        report_lines.append("\n")
+        if self.ajax_controller_costs:
+            extra = sorted(c['registrations'] + c['constructed'] for c in self.ajax_controller_costs)
+            heaviest = self.ajax_controller_costs[0]
+            report_lines.append(
+                f"AJAX requests also construct the one controller `AIPS_Ajax_Registry` maps the action to "
+                f"({len(self.ajax_controller_costs)} controllers): a median of {extra[len(extra) // 2]} and at "
+                f"most {extra[-1]} extra registrations plus constructions, for "
+                f"`{heaviest['class']}` ({heaviest['registrations']} registrations, "
+                f"{heaviest['constructed']} classes).\n\n"
+            )
+
+        report_lines.append("### Classes by Bootstrap Work\n\n")
+        report_lines.append(
+            "| Class | Requests | Registrations (F/A/X/C) | Constructor | Method | Guarded | "
+            "Est. Fires | Per-Request Hooks |\n"
+        )
+        report_lines.append(
+            "|-------|----------|-------------------------|-------------|--------|---------|"
+            "------------|-------------------|\n"
+        )
+        for cost in class_costs[:20]:
+            report_lines.append(
+                f"| {cost['class']} | {', '.join(cost['contexts'])} | "
+                f"{'/'.join(str(cost['registrations'][c]) for c in self.REQUEST_CONTEXTS)} | "
+                f"{cost['constructor']} | {cost['method']} | {cost['guarded']} | "
+                f"{sum(cost['fires'].values())} | {', '.join(f'`{h}`' for h in sorted(cost['hooks'])) or '—'} |\n"
+            )
+        report_lines.append("\n")
+
+        report_lines.append("### Lazy-Loading Plan\n\n")
+        report_lines.append(
+            "Classes constructed while booting that nothing running on every request of that type uses: "
+            "they only serve event hooks (saves, scheduled events, a single AJAX action) or go unused. "
+            "`AIPS_Container` bindings are already lazy; these constructions come from `new` and "
+            "`::instance()` calls in boot paths and constructors. Counts include the dependencies the "
+            "class's constructor builds in turn.\n\n"
+        )
+        report_lines.append("| Request | Constructed at Boot | Needed per Request | Deferrable | Avoided |\n")
+        report_lines.append("|---------|---------------------|--------------------|------------|---------|\n")
+        for context in self.REQUEST_CONTEXTS:
+            total = len(self.boot_constructed.get(context, {}))
+            avoided = sum(entry['avoided'][context] for entry in self.lazy_plan)
+            report_lines.append(
+                f"| {context} | {total} | {total - avoided} | "
+                f"{sum(1 for entry in self.lazy_plan if entry['avoided'][context])} | "
+                f"{avoided} ({avoided * 100 // total if total else 0}%) |\n"
+            )
+        report_lines.append("\n")
+        if self.lazy_plan:
+            report_lines.append(
+                "| Service | Constructed By | Avoided (F/A/X/C) | Needed When | In Container | Plan |\n"
+            )
+            report_lines.append(
+                "|---------|----------------|-------------------|-------------|--------------|------|\n"
+            )
+            for entry in self.lazy_plan:
+                events = sorted(entry['events'])
+                needed_when = (', '.join(f'`{h}`' for h in events[:3]) + (f" +{len(events) - 3}" if len(events) > 3 else '')
+                               if events else '—')
+                if events:
+                    plan = "Register the hooks with a callback that resolves the service from the container when they fire"
+                elif entry['constructed_by'] == (self.bootstrap or {}).get('class'):
+                    plan = "Drop the boot-time construction; construct on first use"
+                else:
+                    plan = f"Build on first use in `{entry['constructed_by']}` rather than up front"
+                report_lines.append(
+                    f"| {entry['class']} | {entry['constructed_by'] or '—'} | "
+                    f"{'/'.join(str(entry['avoided'][c]) for c in self.REQUEST_CONTEXTS)} | {needed_when} | "
+                    f"{'yes' if entry['bound'] else 'no'} | {plan} |\n"
+                )
+            report_lines.append("\n")
+
+        report_lines.append("### Bootstrap Findings\n\n")
+        if not self.bootstrap_findings:
+            report_lines.append("**Status**: ✅ PASS\n\n")
+        else:
+            report_lines.append(f"**Status**: ⚠️ {len(self.bootstrap_findings)} finding(s)\n\n")
+            for finding in self.bootstrap_findings:
+                report_lines.append(f"- **{finding['severity']}**: {finding['message']}\n")
+            report_lines.append("\n")
+
+        # Outbound HTTP
+        report_lines.append("## Outbound HTTP\n\n")
+        report_lines.append(
+            "Every remote request the plugin makes, including AI client prompts. A PHP worker is blocked "
+            f"for up to the timeout on each call; timeouts over {self.HTTP_TIMEOUT_LIMIT} s and calls "
+            "repeated inside loops are what exhaust PHP-FPM pools under load. Cached means the calling "
+            "method or a direct caller reads through a transient, the object cache, `AIPS_Cache` or a "
+            "repository cache.\n\n"
+        )
+        report_lines.append("| Call | Location | Timeout | In Loop | Cached | Reached From | Upstream Methods |\n")
+        report_lines.append("|------|----------|---------|---------|--------|--------------|------------------|\n")
+        looped = {(c['class'], c['method'], c['line']) for loop in self.http_loops for c in loop['calls']}
+        for call in self.http_calls:
+            in_loop = 'direct' if call['in_loop'] else (
+                'caller' if (call['class'], call['method'], call['line']) in looped else '—')
+            report_lines.append(
+                f"| `{call['function']}()` | `{call['class']}::{call['method']}()` "
+                f"({call['file']}:{call['line']}) | {self.format_timeout(call)} ({call['timeout_source']}) | "
+                f"{in_loop} | {', '.join(call['cached']) or '—'} | {', '.join(call['entry_kinds']) or '—'} | "
+                f"{call['callers']} |\n"
+            )
+        report_lines.append("\n")
+
+        report_lines.append("### Outbound HTTP Findings\n\n")
+        if not self.http_findings:
+            report_lines.append("**Status**: ✅ PASS\n\n")
+        else:
+            report_lines.append(f"**Status**: ⚠️ {len(self.http_findings)} finding(s)\n\n")
+            for finding in self.http_findings:
+                report_lines.append(f"- **{finding['severity']}**: {finding['message']}\n")
+            report_lines.append("\n")
+
+        # Cache Key Cardinality
+        report_lines.append("## Cache Key Cardinality\n\n")
+        report_lines.append(
+            "Every transient, object-cache, `AIPS_Cache` and repository-cache key the plugin uses, as a "
+            "pattern with `{placeholders}` for its variable parts. Cardinality names what each placeholder "
+            "multiplies the key by; per-post, per-user, per-timestamp and hashed keys grow with site content "
+            "or traffic and are unbounded. Repository keys show the read arguments, not their values.\n\n"
+        )
+        report_lines.append("| Store | Key Pattern | Operations | Expiry | Cardinality | Est. Entries | Locations |\n")
+        report_lines.append("|-------|-------------|------------|--------|-------------|--------------|-----------|\n")
+        for entry in self.cache_keys:
+            locations = entry['locations'][:3]
+            if len(entry['locations']) > 3:
+                locations.append(f"+{len(entry['locations']) - 3} more")
+            entries = 'unbounded' if entry['entries'] is None else f"{entry['entries']:,}"
+            expiry = ', '.join(sorted(label for _, label in entry['expiries'])) or '—'
+            report_lines.append(
+                f"| {entry['store']} | `{entry['pattern']}` | {', '.join(sorted(entry['operations']))} | "
+                f"{expiry} | {entry['cardinality']} | {entries} | {', '.join(locations)} |\n"
+            )
+        report_lines.append("\n")
+
+        report_lines.append("### Object Cache Sizing\n\n")
+        scale = ', '.join(f"{count:,} {entity}s" for entity, count in self.KEY_SCALE.items() if entity != 'flag')
+        report_lines.append(
+            f"Entry counts assume {scale} and {self.KEY_SCALE_DEFAULT} values for any other placeholder, "
+            f"with {self.KEY_ENTRY_BYTES:,} bytes per entry. Repository keys in the request and none tiers "
+            "never reach the persistent cache and are left out.\n\n"
+        )
+        report_lines.append("| Store | Keys | Est. Entries | Est. Memory | Unbounded Keys |\n")
+        report_lines.append("|-------|------|--------------|-------------|----------------|\n")
+        stores = defaultdict(lambda: [0, 0, 0])
+        for entry in self.cache_keys:
+            if entry['store'] in self.UNCACHED_STORES:
+                continue
+            store = stores['repository' if entry['store'].startswith('repository') else entry['store']]
+            store[0] += 1
+            if entry['entries'] is None:
+                store[2] += 1
+            else:
+                store[1] += entry['entries']
+        for store, (keys, entries, unbounded) in sorted(stores.items()):
+            report_lines.append(
+                f"| {store} | {keys} | {entries:,} | {entries * self.KEY_ENTRY_BYTES / 1048576:.1f} MB | "
+                f"{unbounded or '—'} |\n"
+            )
+        total = sum(entries for _, entries, _ in stores.values())
+        report_lines.append(
+            f"| **Total** | **{sum(keys for keys, _, _ in stores.values())}** | **{total:,}** | "
+            f"**{total * self.KEY_ENTRY_BYTES / 1048576:.1f} MB** | "
+            f"**{sum(unbounded for _, _, unbounded in stores.values()) or '—'}** |\n\n"
+        )
+
+        report_lines.append("### Cache Key Findings\n\n")
+        if not self.cache_key_findings:
+            report_lines.append("**Status**: ✅ PASS\n\n")
+        else:
+            report_lines.append(f"**Status**: ⚠️ {len(self.cache_key_findings)} finding(s)\n\n")
+            for finding in self.cache_key_findings:
+                report_lines.append(f"- **{finding['severity']}**: {finding['message']}\n")
+            report_lines.append("\n")
+
+        # Admin AJAX Traffic
+        report_lines.append("## Admin AJAX Traffic\n\n")
+        report_lines.append(
+            "Actions the admin scripts post to admin-ajax.php, joined to the `wp_ajax_*` handler and the AI, "
+            "HTTP and database-write sinks it reaches. Every admin-ajax request boots WordPress in full, so "
+            "polling multiplies with each open tab. A call is triggered on load when top-level script code "
+            "reaches it outside an event binding, by a timer or Heartbeat tick when a `setInterval`, "
+            "self-rescheduling `setTimeout` or `heartbeat-tick` handler reaches it, and by the user otherwise; "
+            "load calls may sit behind a condition the scanner does not evaluate.\n\n"
+        )
+        report_lines.append("### Requests per Screen\n\n")
+        report_lines.append("| Screen | Load Requests | User Actions | Polling | Req/min per Tab |\n")
+        report_lines.append("|--------|---------------|--------------|---------|-----------------|\n")
+        for screen, row in sorted(self.ajax_screens.items(), key=lambda r: (-r[1]['per_minute'], r[0])):
+            polling = '; '.join(
+                f"{', '.join(f'`{a}`' for a in sorted(poll['actions']))} every {poll['period']:g} s ({trigger})"
+                for (_, trigger, _), poll in sorted(row['polls'].items())
+            ) or '—'
+            report_lines.append(
+                f"| `{screen}` | {len(row['load'])} | {row['user']} | {polling} | "
+                f"{row['per_minute']:g} |\n"
+            )
+        report_lines.append("\n")
+
+        report_lines.append("### Action Map\n\n")
+        report_lines.append("| Script | Action | Triggers | PHP Handler | Sinks | Lines |\n")
+        report_lines.append("|--------|--------|----------|-------------|-------|-------|\n")
+        actions = {}
+        for call in self.ajax_calls:
+            row = actions.setdefault((call['script'], call['action']), {
+                'triggers': set(), 'handlers': call['handlers'], 'sinks': call['sinks'], 'lines': []})
+            row['triggers'].update(call['triggers'])
+            row['lines'].append(call['line'])
+        for (script, action), row in sorted(actions.items()):
+            handlers = ', '.join(f"`{cls}::{method}()`" for cls, method in row['handlers']) or '⚠️ none'
+            report_lines.append(
+                f"| {Path(script).name} | `{action}` | {', '.join(sorted(row['triggers']))} | {handlers} | "
+                f"{', '.join(row['sinks']) or '—'} | {', '.join(map(str, row['lines']))} |\n"
+            )
+        report_lines.append("\n")
+
+        report_lines.append("### Admin AJAX Findings\n\n")
+        if not self.ajax_findings:
+            report_lines.append("**Status**: ✅ PASS\n\n")
+        else:
+            report_lines.append(f"**Status**: ⚠️ {len(self.ajax_findings)} finding(s)\n\n")
+            for finding in self.ajax_findings:
+                report_lines.append(f"- **{finding['severity']}**: {finding['message']}\n")
+            report_lines.append("\n")
+
+        # Method Complexity
+        report_lines.append("## Method Complexity\n\n")
+        ranked = self.ranked_methods()
+        report_lines.append(
+            f"Per-method metrics for {len(ranked)} methods. CCN is cyclomatic complexity (1 + branch "
+            f"points); nesting counts block depth inside the body. Entry points is how many request entry "
+            f"points reach the method (see [Hot Paths](#hot-paths)); Δ CCN compares with the cached "
+            f"previous run.\n\n"
+        )
+        report_lines.append("| Metric | Threshold | Methods Over |\n")
+        report_lines.append("|--------|-----------|--------------|\n")
+        for index, field in enumerate(self.METRIC_FIELDS):
+            over = sum(1 for _, _, values in ranked if values[index] > self.METRIC_THRESHOLDS[field])
+            report_lines.append(f"| {field} | {self.METRIC_THRESHOLDS[field]} | {over} |\n")
+        report_lines.append("\n")
+
+        def metric_row(class_name: str, name: str, values: Tuple[int, int, int, int]) -> str:
+            previous = self.previous_metrics.get(class_name, {}).get(name)
+            delta = '—' if previous is None else f"{values[1] - previous[1]:+d}"
+            return (
+                f"| `{class_name.replace('AIPS_', '')}::{name}()` | {values[0]} | {values[1]} | {values[2]} | "
+                f"{values[3]} | {self.method_entry_counts.get((class_name, name), 0)} | {delta} |\n"
+            )
+
+        report_lines.append("### Most Complex Hot Methods\n\n")
+        report_lines.append("Methods reached from at least one entry point, by complexity.\n\n")
+        report_lines.append("| Method | LOC | CCN | Nesting | Params | Entry Points | Δ CCN |\n")
+        report_lines.append("|--------|-----|-----|---------|--------|--------------|-------|\n")
+        hot = [row for row in ranked if self.method_entry_counts.get((row[0], row[1]))]
+        for class_name, name, values in hot[:25]:
+            report_lines.append(metric_row(class_name, name, values))
+        report_lines.append("\n")
+
+        report_lines.append("### Classes by Total Complexity\n\n")
+        report_lines.append("| Class | LOC | Methods | Total CCN | Max CCN | Methods Over Threshold |\n")
+        report_lines.append("|-------|-----|---------|-----------|---------|------------------------|\n")
+        class_totals = []
+        for class_name, feature in self.features.items():
+            values = list(feature['method_metrics'].values())
+            if not values:
+                continue
+            over = sum(1 for v in values if any(v[i] > self.METRIC_THRESHOLDS[field]
+                                                for i, field in enumerate(self.METRIC_FIELDS)))
+            class_totals.append((sum(v[1] for v in values), max(v[1] for v in values), over, class_name, feature))
+        for total, worst, over, class_name, feature in sorted(class_totals, key=lambda row: (-row[0], row[3]))[:15]:
+            report_lines.append(
+                f"| {feature['name']} | {feature['lines_of_code']} | {len(feature['method_metrics'])} | "
+                f"{total} | {worst} | {over} |\n"
+            )
+        report_lines.append("\n")
+
         # Infrastructure Adoption
         report_lines.append("## Infrastructure Adoption\n\n")
         report_lines.append(
@@ -1148,6 +5305,7 @@ class FeatureScanner:
             ('uses_container', 'AIPS_Container (DI)'),
             ('uses_config', 'AIPS_Config'),
             ('uses_cache', 'AIPS_Cache'),
+            ('uses_repository_cache', 'AIPS_Cacheable_Repository'),
             ('uses_ajax_response', 'AIPS_Ajax_Response'),
             ('uses_logger', 'AIPS_Logger'),
             ('uses_telemetry', 'AIPS_Telemetry'),
@@ -1274,6 +5432,984 @@ class FeatureScanner:
             print(f"✓ Feature report is up to date: {output_file}")
 
 
+class TrendStore:
+    """Append-only SQLite history of scan results, one run per row keyed by commit SHA.
+
+    Runs are only ever inserted; when a commit is scanned more than once the
+    latest run for that SHA is the one reported.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS runs (
+            id INTEGER PRIMARY KEY,
+            sha TEXT NOT NULL,
+            dirty INTEGER NOT NULL DEFAULT 0,
+            recorded_at TEXT NOT NULL,
+            runtime_ms INTEGER,
+            classes INTEGER,
+            interfaces INTEGER,
+            loc INTEGER,
+            dependencies INTEGER,
+            violations INTEGER
+        );
+        CREATE INDEX IF NOT EXISTS idx_runs_sha ON runs (sha);
+        CREATE TABLE IF NOT EXISTS class_metrics (
+            run_id INTEGER NOT NULL,
+            class TEXT NOT NULL,
+            loc INTEGER,
+            dependencies INTEGER,
+            violations INTEGER,
+            complexity INTEGER
+        );
+        CREATE INDEX IF NOT EXISTS idx_class_metrics_run ON class_metrics (run_id);
+        CREATE TABLE IF NOT EXISTS rule_counts (
+            run_id INTEGER NOT NULL,
+            rule TEXT NOT NULL,
+            count INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_rule_counts_run ON rule_counts (run_id);
+    """
+
+    RUN_METRICS = ('loc', 'classes', 'interfaces', 'dependencies', 'violations', 'runtime_ms')
+
+    def __init__(self, db_path: str):
+        self.db = sqlite3.connect(db_path)
+        self.db.executescript(self.SCHEMA)
+
+    def close(self):
+        """Close the underlying database connection."""
+        self.db.close()
+
+    @staticmethod
+    def rule_counts(scanner: 'FeatureScanner') -> Dict[str, int]:
+        """Finding counts by rule: standards rules plus one count per analyzer."""
+        counts = defaultdict(int)
+        for violations in scanner.standards_violations.values():
+            for violation in violations:
+                counts[violation['rule']] += 1
+        counts['index_gap'] = len(scanner.index_gaps)
+        for finding in scanner.cache_findings:
+            counts[f"cache_{finding['rule']}"] += 1
+        counts['option_autoload'] = len(scanner.option_findings)
+        counts['cron_load'] = len(scanner.cron_findings)
+        counts['hot_path'] = len(scanner.hot_path_findings)
+        counts['admin_asset'] = len(scanner.asset_findings)
+        counts['bootstrap'] = len(scanner.bootstrap_findings)
+        counts['lazy_service'] = len(scanner.lazy_plan)
+        counts['outbound_http'] = len(scanner.http_findings)
+        counts['cache_key'] = len(scanner.cache_key_findings)
+        counts['admin_ajax'] = len(scanner.ajax_findings)
+        return dict(counts)
+
+    def record(self, scanner: 'FeatureScanner', sha: str, dirty: bool, runtime_ms: int) -> int:
+        """Append one run and its per-class and per-rule rows; returns the run id."""
+        features = scanner.features
+        violations = {cn: len(v) for cn, v in scanner.standards_violations.items()}
+        with self.db:
+            cursor = self.db.execute(
+                "INSERT INTO runs (sha, dirty, recorded_at, runtime_ms, classes, interfaces, loc, dependencies, violations) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (sha, int(dirty), time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()), runtime_ms,
+                 len(features), len(scanner.interfaces), sum(f['lines_of_code'] for f in features.values()),
+                 sum(len(f['dependencies']) for f in features.values()), sum(violations.values()))
+            )
+            run_id = cursor.lastrowid
+            self.db.executemany(
+                "INSERT INTO class_metrics (run_id, class, loc, dependencies, violations, complexity) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(run_id, class_name, feature['lines_of_code'], len(feature['dependencies']),
+                  violations.get(class_name, 0), sum(v[1] for v in feature['method_metrics'].values()))
+                 for class_name, feature in features.items()]
+            )
+            self.db.executemany(
+                "INSERT INTO rule_counts (run_id, rule, count) VALUES (?, ?, ?)",
+                [(run_id, rule, count) for rule, count in sorted(self.rule_counts(scanner).items())]
+            )
+        return run_id
+
+    def latest_runs(self, limit: int) -> List[Dict]:
+        """The latest run of each of the ``limit`` most recently scanned commits, oldest first."""
+        rows = self.db.execute(
+            f"SELECT id, sha, dirty, recorded_at, {', '.join(self.RUN_METRICS)} FROM runs "
+            "WHERE id IN (SELECT MAX(id) FROM runs GROUP BY sha) ORDER BY id DESC LIMIT ?",
+            (limit,)
+        ).fetchall()
+        columns = ('id', 'sha', 'dirty', 'recorded_at') + self.RUN_METRICS
+        return [dict(zip(columns, row)) for row in reversed(rows)]
+
+    def series(self, table: str, key: str, value: str, run_ids: List[int]) -> Dict[str, Dict[int, int]]:
+        """``{key: {run_id: value}}`` from ``class_metrics`` or ``rule_counts`` for the given runs."""
+        placeholders = ", ".join("?" for _ in run_ids)
+        result = defaultdict(dict)
+        for run_id, name, amount in self.db.execute(
+                f"SELECT run_id, {key}, {value} FROM {table} WHERE run_id IN ({placeholders})", run_ids):
+            result[name][run_id] = amount
+        return result
+
+
+def sparkline(values: List[Optional[int]]) -> str:
+    """Render values as a one-line block chart; missing values are blank."""
+    bars = "▁▂▃▄▅▆▇█"
+    present = [v for v in values if v is not None]
+    if not present:
+        return ""
+    low, high = min(present), max(present)
+    span = (high - low) or 1
+    return "".join(" " if v is None else bars[(v - low) * (len(bars) - 1) // span] for v in values)
+
+
+def git_revision(repo_root: Path) -> Tuple[Optional[str], bool]:
+    """HEAD commit SHA and whether tracked files differ from it; ``(None, False)`` outside git."""
+    try:
+        sha = subprocess.run(["git", "rev-parse", "HEAD"], cwd=repo_root, capture_output=True,
+                             text=True, check=True).stdout.strip()
+        status = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=repo_root,
+                                capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None, False
+    return sha, bool(status.strip())
+
+
+def run_trend(args) -> int:
+    """Print per-metric deltas and sparklines across the recorded commits."""
+    if not Path(args.trend_db).exists():
+        print(f"No trend store at {args.trend_db} — run the scanner first")
+        return 1
+    store = TrendStore(args.trend_db)
+    try:
+        runs = store.latest_runs(args.limit)
+        if not runs:
+            print("Trend store is empty")
+            return 1
+        run_ids = [run['id'] for run in runs]
+        first, last = runs[0], runs[-1]
+        print(f"Scan trend over {len(runs)} commit(s): {first['sha'][:7]} ({first['recorded_at'][:10]}) → "
+              f"{last['sha'][:7]}{'+dirty' if last['dirty'] else ''} ({last['recorded_at'][:10]})\n")
+
+        def row(label: str, values: List[Optional[int]]):
+            known = [v for v in values if v is not None]
+            if not known:
+                return
+            previous = values[-2] if len(values) > 1 and values[-2] is not None else known[0]
+            latest = values[-1] if values[-1] is not None else 0
+            print(f"{label:<32} {known[0]:>9} {latest:>9} {latest - known[0]:>+8} {latest - previous:>+8}  "
+                  f"{sparkline(values)}")
+
+        print(f"{'Metric':<32} {'First':>9} {'Last':>9} {'Δ':>8} {'Δ prev':>8}  Trend")
+        print("-" * (70 + len(runs)))
+        for metric in TrendStore.RUN_METRICS:
+            row(metric, [run[metric] for run in runs])
+        rules = store.series('rule_counts', 'rule', 'count', run_ids)
+        for rule in sorted(rules):
+            row(f"rule:{rule}", [rules[rule].get(run_id, 0) for run_id in run_ids])
+
+        classes = store.series('class_metrics', 'class', 'loc', run_ids)
+        coupling = store.series('class_metrics', 'class', 'dependencies', run_ids)
+        growth = sorted(
+            ((values.get(last['id'], 0) - next(values[r] for r in run_ids if r in values), name)
+             for name, values in classes.items()),
+            reverse=True,
+        )
+        print("\nLargest LOC growth:")
+        for delta, name in growth[:args.top]:
+            if delta <= 0:
+                break
+            loc = [classes[name].get(run_id) for run_id in run_ids]
+            deps = coupling[name].get(last['id'])
+            print(f"  {name:<46} {delta:>+7} LOC  deps {deps if deps is not None else '—':>3}  {sparkline(loc)}")
+    finally:
+        store.close()
+    return 0
+
+
+PARSE_CACHE_VERSION = 1
+
+
+def load_parse_cache(cache_file: Path) -> Dict[str, Optional[Dict]]:
+    """Read the content-hash parse cache shared by batch runs; caches from another scanner revision start empty."""
+    if not cache_file.exists():
+        return {}
+    try:
+        cache = json.loads(cache_file.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if cache.get('version') != PARSE_CACHE_VERSION or cache.get('scanner') != SCANNER_HASH:
+        return {}
+    records = cache.get('files', {})
+    for record in records.values():
+        if record:
+            record['_method_scopes'] = [tuple(scope) for scope in record['_method_scopes']]
+            record['method_metrics'] = {name: tuple(values) for name, values in record['method_metrics'].items()}
+    return records
+
+
+def save_parse_cache(cache_file: Path, records: Dict[str, Optional[Dict]]):
+    """Persist the content-hash parse cache."""
+    cache_file.write_text(
+        json.dumps({'version': PARSE_CACHE_VERSION, 'scanner': SCANNER_HASH, 'files': records}, separators=(',', ':')),
+        encoding='utf-8',
+    )
+
+
+def parse_class_files(paths: List[str]) -> Dict[str, Optional[Dict]]:
+    """Batch worker: content-only parse records for class files, keyed by content hash."""
+    scanner = FeatureScanner('.')
+    records = {}
+    for path in paths:
+        content = Path(path).read_text(encoding='utf-8')
+        digest = scanner.content_digest(content)
+        records[digest] = scanner.parse_class_file(content, digest)
+    return records
+
+
+def scan_root(plugin_dir: str, output_dir: str, parsed_files: Dict[str, Optional[Dict]]) -> Dict:
+    """Batch worker: scan one plugin root, write its reports and return its summary row."""
+    started = time.perf_counter()
+    scanner = FeatureScanner(plugin_dir, parsed_files=parsed_files)
+    scanner.scan_all_files()
+    output = Path(output_dir)
+    output.mkdir(parents=True, exist_ok=True)
+    scanner.generate_report(str(output / "feature-report.md"))
+    scanner.generate_profiles_summary(str(output / "feature-report-feature-profiles.md"))
+    scanner.write_metrics_json(str(output / "feature-metrics.json"))
+    features = scanner.features
+    return {
+        'root': plugin_dir,
+        'classes': len(features),
+        'interfaces': len(scanner.interfaces),
+        'loc': sum(f['lines_of_code'] for f in features.values()),
+        'dependencies': sum(len(f['dependencies']) for f in features.values()),
+        'violations': sum(len(v) for v in scanner.standards_violations.values()),
+        'complex_methods': sum(
+            1 for _, _, values in scanner.ranked_methods()
+            if values[1] > FeatureScanner.METRIC_THRESHOLDS['complexity']
+        ),
+        'rules': TrendStore.rule_counts(scanner),
+        'hashes': dict(
+            {class_name: f['_metrics_hash'] for class_name, f in features.items()},
+            **({scanner.bootstrap['class']: scanner.content_digest(scanner.bootstrap['_raw_content'])}
+               if scanner.bootstrap else {})
+        ),
+        'runtime_ms': int((time.perf_counter() - started) * 1000),
+    }
+
+
+def write_batch_summary(output_file: Path, names: List[str], rows: List[Dict]):
+    """Write the cross-root comparison: headline metrics, rule counts and diverging classes."""
+    lines = [
+        "# Feature Scanner Batch Summary",
+        "",
+        f"{len(rows)} plugin root(s); deltas are relative to `{names[0]}`.",
+        "",
+        "| Root | Classes | LOC | Dependencies | Findings | Methods over CCN "
+        f"{FeatureScanner.METRIC_THRESHOLDS['complexity']} | Scan (ms) |",
+        "|------|---------|-----|--------------|----------|------------------|-----------|",
+    ]
+    base = rows[0]
+
+    def cell(row: Dict, key: str) -> str:
+        delta = row[key] - base[key]
+        return f"{row[key]} ({delta:+d})" if row is not base and delta else str(row[key])
+
+    for name, row in zip(names, rows):
+        lines.append(f"| `{name}` | {cell(row, 'classes')} | {cell(row, 'loc')} | {cell(row, 'dependencies')} | "
+                     f"{cell(row, 'violations')} | {cell(row, 'complex_methods')} | {row['runtime_ms']} |")
+
+    rules = sorted({rule for row in rows for rule in row['rules']})
+    lines += ["", "## Findings by Rule", "",
+              "| Rule | " + " | ".join(f"`{name}`" for name in names) + " |",
+              "|------|" + "---|" * len(names)]
+    for rule in rules:
+        lines.append(f"| `{rule}` | " + " | ".join(str(row['rules'].get(rule, 0)) for row in rows) + " |")
+
+    # Classes (and the main plugin file) missing from some roots or whose source differs between roots
+    classes = sorted({class_name for row in rows for class_name in row['hashes']})
+    diverging = []
+    for class_name in classes:
+        hashes = [row['hashes'].get(class_name) for row in rows]
+        if None in hashes or len(set(hashes)) > 1:
+            versions = {}
+            diverging.append((class_name, [
+                "—" if h is None else versions.setdefault(h, chr(ord('A') + len(versions))) for h in hashes
+            ]))
+    lines += ["", "## Diverging Classes", ""]
+    if diverging:
+        lines += ["Letters identify distinct source versions of a class; `—` means the root lacks it.", "",
+                  "| Class | " + " | ".join(f"`{name}`" for name in names) + " |",
+                  "|-------|" + "---|" * len(names)]
+        lines += [f"| `{class_name}` | " + " | ".join(versions) + " |" for class_name, versions in diverging]
+    else:
+        lines.append("Every class, including the main plugin file's, is identical across all roots.")
+
+    output_file.write_text("\n".join(lines) + "\n", encoding='utf-8')
+    print(f"✓ Batch summary written to: {output_file}")
+
+
+def run_batch(args) -> int:
+    """Scan several plugin roots concurrently with a shared content-hash parse cache."""
+    roots = [Path(root) for root in args.roots]
+    if args.manifest:
+        manifest = Path(args.manifest)
+        for line in manifest.read_text(encoding='utf-8').splitlines():
+            line = line.split('#', 1)[0].strip()
+            if line:
+                roots.append(manifest.parent / line)
+    roots = list(dict.fromkeys(root.resolve() for root in roots))
+    if not roots:
+        print("Error: no plugin roots given")
+        return 1
+    missing = [root for root in roots if not (root / "includes").is_dir()]
+    if missing:
+        for root in missing:
+            print(f"Error: {root} has no includes/ directory")
+        return 1
+
+    # Output directory per root: its directory name, prefixed by the parent's when ambiguous
+    counts = defaultdict(int)
+    for root in roots:
+        counts[root.name] += 1
+    names = [f"{root.parent.name}-{root.name}" if counts[root.name] > 1 else root.name for root in roots]
+
+    started = time.perf_counter()
+    cache_file = Path(args.parse_cache)
+    parsed_files = load_parse_cache(cache_file)
+    root_hashes = []
+    pending = {}
+    for root in roots:
+        hashes = set()
+        for path in sorted((root / "includes").rglob("class-aips-*.php")):
+            digest = FeatureScanner.content_digest(path.read_text(encoding='utf-8'))
+            hashes.add(digest)
+            if digest not in parsed_files:
+                pending.setdefault(digest, str(path))
+        root_hashes.append(hashes)
+    total = sum(len(hashes) for hashes in root_hashes)
+    print(f"Scanning {len(roots)} plugin root(s): {total} class files, {len(set().union(*root_hashes))} distinct, "
+          f"{len(pending)} to parse")
+
+    output_dir = Path(args.output)
+    workers = args.workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        paths = list(pending.values())
+        chunks = [paths[i::workers] for i in range(min(workers, len(paths)))]
+        for records in pool.map(parse_class_files, chunks):
+            parsed_files.update(records)
+        if pending:
+            save_parse_cache(cache_file, parsed_files)
+        futures = [
+            pool.submit(scan_root, str(root), str(output_dir / name),
+                        {digest: parsed_files[digest] for digest in hashes})
+            for root, name, hashes in zip(roots, names, root_hashes)
+        ]
+        rows = [future.result() for future in futures]
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    write_batch_summary(output_dir / "batch-summary.md", names, rows)
+    print(f"\nBatch scan complete in {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+def run_classmap(args, plugin_dir: Path) -> int:
+    """Write the AIPS_Autoloader classmap, or with ``--check`` report drift and exit non-zero."""
+    scanner = FeatureScanner(str(plugin_dir))
+    classmap = scanner.build_classmap()
+    if scanner.read_classmap() is not None:
+        drift = scanner.classmap_drift(classmap)
+        for entry in drift['stale']:
+            print(f"  stale:   {entry}")
+        for name in drift['missing']:
+            print(f"  missing: {name} => {classmap[name]}")
+    elif args.check:
+        print(f"No classmap at {plugin_dir / scanner.CLASSMAP_FILE}")
+        return 1
+
+    if args.check:
+        if drift['stale'] or drift['missing']:
+            print(f"Classmap is out of date ({len(drift['stale'])} stale, {len(drift['missing'])} missing) — "
+                  f"run `python3 scripts/feature_scanner.py classmap`")
+            return 1
+        print(f"✓ Classmap up to date ({len(classmap)} entries)")
+        return 0
+
+    if scanner.write_classmap(classmap):
+        print(f"✓ Classmap written to: {plugin_dir / scanner.CLASSMAP_FILE} ({len(classmap)} entries)")
+    else:
+        print(f"✓ Classmap unchanged: {plugin_dir / scanner.CLASSMAP_FILE}")
+    return 0
+
+
+class ScanServer:
+    """A long-lived scan answering JSON-RPC 2.0 queries.
+
+    Source files are fingerprinted by mtime and size at most once per
+    ``poll_interval`` seconds; when any changed, the plugin is rescanned with
+    the parse records of unchanged file contents reused, so only edited files
+    are parsed again. Queries between checks are answered from memory.
+    """
+
+    # JSON-RPC 2.0 error codes
+    PARSE_ERROR = -32700
+    INVALID_REQUEST = -32600
+    METHOD_NOT_FOUND = -32601
+    INVALID_PARAMS = -32602
+    INTERNAL_ERROR = -32603
+    NOT_FOUND = -32001
+
+    SOURCE_GLOBS = ('includes/**/*.php', '*.php', 'assets/js/*.js', 'tests/*.php', 'phpunit.xml')
+
+    class QueryError(Exception):
+        """A query failure reported to the client as a JSON-RPC error."""
+
+        def __init__(self, code: int, message: str):
+            super().__init__(message)
+            self.code = code
+
+    def __init__(self, plugin_dir: Path, poll_interval: float = 1.0):
+        self.plugin_dir = plugin_dir
+        self.poll_interval = poll_interval
+        self.parsed_files = {}
+        self.parsed_scripts = {}
+        self.scanner = None
+        self.fingerprint = None
+        self.checked_at = 0.0
+        self.scanned_at = None
+        self.scan_ms = 0
+        self.scans = 0
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.methods = {
+            'scan.status': self.status,
+            'scan.refresh': self.refresh_now,
+            'class.get': self.class_get,
+            'class.search': self.class_search,
+            'class.dependents': self.class_dependents,
+            'class.dependencies': self.class_dependencies,
+            'violations.list': self.violations_list,
+            'violations.rules': self.violations_rules,
+            'hooks.list': self.hooks_list,
+            'categories.list': self.categories_list,
+            'tests.select': self.tests_select,
+            'server.shutdown': self.shutdown,
+        }
+
+    def source_fingerprint(self) -> Dict[str, Optional[Tuple[int, int]]]:
+        """``{path: (mtime_ns, size)}`` for every file a scan reads."""
+        fingerprint = {}
+        for pattern in self.SOURCE_GLOBS:
+            for path in self.plugin_dir.glob(pattern):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    # Deleted since the glob listed it: record it so the tree counts as changed
+                    fingerprint[str(path)] = None
+                    continue
+                fingerprint[str(path)] = (stat.st_mtime_ns, stat.st_size)
+        return fingerprint
+
+    def refresh(self, force: bool = False) -> bool:
+        """Rescan if sources changed since the last scan (checked at most once per poll interval)."""
+        now = time.monotonic()
+        if not force and self.scanner is not None and now - self.checked_at < self.poll_interval:
+            return False
+        self.checked_at = now
+        fingerprint = self.source_fingerprint()
+        if not force and fingerprint == self.fingerprint:
+            return False
+        started = time.perf_counter()
+        scanner = FeatureScanner(str(self.plugin_dir), parsed_files=self.parsed_files,
+                                 parsed_scripts=self.parsed_scripts)
+        with contextlib.redirect_stdout(sys.stderr):
+            scanner.scan_all_files()
+        # Drop parse records of contents no longer on disk
+        live = {feature['_metrics_hash'] for feature in scanner.features.values()}
+        for digest in [d for d, record in self.parsed_files.items() if record and d not in live]:
+            del self.parsed_files[digest]
+        for digest in set(self.parsed_scripts) - scanner.script_digests:
+            del self.parsed_scripts[digest]
+        self.scanner = scanner
+        self.fingerprint = fingerprint
+        self.scanned_at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        self.scan_ms = int((time.perf_counter() - started) * 1000)
+        self.scans += 1
+        return True
+
+    @staticmethod
+    def matches_type(value, hint) -> bool:
+        """Whether a decoded JSON value fits a query method's parameter annotation."""
+        origin = get_origin(hint)
+        if origin is Union:
+            return any(ScanServer.matches_type(value, option) for option in get_args(hint))
+        if origin is list:
+            (item,) = get_args(hint)
+            return isinstance(value, list) and all(ScanServer.matches_type(v, item) for v in value)
+        if hint is type(None):
+            return value is None
+        if hint is int:
+            return isinstance(value, int) and not isinstance(value, bool)
+        return isinstance(value, hint)
+
+    def check_params(self, method, params: Dict):
+        """Raise ``INVALID_PARAMS`` unless ``params`` bind to ``method`` with the annotated types."""
+        try:
+            inspect.signature(method).bind(**params)
+        except TypeError as error:
+            raise self.QueryError(self.INVALID_PARAMS, f"Invalid params: {error}")
+        hints = get_type_hints(method)
+        for name, value in params.items():
+            if name in hints and not self.matches_type(value, hints[name]):
+                raise self.QueryError(self.INVALID_PARAMS, f"Invalid params: {name} has the wrong type")
+
+    def handle(self, line: str) -> Optional[str]:
+        """Answer one JSON-RPC request line; ``None`` for notifications."""
+        try:
+            request = json.loads(line)
+        except ValueError as error:
+            return self.error_response(None, self.PARSE_ERROR, f"Parse error: {error}")
+        if not isinstance(request, dict) or request.get('jsonrpc') != '2.0' or \
+                not isinstance(request.get('method'), str):
+            return self.error_response(request.get('id') if isinstance(request, dict) else None,
+                                       self.INVALID_REQUEST, "Invalid request")
+        request_id = request.get('id')
+        method = self.methods.get(request['method'])
+        params = request.get('params', {})
+        try:
+            if method is None:
+                raise self.QueryError(self.METHOD_NOT_FOUND, f"Unknown method: {request['method']}")
+            if not isinstance(params, dict):
+                raise self.QueryError(self.INVALID_PARAMS, "params must be an object")
+            self.check_params(method, params)
+            with self.lock:
+                if method != self.shutdown:
+                    self.refresh()
+                result = method(**params)
+        except self.QueryError as error:
+            return None if 'id' not in request else self.error_response(request_id, error.code, str(error))
+        except Exception as error:
+            # Keep serving: a failed query or rescan must not end the server
+            print(f"Error answering {request['method']}: {error!r}", file=sys.stderr)
+            return None if 'id' not in request else \
+                self.error_response(request_id, self.INTERNAL_ERROR, f"Internal error: {error}")
+        if 'id' not in request:
+            return None
+        return json.dumps({'jsonrpc': '2.0', 'id': request_id, 'result': result})
+
+    @staticmethod
+    def error_response(request_id, code: int, message: str) -> str:
+        """A JSON-RPC error response line."""
+        return json.dumps({'jsonrpc': '2.0', 'id': request_id, 'error': {'code': code, 'message': message}})
+
+    def feature(self, name: str) -> Dict:
+        """The scanned class, interface or trait called ``name``."""
+        scanner = self.scanner
+        for catalog in (scanner.features, scanner.interfaces, scanner.traits):
+            if name in catalog:
+                return catalog[name]
+        raise self.QueryError(self.NOT_FOUND, f"Unknown class: {name}")
+
+    def dependents_of(self, name: str, transitive: bool) -> List[str]:
+        """Classes depending on ``name``, directly or through the reverse dependency graph."""
+        graph = self.scanner.reverse_class_graph()
+        found = set(graph.get(name, ()))
+        pending = list(found) if transitive else []
+        while pending:
+            for dependent in graph.get(pending.pop(), ()):
+                if dependent not in found and dependent != name:
+                    found.add(dependent)
+                    pending.append(dependent)
+        return sorted(found)
+
+    # -- Query methods ------------------------------------------------
+
+    def status(self) -> Dict:
+        """Scan freshness and size."""
+        scanner = self.scanner
+        return {
+            'plugin_dir': str(self.plugin_dir),
+            'scanned_at': self.scanned_at,
+            'scan_ms': self.scan_ms,
+            'scans': self.scans,
+            'files': len(self.fingerprint or {}),
+            'classes': len(scanner.features),
+            'interfaces': len(scanner.interfaces),
+            'traits': len(scanner.traits),
+        }
+
+    def refresh_now(self) -> Dict:
+        """Rescan regardless of file fingerprints."""
+        self.refresh(force=True)
+        return self.status()
+
+    def class_get(self, name: str) -> Dict:
+        """Profile of one class: file, summary, methods, hooks, coupling and violations."""
+        feature = self.feature(name)
+        result = {key: feature[key] for key in ('name', 'file', 'summary', 'methods', 'lines_of_code') if key in feature}
+        if name in self.scanner.features:
+            result.update({
+                'kind': 'class',
+                'extends': feature['extends'],
+                'implements': feature.get('implements', []),
+                'traits': feature.get('traits', []),
+                'hooks': feature['hooks'],
+                'ajax_handlers': feature['ajax_handlers'],
+                'dependencies': feature['dependencies'],
+                'violations': self.scanner.standards_violations.get(name, []),
+            })
+        else:
+            result['kind'] = 'interface' if name in self.scanner.interfaces else 'trait'
+        result['dependents'] = self.dependents_of(name, False)
+        return result
+
+    def class_search(self, query: str, limit: int = 50) -> List[str]:
+        """Class, interface and trait names containing ``query`` (case-insensitive)."""
+        scanner = self.scanner
+        needle = query.lower()
+        names = sorted(n for catalog in (scanner.features, scanner.interfaces, scanner.traits)
+                       for n in catalog if needle in n.lower())
+        return names[:limit]
+
+    def class_dependents(self, name: str, transitive: bool = False) -> List[str]:
+        """Classes that depend on ``name``; with ``transitive`` the full reverse closure."""
+        self.feature(name)
+        return self.dependents_of(name, transitive)
+
+    def class_dependencies(self, name: str) -> List[str]:
+        """Classes ``name`` depends on directly."""
+        feature = self.feature(name)
+        if name not in self.scanner.features:
+            return []
+        uses = set(feature['dependencies']) | set(feature.get('implements', [])) | set(feature.get('traits', []))
+        uses.update(self.scanner.property_types(feature).values())
+        if feature.get('extends'):
+            uses.add(feature['extends'])
+        return sorted(uses - {name})
+
+    def violations_list(self, rule: Optional[str] = None, name: Optional[str] = None) -> List[Dict]:
+        """Standards violations, optionally for one rule and/or one class."""
+        return [dict(violation, **{'class': class_name})
+                for class_name, violations in sorted(self.scanner.standards_violations.items())
+                if name in (None, class_name)
+                for violation in violations if rule in (None, violation['rule'])]
+
+    def violations_rules(self) -> Dict[str, int]:
+        """Finding counts by rule: standards rules plus one count per analyzer."""
+        return TrendStore.rule_counts(self.scanner)
+
+    def hooks_list(self, hook: Optional[str] = None) -> Dict[str, List[str]]:
+        """``Class::method`` callbacks by hook name, optionally for one hook."""
+        return {name: [f"{cls}::{method}" for cls, method in sorted(set(callbacks))]
+                for name, callbacks in sorted(self.scanner.find_hook_callbacks().items())
+                if hook in (None, name)}
+
+    def categories_list(self) -> Dict[str, List[str]]:
+        """Feature categories and the classes in each."""
+        return {category: sorted(classes) for category, classes in self.scanner.categorize_features().items()
+                if classes}
+
+    def tests_select(self, files: List[str]) -> Dict:
+        """PHPUnit test files affected by the given plugin-relative paths."""
+        result = self.scanner.select_tests(files)
+        return {
+            'run_all': result['run_all'],
+            'changed': sorted(result['changed']),
+            'affected': sorted(result['affected']),
+            'deeper': sorted(result['deeper']),
+            'tests': {test: reason for test, reason in sorted(result['selected'].items())},
+            'related': {test: reason for test, reason in sorted(result['related'].items())},
+            'untracked': result['untracked'],
+        }
+
+    def shutdown(self) -> bool:
+        """Stop serving after this response."""
+        self.stopped.set()
+        return True
+
+    # -- Transports -----------------------------------------------------
+
+    def serve_stdio(self):
+        """Answer newline-delimited requests from stdin on stdout until EOF or shutdown."""
+        for line in sys.stdin:
+            if not line.strip():
+                continue
+            response = self.handle(line)
+            if response is not None:
+                sys.stdout.write(response + '\n')
+                sys.stdout.flush()
+            if self.stopped.is_set():
+                break
+
+    def serve_socket(self, path: str):
+        """Answer newline-delimited requests on a Unix socket, one thread per connection."""
+        server = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for raw in self.rfile:
+                    line = raw.decode('utf-8')
+                    if not line.strip():
+                        continue
+                    response = server.handle(line)
+                    if response is not None:
+                        self.wfile.write(response.encode('utf-8') + b'\n')
+                        self.wfile.flush()
+                    if server.stopped.is_set():
+                        break
+
+        if os.path.exists(path):
+            os.unlink(path)
+        with socketserver.ThreadingUnixStreamServer(path, Handler) as listener:
+            listener.daemon_threads = True
+            watcher = threading.Thread(target=lambda: (server.stopped.wait(), listener.shutdown()), daemon=True)
+            watcher.start()
+            try:
+                listener.serve_forever()
+            finally:
+                os.unlink(path)
+
+
+def run_serve(args, plugin_dir: Path) -> int:
+    """Run the query server on stdio or a Unix socket."""
+    server = ScanServer(plugin_dir, poll_interval=args.poll)
+    server.refresh(force=True)
+    print(f"Scan of {plugin_dir} loaded in {server.scan_ms} ms; "
+          f"serving JSON-RPC on {args.socket or 'stdio'}", file=sys.stderr)
+    try:
+        if args.socket:
+            server.serve_socket(args.socket)
+        else:
+            server.serve_stdio()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+class FindingsStore:
+    """The ``.aips-agent`` findings store: an event log, an index and one file per finding.
+
+    ``scan-log.ndjson`` is append-only. ``scan-index.json`` holds per-file
+    fingerprints (git blob SHA-1) and the open findings, and is rewritten each
+    run. A ``findings/<id>.json`` record is written only when its finding
+    opens, re-opens, changes or resolves, so a run over a mostly unchanged
+    tree touches a handful of files. Findings written here carry
+    ``"source": "feature_scanner"``; findings from other sources in the same
+    store are never resolved by a scan.
+    """
+
+    SOURCE = 'feature_scanner'
+    TRACKED_FIELDS = ('severity', 'summary', 'evidence')
+
+    def __init__(self, store_dir: Path, repo_root: Path):
+        self.store_dir = store_dir
+        self.repo_root = repo_root
+        self.index_file = store_dir / 'scan-index.json'
+        self.log_file = store_dir / 'scan-log.ndjson'
+        self.findings_dir = store_dir / 'findings'
+        if self.index_file.exists():
+            self.index = json.loads(self.index_file.read_text(encoding='utf-8'))
+        else:
+            self.index = {'schema_version': 1, 'repo': None, 'last_run_at': None, 'last_run_id': None,
+                          'ruleset_hash': None, 'files': {}, 'open_findings': {}}
+        self.index.setdefault('files', {})
+        self.index.setdefault('open_findings', {})
+
+    @staticmethod
+    def fingerprint(path: Path) -> str:
+        """Git blob SHA-1 of a file, matching ``git hash-object``."""
+        data = path.read_bytes()
+        return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+    def finding_record(self, finding_id: str) -> Optional[Dict]:
+        """The stored record for a finding, if it has one."""
+        path = self.findings_dir / f"{finding_id}.json"
+        return json.loads(path.read_text(encoding='utf-8')) if path.exists() else None
+
+    def sync(self, scanner: 'FeatureScanner', ruleset_hash: str, dry_run: bool = False) -> Dict[str, List]:
+        """Diff the scan's findings against the store and record the transitions.
+
+        Returns ``{'opened', 'reopened', 'changed', 'resolved', 'unchanged'}``
+        lists of finding dicts plus ``'selected_files'``, the scanned files
+        whose fingerprint differs from the index (all of them when the
+        ruleset changed).
+        """
+        now = time.gmtime()
+        at = time.strftime("%Y-%m-%dT%H:%M:%SZ", now)
+        # Random suffix: two syncs within one second must not share a run id
+        run_id = time.strftime("aips-%Y%m%dT%H%M%SZ", now) + '-' + os.urandom(3).hex()
+        index_files = self.index['files']
+        open_findings = self.index['open_findings']
+
+        scanned = {}
+        sources = [scanner.includes_dir / f['file'] for f in
+                   list(scanner.features.values()) + list(scanner.interfaces.values()) + list(scanner.traits.values())]
+        main_file = FeatureScanner.main_plugin_file(scanner.plugin_dir)
+        if main_file:
+            sources.append(main_file)
+        for source in sources:
+            if source.exists():
+                relative = os.path.normpath(os.path.relpath(source, self.repo_root)).replace(os.sep, '/')
+                scanned[relative] = self.fingerprint(source)
+        ruleset_changed = ruleset_hash != self.index.get('ruleset_hash')
+        selected = sorted(path for path, fingerprint in scanned.items()
+                          if ruleset_changed or index_files.get(path, {}).get('fingerprint') != fingerprint)
+
+        transitions = {'opened': [], 'reopened': [], 'changed': [], 'resolved': [], 'unchanged': [],
+                       'selected_files': selected}
+        current = {finding['id']: finding for finding in scanner.violation_findings()}
+        writes = {}
+        for finding_id, finding in current.items():
+            entry = open_findings.get(finding_id)
+            record = None if entry else self.finding_record(finding_id)
+            if entry:
+                record = self.finding_record(finding_id) or dict(entry)
+                if all(record.get(field) == finding[field] for field in self.TRACKED_FIELDS):
+                    transitions['unchanged'].append(finding)
+                    entry['last_seen_run_id'] = run_id
+                    continue
+                transitions['changed'].append(finding)
+            elif record:
+                transitions['reopened'].append(finding)
+            else:
+                transitions['opened'].append(finding)
+            previous = record or {}
+            writes[finding_id] = dict(finding, status='open', source=self.SOURCE,
+                                      first_seen_run_id=previous.get('first_seen_run_id', run_id),
+                                      last_seen_run_id=run_id)
+
+        for finding_id, entry in list(open_findings.items()):
+            if entry.get('source') != self.SOURCE or finding_id in current:
+                continue
+            record = self.finding_record(finding_id) or dict(entry)
+            transitions['resolved'].append(record)
+            writes[finding_id] = dict(record, status='resolved', resolved_by=run_id, resolved_at=at,
+                                      resolution='No longer reported by the feature scanner')
+
+        if dry_run:
+            return transitions
+
+        events = [{'event': 'run_start', 'run_id': run_id, 'at': at, 'ruleset_hash': ruleset_hash,
+                   'repo': self.index.get('repo'), 'selected_files': selected}]
+        self.findings_dir.mkdir(parents=True, exist_ok=True)
+        for finding_id, record in writes.items():
+            (self.findings_dir / f"{finding_id}.json").write_text(
+                json.dumps(record, indent=2) + "\n", encoding='utf-8')
+            event = {'event': 'finding_upsert' if record['status'] == 'open' else 'finding_resolved',
+                     'run_id': run_id, 'at': at, 'finding_id': finding_id}
+            event.update({key: record.get(key) for key in ('type', 'path', 'symbol', 'anchor', 'severity', 'status')})
+            events.append(event)
+            if record['status'] == 'open':
+                open_findings[finding_id] = {
+                    key: record.get(key) for key in ('id', 'type', 'severity', 'path', 'symbol', 'anchor', 'status',
+                                                     'source', 'first_seen_run_id', 'last_seen_run_id')}
+                open_findings[finding_id]['finding_file'] = \
+                    os.path.relpath(self.findings_dir / f"{finding_id}.json", self.repo_root).replace(os.sep, '/')
+            else:
+                open_findings.pop(finding_id, None)
+
+        open_by_path = defaultdict(int)
+        for entry in open_findings.values():
+            open_by_path[entry.get('path')] += 1
+        for path, fingerprint in scanned.items():
+            index_files[path] = {
+                'fingerprint': fingerprint,
+                'last_scanned_at': at,
+                'last_scan_run_id': run_id,
+                'findings_open_count': open_by_path[path],
+                'status': 'has_findings' if open_by_path[path] else 'ok',
+            }
+        events.append({'event': 'run_end', 'run_id': run_id, 'at': at, 'scanned_file_count': len(scanned),
+                       'open_findings_count': len(open_findings)})
+        self.index.update(last_run_at=at, last_run_id=run_id, ruleset_hash=ruleset_hash)
+
+        with open(self.log_file, 'a', encoding='utf-8') as log:
+            for event in events:
+                log.write(json.dumps(event, separators=(',', ':')) + "\n")
+        temporary = self.index_file.with_suffix('.json.tmp')
+        temporary.write_text(json.dumps(self.index, indent=2) + "\n", encoding='utf-8')
+        os.replace(temporary, self.index_file)
+        return transitions
+
+
+def run_findings(args, repo_root: Path, plugin_dir: Path) -> int:
+    """Sync standards violations into the findings store and print the transitions."""
+    scanner = FeatureScanner(str(plugin_dir))
+    with contextlib.redirect_stdout(sys.stderr):
+        scanner.scan_all_files()
+    store = FindingsStore(Path(args.store), repo_root)
+    transitions = store.sync(scanner, SCANNER_HASH, dry_run=args.dry_run)
+
+    selected = transitions['selected_files']
+    print(f"{len(selected)} file(s) changed since the last sync{' (dry run)' if args.dry_run else ''}")
+    for label in ('opened', 'reopened', 'changed', 'resolved'):
+        findings = transitions[label]
+        print(f"{label.capitalize():<10} {len(findings):>4}")
+        for finding in findings if args.verbose else []:
+            print(f"  {finding['id'][:12]} {finding['severity']:<6} {finding['type']:<16} {finding['symbol']}")
+    print(f"{'Unchanged':<10} {len(transitions['unchanged']):>4}")
+    return 0
+
+
+def changed_files(args, repo_root: Path, plugin_dir: Path) -> Optional[List[str]]:
+    """Plugin-relative paths from the command line, or from ``git diff`` against ``--base``; ``None`` on git failure."""
+    paths = list(args.files)
+    if args.base:
+        try:
+            paths += subprocess.run(["git", "diff", "--name-only", f"{args.base}...HEAD"], cwd=repo_root,
+                                    capture_output=True, text=True, check=True).stdout.split()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+    relative = []
+    for path in paths:
+        resolved = Path(path) if Path(path).is_absolute() else (repo_root / path)
+        if not resolved.exists() and not (Path.cwd() / path).exists() and (plugin_dir / path).exists():
+            resolved = plugin_dir / path
+        elif (Path.cwd() / path).exists():
+            resolved = Path.cwd() / path
+        try:
+            relative.append(str(resolved.resolve().relative_to(plugin_dir.resolve())))
+        except ValueError:
+            continue
+    return sorted(set(relative))
+
+
+def run_tests(args, repo_root: Path, plugin_dir: Path) -> int:
+    """Print the PHPUnit tests affected by the changed files, in the requested format."""
+    changed = changed_files(args, repo_root, plugin_dir)
+    if changed is None:
+        print(f"Could not diff against {args.base}", file=sys.stderr)
+        return 1
+    scanner = FeatureScanner(str(plugin_dir), cache_file=str(Path(__file__).parent / ".feature-scanner-cache.json"))
+    scanner.scan_all_files()
+    index = scanner.index_tests()
+    result = scanner.select_tests(changed)
+    tests = sorted(result['selected'])
+
+    print(f"{len(changed)} changed plugin file(s), {len(result['changed'])} changed class(es), "
+          f"{len(result['affected'])} affected; {len(tests)} of {len(index)} test file(s) selected", file=sys.stderr)
+    if result['run_all']:
+        print(f"  {result['run_all']} is loaded by every test — run the full suite", file=sys.stderr)
+    elif args.verbose:
+        for test in tests:
+            print(f"  {test}: {result['selected'][test]}", file=sys.stderr)
+    for path in result['untracked']:
+        print(f"  no test references {path}", file=sys.stderr)
+    if result['related'] and not result['run_all']:
+        print(f"  {len(result['related'])} more test file(s) only reference dependents of the changed classes "
+              f"({len(result['deeper'])} beyond the first hop); not selected", file=sys.stderr)
+        for test in sorted(result['related']) if args.verbose else []:
+            print(f"    {test}: {result['related'][test]}", file=sys.stderr)
+
+    if args.format == 'filter':
+        output = '' if result['run_all'] else scanner.phpunit_filter(index, tests)
+    elif args.format == 'suite':
+        output = scanner.phpunit_suite(tests)
+    else:
+        output = '\n'.join(f"{scanner.TESTS_DIR}/{Path(test).name}" for test in tests)
+    if args.output:
+        Path(args.output).write_text(output + '\n' if output else '', encoding='utf-8')
+    elif output:
+        print(output)
+    return 0
+
+
 def main():
     """Main entry point for the feature scanner."""
     # Determine plugin directory
@@ -1281,14 +6417,67 @@ def main():
     repo_root = script_dir.parent
     plugin_dir = repo_root / "ai-post-scheduler"
 
+    parser = argparse.ArgumentParser(description="Feature scanner for the AI Post Scheduler plugin")
+    parser.add_argument("--trend-db", default=str(script_dir / ".feature-scanner-trend.sqlite"),
+                        help="Trend store file (default: scripts/.feature-scanner-trend.sqlite)")
+    parser.add_argument("--no-record", action="store_true", help="Do not append this run to the trend store")
+    subparsers = parser.add_subparsers(dest="command")
+    trend_parser = subparsers.add_parser("trend", help="Show metric deltas and sparklines across recorded commits")
+    trend_parser.add_argument("--limit", type=int, default=30, help="Most recent commits to include (default: 30)")
+    trend_parser.add_argument("--top", type=int, default=10, help="Classes to list by LOC growth (default: 10)")
+    classmap_parser = subparsers.add_parser("classmap", help="Generate the AIPS_Autoloader classmap")
+    classmap_parser.add_argument("--check", action="store_true",
+                                 help="Report stale or missing entries without writing; exit 1 on drift")
+    batch_parser = subparsers.add_parser("batch", help="Scan several plugin roots concurrently")
+    batch_parser.add_argument("roots", nargs="*", help="Plugin directories (each containing includes/)")
+    batch_parser.add_argument("--manifest", help="File listing plugin roots, one per line, relative to the file")
+    batch_parser.add_argument("--output", default=str(repo_root / "docs" / "batch"),
+                              help="Directory for per-root reports and the summary (default: docs/batch)")
+    batch_parser.add_argument("--workers", type=int, default=0, help="Worker processes (default: CPU count)")
+    batch_parser.add_argument("--parse-cache", default=str(script_dir / ".feature-scanner-parse-cache.json"),
+                              help="Content-hash parse cache (default: scripts/.feature-scanner-parse-cache.json)")
+    tests_parser = subparsers.add_parser("tests", help="Select the PHPUnit tests affected by changed files")
+    tests_parser.add_argument("files", nargs="*", help="Changed files (repo- or plugin-relative)")
+    tests_parser.add_argument("--base", help="Also include files changed since this git ref (merge base with HEAD)")
+    tests_parser.add_argument("--format", choices=("files", "filter", "suite"), default="files",
+                              help="Test file list, a phpunit --filter pattern, or a <testsuite> block (default: files)")
+    tests_parser.add_argument("--output", help="Write the selection to this file instead of stdout")
+    tests_parser.add_argument("--verbose", action="store_true", help="Explain why each test file was selected")
+    serve_parser = subparsers.add_parser("serve", help="Keep a scan in memory and answer JSON-RPC queries")
+    serve_parser.add_argument("--socket", help="Listen on this Unix socket path instead of stdio")
+    serve_parser.add_argument("--poll", type=float, default=1.0,
+                              help="Minimum seconds between source change checks (default: 1.0)")
+    findings_parser = subparsers.add_parser("findings",
+                                            help="Sync standards violations into the .aips-agent findings store")
+    findings_parser.add_argument("--store", default=str(repo_root / ".aips-agent"),
+                                 help="Findings store directory (default: .aips-agent)")
+    findings_parser.add_argument("--dry-run", action="store_true", help="Report transitions without writing")
+    findings_parser.add_argument("--verbose", action="store_true", help="List each finding that changed state")
+    args = parser.parse_args()
+
+    if args.command == "trend":
+        return run_trend(args)
+    if args.command == "batch":
+        return run_batch(args)
+
     if not plugin_dir.exists():
         print(f"Error: Plugin directory not found at {plugin_dir}")
         sys.exit(1)
 
+    if args.command == "classmap":
+        return run_classmap(args, plugin_dir)
+    if args.command == "tests":
+        return run_tests(args, repo_root, plugin_dir)
+    if args.command == "serve":
+        return run_serve(args, plugin_dir)
+    if args.command == "findings":
+        return run_findings(args, repo_root, plugin_dir)
+
     print(f"Scanning plugin at: {plugin_dir}")
+    started = time.perf_counter()
 
     # Create scanner and scan files
-    scanner = FeatureScanner(str(plugin_dir))
+    scanner = FeatureScanner(str(plugin_dir), cache_file=str(script_dir / ".feature-scanner-cache.json"))
     scanner.scan_all_files()
 
     print(f"Found {len(scanner.features)} classes and {len(scanner.interfaces)} interfaces")
@@ -1308,8 +6497,29 @@ def main():
     profiles_file = docs_dir / "feature-report-feature-profiles.md"
     scanner.generate_profiles_summary(str(profiles_file))
 
+    scanner.write_metrics_json(str(docs_dir / "feature-metrics.json"))
+    scanner.save_metrics_cache()
+
+    if scanner.read_classmap() is not None:
+        drift = scanner.classmap_drift(scanner.build_classmap())
+        if drift['stale'] or drift['missing']:
+            print(f"⚠ Autoloader classmap is out of date ({len(drift['stale'])} stale, "
+                  f"{len(drift['missing'])} missing) — run `python3 scripts/feature_scanner.py classmap`")
+
+    # Append this run to the trend store
+    if not args.no_record:
+        sha, dirty = git_revision(repo_root)
+        if sha:
+            store = TrendStore(args.trend_db)
+            try:
+                store.record(scanner, sha, dirty, int((time.perf_counter() - started) * 1000))
+            finally:
+                store.close()
+            print(f"✓ Run recorded for {sha[:7]}{' (uncommitted changes)' if dirty else ''} in {args.trend_db}")
+
     print("\nFeature scanning complete!")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -10,18 +10,291 @@ Requirements:
 
 Usage:
     python mcp-client-example.py --url https://your-site.com/wp-content/plugins/ai-post-scheduler/mcp-bridge.php
+
+Tool calls are validated locally against ai-post-scheduler/mcp-bridge-schema.json
+before they are sent, so typos and wrong parameter types fail without a round
+trip to the bridge. Every tool in the schema is also exposed as a typed method:
+
+    client.get_post_metadata(post_id=123)
+
+Subcommands:
+    sync        Incrementally mirror history, stats, authors and topics into SQLite
+    regenerate  Regenerate a post component for many posts with bounded
+                concurrency, a global rate budget and a resumable journal
+    benchmark   Compare bytes on the wire and latency per content encoding
+                against a local stand-in server (no bridge required)
+    stdio       Read one JSON-RPC request per line on stdin and write one
+                response per line on stdout over a single warm session
+
+Responses are requested with gzip/deflate (and zstd when the optional
+zstandard package is installed). With --compress-requests, request bodies
+above 1 KiB are gzip-encoded; the bridge decodes them itself.
 """
 
 import argparse
+import gzip
+import inspect
 import json
+import os
+import sqlite3
+import statistics
+import sys
+import threading
+import time
+import zlib
 import requests
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, Callable, Iterable, List, Optional, Set, TextIO, Tuple
+
+try:
+    # Optional: lets the client advertise and decode zstd responses
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Errors raised while decoding a compressed response body
+DECODE_ERRORS = (zlib.error,) + ((zstandard.ZstdError,) if zstandard is not None else ())
+
+
+DEFAULT_SCHEMA_PATH = Path(__file__).resolve().parent.parent / "ai-post-scheduler" / "mcp-bridge-schema.json"
+
+# JSON-RPC 2.0 "Invalid params" error code
+INVALID_PARAMS = -32602
+
+# JSON Schema primitive types mapped to the Python types json.loads() produces
+JSON_TYPES = {
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "array": (list,),
+    "object": (dict,),
+    "null": (type(None),),
+}
+
+# Annotations used for the generated tool method signatures
+PYTHON_ANNOTATIONS = {
+    "string": str,
+    "integer": int,
+    "number": float,
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+}
+
+Validator = Callable[[Any, str], Optional[str]]
+
+# Request bodies smaller than this are not worth compressing
+COMPRESS_MIN_BYTES = 1024
+
+
+def available_encodings() -> List[str]:
+    """Response encodings this client can decode, in order of preference"""
+    encodings = ["gzip", "deflate"]
+    if zstandard is not None:
+        encodings.insert(0, "zstd")
+    return encodings
+
+
+def encode_body(data: bytes, encoding: str) -> bytes:
+    """Compress a body with a Content-Encoding token (identity returns it as-is)"""
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=6)
+    if encoding == "deflate":
+        return zlib.compress(data, 6)
+    if encoding == "zstd" and zstandard is not None:
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    return data
+
+
+def decode_body(data: bytes, encoding: str) -> bytes:
+    """Decompress a body with a Content-Encoding token (identity returns it as-is)"""
+    if encoding == "gzip":
+        return gzip.decompress(data)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(data)
+        except zlib.error:
+            # Some servers send raw deflate without the zlib wrapper
+            return zlib.decompress(data, -zlib.MAX_WBITS)
+    if encoding == "zstd" and zstandard is not None:
+        return zstandard.ZstdDecompressor().decompress(data)
+    return data
+
+
+def _compile_type_check(type_names) -> Validator:
+    """Build a check for a JSON Schema ``type`` keyword (string or list of strings)."""
+    if isinstance(type_names, str):
+        type_names = [type_names]
+    allowed = tuple(t for name in type_names for t in JSON_TYPES.get(name, ()))
+    # bool is a subclass of int in Python but not an integer/number in JSON
+    rejects_bool = "boolean" not in type_names
+    label = " or ".join(type_names)
+
+    def check(value, path):
+        if not isinstance(value, allowed) or (rejects_bool and isinstance(value, bool)):
+            return f"{path}: expected {label}, got {type(value).__name__}"
+        return None
+
+    return check
+
+
+def compile_validator(schema: Dict[str, Any], strict: bool = False) -> Validator:
+    """
+    Compile a JSON Schema fragment into a validation closure
+
+    Only the keywords used by mcp-bridge-schema.json are supported: type, enum,
+    minimum, maximum, items, properties, required, additionalProperties and
+    oneOf. All schema walking happens here, once, so the returned closure only
+    performs the checks that apply to the fragment.
+
+    Args:
+        schema: JSON Schema fragment
+        strict: Reject object keys not declared in ``properties`` even when the
+            schema does not set ``additionalProperties: false``
+
+    Returns:
+        Callable taking (value, path) and returning an error message or None
+    """
+    checks: List[Validator] = []
+
+    if "type" in schema:
+        checks.append(_compile_type_check(schema["type"]))
+
+    if "enum" in schema:
+        options = schema["enum"]
+        allowed_values = frozenset(options)
+        listing = ", ".join(json.dumps(o) for o in options)
+
+        def check_enum(value, path):
+            try:
+                ok = value in allowed_values
+            except TypeError:
+                ok = False
+            # 1 == True in Python; keep booleans and integers distinct
+            if not ok or (isinstance(value, bool) and not any(o is value for o in options)):
+                return f"{path}: must be one of {listing}"
+            return None
+
+        checks.append(check_enum)
+
+    if "minimum" in schema or "maximum" in schema:
+        minimum = schema.get("minimum")
+        maximum = schema.get("maximum")
+
+        def check_range(value, path):
+            if not isinstance(value, (int, float)) or isinstance(value, bool):
+                return None
+            if minimum is not None and value < minimum:
+                return f"{path}: must be >= {minimum}"
+            if maximum is not None and value > maximum:
+                return f"{path}: must be <= {maximum}"
+            return None
+
+        checks.append(check_range)
+
+    if "items" in schema:
+        item_check = compile_validator(schema["items"])
+
+        def check_items(value, path):
+            if not isinstance(value, list):
+                return None
+            for index, item in enumerate(value):
+                error = item_check(item, f"{path}[{index}]")
+                if error:
+                    return error
+            return None
+
+        checks.append(check_items)
+
+    if "properties" in schema or "required" in schema:
+        properties = {
+            name: compile_validator(sub_schema)
+            for name, sub_schema in schema.get("properties", {}).items()
+        }
+        required = tuple(schema.get("required", ()))
+        closed = strict or schema.get("additionalProperties") is False
+        known = ", ".join(sorted(properties)) or "(none)"
+
+        def check_object(value, path):
+            if not isinstance(value, dict):
+                return None
+            for name, item in value.items():
+                prop_check = properties.get(name)
+                if prop_check is None:
+                    if closed:
+                        return f"{path}: unknown parameter '{name}' (expected one of: {known})"
+                    continue
+                error = prop_check(item, f"{path}.{name}")
+                if error:
+                    return error
+            for name in required:
+                if name not in value:
+                    return f"{path}: missing required parameter '{name}'"
+            return None
+
+        checks.append(check_object)
+
+    if "oneOf" in schema:
+        # The bridge schema uses oneOf for overlapping alternatives (e.g. a known
+        # enum value *or* any string), so accept a value matching any branch.
+        branches = [compile_validator(branch) for branch in schema["oneOf"]]
+
+        def check_one_of(value, path):
+            errors = [branch(value, path) for branch in branches]
+            if all(errors):
+                return errors[0]
+            return None
+
+        checks.append(check_one_of)
+
+    if not checks:
+        return lambda value, path: None
+    if len(checks) == 1:
+        return checks[0]
+
+    def check_all(value, path):
+        for check in checks:
+            error = check(value, path)
+            if error:
+                return error
+        return None
+
+    return check_all
+
+
+@lru_cache(maxsize=None)
+def load_tool_schemas(schema_path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Load the bridge schema once and index its tool definitions by name
+
+    Args:
+        schema_path: Path to mcp-bridge-schema.json
+
+    Returns:
+        Mapping of tool name to tool definition, each with a compiled
+        ``validator`` entry added
+    """
+    with open(schema_path, "r", encoding="utf-8") as f:
+        schema = json.load(f)
+
+    tools = {}
+    for tool in schema.get("tools", []):
+        parameters = tool.get("parameters") or {"type": "object", "properties": {}}
+        tools[tool["name"]] = dict(tool, validator=compile_validator(parameters, strict=True))
+    return tools
 
 
 class MCPClient:
     """Simple MCP Bridge client"""
     
-    def __init__(self, url: str, username: str = None, password: str = None, token: str = None):
+    def __init__(self, url: str, username: str = None, password: str = None, token: str = None,
+                 schema_path: Optional[str] = None, validate: bool = True,
+                 accept_encoding: Optional[List[str]] = None, request_encoding: Optional[str] = None):
         """
         Initialize MCP client
 
@@ -32,14 +305,99 @@ class MCPClient:
             token: Shared secret matching the AIPS_MCP_BRIDGE_TOKEN constant
                 defined in wp-config.php (required; the bridge rejects
                 requests without it regardless of WordPress auth)
+            schema_path: Path to mcp-bridge-schema.json (optional; defaults to
+                the copy shipped with the plugin when it is present)
+            validate: Validate tool calls locally before sending them
+            accept_encoding: Response encodings to advertise (default: every
+                encoding this client can decode; empty list for identity only)
+            request_encoding: Encoding for request bodies of at least
+                COMPRESS_MIN_BYTES, e.g. "gzip" (default: send uncompressed)
         """
         self.url = url
         self.token = token
         self.session = requests.Session()
+        self.request_encoding = request_encoding
+        self.last_wire_bytes = (0, 0)
+
+        if accept_encoding is None:
+            accept_encoding = available_encodings()
+        self.session.headers["Accept-Encoding"] = ", ".join(accept_encoding) or "identity"
 
         if username and password:
             self.session.auth = (username, password)
 
+        self.tools: Dict[str, Dict[str, Any]] = {}
+        if schema_path is None and DEFAULT_SCHEMA_PATH.exists():
+            schema_path = str(DEFAULT_SCHEMA_PATH)
+        if schema_path:
+            self.tools = load_tool_schemas(str(Path(schema_path).resolve()))
+        self.validate = validate and bool(self.tools)
+
+        self._bind_tool_methods()
+
+    def _bind_tool_methods(self):
+        """Expose every schema tool as a typed method, e.g. client.get_post_metadata(post_id=1)"""
+        for name, tool in self.tools.items():
+            if hasattr(self, name):
+                continue
+            setattr(self, name, self._make_tool_method(name, tool))
+
+    def _make_tool_method(self, name: str, tool: Dict[str, Any]) -> Callable[..., Dict[str, Any]]:
+        """Build a keyword-only method whose signature mirrors the tool's parameters."""
+        parameters = tool.get("parameters") or {}
+        required = set(parameters.get("required", []))
+        signature_params = []
+        for param_name, param_schema in parameters.get("properties", {}).items():
+            annotation = PYTHON_ANNOTATIONS.get(param_schema.get("type"), Any)
+            if param_name in required:
+                default = inspect.Parameter.empty
+            else:
+                annotation = Optional[annotation]
+                default = None
+            signature_params.append(inspect.Parameter(
+                param_name, inspect.Parameter.KEYWORD_ONLY, default=default, annotation=annotation
+            ))
+
+        def tool_method(**kwargs) -> Dict[str, Any]:
+            params = {k: v for k, v in kwargs.items() if v is not None}
+            return self.call_tool(name, params)
+
+        tool_method.__name__ = name
+        tool_method.__qualname__ = f"{type(self).__name__}.{name}"
+        tool_method.__doc__ = tool.get("description", "")
+        tool_method.__signature__ = inspect.Signature(signature_params, return_annotation=Dict[str, Any])
+        return tool_method
+
+    def validate_call(self, method: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Validate a tool call against the bridge schema without sending it
+
+        Args:
+            method: Tool name to call
+            params: Tool parameters (optional)
+
+        Returns:
+            JSON-RPC error response if the call is invalid, otherwise None
+        """
+        tool = self.tools.get(method)
+        if tool is None:
+            return {
+                "error": {
+                    "code": -32601,
+                    "message": f"Method not found: {method}"
+                }
+            }
+
+        error = tool["validator"](params or {}, "params")
+        if error:
+            return {
+                "error": {
+                    "code": INVALID_PARAMS,
+                    "message": f"Invalid params for {method}: {error}"
+                }
+            }
+        return None
+
     def call_tool(self, method: str, params: Optional[Dict[str, Any]] = None, request_id: int = 1) -> Dict[str, Any]:
         """
         Call an MCP tool
@@ -52,6 +410,11 @@ class MCPClient:
         Returns:
             Tool result or error
         """
+        if self.validate:
+            error = self.validate_call(method, params)
+            if error:
+                return error
+
         payload = {
             "jsonrpc": "2.0",
             "method": method,
@@ -60,18 +423,37 @@ class MCPClient:
             "token": self.token
         }
         
+        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        headers = {"Content-Type": "application/json"}
+        if self.request_encoding and len(body) >= COMPRESS_MIN_BYTES:
+            body = encode_body(body, self.request_encoding)
+            headers["Content-Encoding"] = self.request_encoding
+
         try:
-            response = self.session.post(
+            with self.session.post(
                 self.url,
-                json=payload,
-                headers={"Content-Type": "application/json"},
-                timeout=30
-            )
-            
-            response.raise_for_status()
-            return response.json()
+                data=body,
+                headers=headers,
+                timeout=30,
+                stream=True
+            ) as response:
+                response.raise_for_status()
+                # Read the raw body so zstd is handled even when urllib3 cannot
+                # decode it, and so callers can see the bytes on the wire.
+                raw = response.raw.read(decode_content=False)
+                self.last_wire_bytes = (len(body), len(raw))
+                encoding = response.headers.get("Content-Encoding", "identity").strip().lower()
+                decoded = json.loads(decode_body(raw, encoding))
+                if not isinstance(decoded, dict):
+                    return {
+                        "error": {
+                            "code": -32000,
+                            "message": f"Unexpected response body: {type(decoded).__name__}"
+                        }
+                    }
+                return decoded
             
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError, OSError) + DECODE_ERRORS as e:
             return {
                 "error": {
                     "code": -32000,
@@ -93,17 +475,709 @@ class MCPClient:
             print(json.dumps(response, indent=2))
 
 
-def main():
-    parser = argparse.ArgumentParser(description="MCP Bridge Client Example")
-    parser.add_argument("--url", required=True, help="MCP Bridge URL")
-    parser.add_argument("--username", help="WordPress username")
-    parser.add_argument("--password", help="WordPress application password")
-    parser.add_argument("--token", required=True, help="Shared secret matching AIPS_MCP_BRIDGE_TOKEN in wp-config.php")
-    parser.add_argument("--tool", default="list_tools", help="Tool to call (default: list_tools)")
-    parser.add_argument("--params", help="Tool parameters as JSON string")
-    
-    args = parser.parse_args()
-    
+class BridgeMirror:
+    """
+    Local SQLite mirror of bridge data for offline analytics
+
+    History is pulled incrementally: pages of get_generation_history (newest
+    first) are fetched only until they reach the stored watermark, i.e. the
+    highest record ID below which every record had already reached a terminal
+    status. Records still pending or processing stay above the watermark, so
+    their final status is picked up by a later sync, unless they were created
+    more than OPEN_RECORD_MAX_AGE ago: a record stuck in processing must not
+    make every later sync re-read history from that point. Authors and topics
+    have no server-side cursor and are re-read and upserted on every sync;
+    each sync also appends one get_generation_stats snapshot.
+    """
+
+    # History statuses that no longer change once written
+    TERMINAL_STATUSES = ("completed", "failed", "partial")
+
+    # Non-terminal records older than this no longer hold the watermark back
+    OPEN_RECORD_MAX_AGE = timedelta(hours=24)
+
+    # get_generation_history caps per_page at 100
+    HISTORY_PAGE_SIZE = 100
+
+    # list_author_topics caps limit at 500
+    TOPICS_LIMIT = 500
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS sync_state (
+            source TEXT PRIMARY KEY,
+            watermark INTEGER NOT NULL DEFAULT 0,
+            synced_at TEXT
+        );
+        CREATE TABLE IF NOT EXISTS history (
+            id INTEGER PRIMARY KEY,
+            uuid TEXT,
+            post_id INTEGER,
+            template_id INTEGER,
+            template_name TEXT,
+            status TEXT,
+            generated_title TEXT,
+            error_message TEXT,
+            created_at TEXT,
+            completed_at TEXT,
+            post_url TEXT,
+            edit_url TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_history_post_id ON history (post_id);
+        CREATE INDEX IF NOT EXISTS idx_history_template_id ON history (template_id);
+        CREATE INDEX IF NOT EXISTS idx_history_status_created ON history (status, created_at);
+        CREATE TABLE IF NOT EXISTS authors (
+            id INTEGER PRIMARY KEY,
+            name TEXT,
+            bio TEXT,
+            expertise TEXT,
+            tone TEXT,
+            is_active INTEGER,
+            created_at TEXT
+        );
+        CREATE TABLE IF NOT EXISTS author_topics (
+            id INTEGER PRIMARY KEY,
+            author_id INTEGER,
+            topic_title TEXT,
+            topic_prompt TEXT,
+            status TEXT,
+            score INTEGER,
+            keywords TEXT,
+            metadata TEXT,
+            generated_at TEXT,
+            approved_at TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_author_topics_author_status ON author_topics (author_id, status);
+        CREATE INDEX IF NOT EXISTS idx_author_topics_status ON author_topics (status);
+        CREATE TABLE IF NOT EXISTS generation_stats (
+            synced_at TEXT PRIMARY KEY,
+            period TEXT,
+            total INTEGER,
+            completed INTEGER,
+            failed INTEGER,
+            processing INTEGER,
+            success_rate REAL,
+            by_template TEXT
+        );
+    """
+
+    HISTORY_COLUMNS = ("id", "uuid", "post_id", "template_id", "template_name", "status",
+                       "generated_title", "error_message", "created_at", "completed_at",
+                       "post_url", "edit_url")
+    AUTHOR_COLUMNS = ("id", "name", "bio", "expertise", "tone", "is_active", "created_at")
+    TOPIC_COLUMNS = ("id", "author_id", "topic_title", "topic_prompt", "status", "score",
+                     "keywords", "metadata", "generated_at", "approved_at")
+
+    def __init__(self, client: MCPClient, db_path: str):
+        """
+        Initialize the mirror
+
+        Args:
+            client: Configured MCP client
+            db_path: SQLite database file (created if missing)
+        """
+        self.client = client
+        self.db = sqlite3.connect(db_path)
+        self.db.executescript(self.SCHEMA)
+        # Author ID -> topics available, for authors the last sync could not mirror in full
+        self.truncated_topics: Dict[int, int] = {}
+
+    def close(self):
+        """Close the underlying database connection"""
+        self.db.close()
+
+    def sync(self, full: bool = False) -> Dict[str, int]:
+        """
+        Run one sync pass over every mirrored source
+
+        Args:
+            full: Ignore the stored watermark and re-read all history
+
+        Returns:
+            Number of rows written per source
+        """
+        synced_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        counts = {
+            "history": self.sync_history(synced_at, full),
+            "generation_stats": self.sync_stats(synced_at),
+        }
+        counts["authors"], counts["author_topics"] = self.sync_authors(synced_at)
+        return counts
+
+    def _call(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Call a tool and return its result, raising on JSON-RPC errors"""
+        response = self.client.call_tool(method, params)
+        if "error" in response:
+            raise RuntimeError(f"{method} failed: {response['error'].get('message')}")
+        return response.get("result") or {}
+
+    def _upsert(self, table: str, columns, rows: List[Dict[str, Any]]) -> int:
+        """Insert or replace rows, keeping only the mirrored columns"""
+        if not rows:
+            return 0
+        placeholders = ", ".join("?" for _ in columns)
+        self.db.executemany(
+            f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) VALUES ({placeholders})",
+            [tuple(row.get(column) for column in columns) for row in rows]
+        )
+        return len(rows)
+
+    def _watermark(self, source: str) -> int:
+        row = self.db.execute("SELECT watermark FROM sync_state WHERE source = ?", (source,)).fetchone()
+        return row[0] if row else 0
+
+    def _set_watermark(self, source: str, watermark: int, synced_at: str):
+        self.db.execute(
+            "INSERT OR REPLACE INTO sync_state (source, watermark, synced_at) VALUES (?, ?, ?)",
+            (source, watermark, synced_at)
+        )
+
+    def sync_history(self, synced_at: str, full: bool = False) -> int:
+        """Fetch history records above the watermark, newest first"""
+        watermark = 0 if full else self._watermark("history")
+        written = 0
+        page = 1
+
+        while True:
+            result = self._call("get_generation_history", {"per_page": self.HISTORY_PAGE_SIZE, "page": page})
+            items = result.get("items") or []
+            fresh = [item for item in items if int(item["id"]) > watermark]
+            written += self._upsert("history", self.HISTORY_COLUMNS, fresh)
+
+            pages = int((result.get("pagination") or {}).get("pages") or 0)
+            if len(fresh) < len(items) or not items or page >= pages:
+                break
+            page += 1
+
+        placeholders = ", ".join("?" for _ in self.TERMINAL_STATUSES)
+        # created_at is a MySQL DATETIME; string comparison orders it correctly
+        stale_before = (datetime.strptime(synced_at, "%Y-%m-%dT%H:%M:%SZ")
+                        - self.OPEN_RECORD_MAX_AGE).strftime("%Y-%m-%d %H:%M:%S")
+        oldest_open = self.db.execute(
+            f"SELECT MIN(id) FROM history WHERE id > ? AND status NOT IN ({placeholders}) AND created_at >= ?",
+            (watermark,) + self.TERMINAL_STATUSES + (stale_before,)
+        ).fetchone()[0]
+        if oldest_open is not None:
+            new_watermark = oldest_open - 1
+        else:
+            new_watermark = self.db.execute("SELECT COALESCE(MAX(id), 0) FROM history").fetchone()[0]
+        self._set_watermark("history", max(watermark, new_watermark), synced_at)
+        self.db.commit()
+        return written
+
+    def sync_stats(self, synced_at: str) -> int:
+        """Append a generation stats snapshot"""
+        stats = self._call("get_generation_stats", {"period": "all"}).get("stats") or {}
+        self.db.execute(
+            "INSERT OR REPLACE INTO generation_stats VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (synced_at, stats.get("period", "all"), stats.get("total"), stats.get("completed"),
+             stats.get("failed"), stats.get("processing"), stats.get("success_rate"),
+             json.dumps(stats.get("by_template")))
+        )
+        self._set_watermark("generation_stats", 0, synced_at)
+        self.db.commit()
+        return 1
+
+    def sync_authors(self, synced_at: str):
+        """Upsert all authors and their topics"""
+        authors = self._call("list_authors", {}).get("authors") or []
+        author_count = self._upsert("authors", self.AUTHOR_COLUMNS, authors)
+
+        topic_count = 0
+        self.truncated_topics = {}
+        for author in authors:
+            result = self._call("list_author_topics", {
+                "author_id": int(author["id"]),
+                "limit": self.TOPICS_LIMIT,
+            })
+            topics = result.get("topics") or []
+            topic_count += self._upsert("author_topics", self.TOPIC_COLUMNS, topics)
+            # The bridge has no offset, so topics past the limit cannot be fetched
+            available = int(result.get("total_available") or len(topics))
+            if len(topics) >= self.TOPICS_LIMIT or available > len(topics):
+                self.truncated_topics[int(author["id"])] = max(available, len(topics))
+
+        self._set_watermark("authors", 0, synced_at)
+        self.db.commit()
+        return author_count, topic_count
+
+
+class RateLimiter:
+    """Thread-safe token bucket limiting calls per second across all workers"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Args:
+            rate: Sustained calls per second (0 disables limiting)
+            burst: Maximum calls allowed back-to-back after an idle period
+        """
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a call is allowed"""
+        if self.rate <= 0:
+            return
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class RegenerationOrchestrator:
+    """
+    Fan regenerate_post_component calls out over many posts
+
+    Posts are selected from get_generation_history filters, called with a
+    bounded worker pool and a shared RateLimiter so AI provider limits hold
+    regardless of the worker count. Every outcome is appended to an NDJSON
+    journal as soon as it is known; a rerun with the same journal skips posts
+    already marked done, so an interrupted run resumes where it stopped. A
+    preview run never counts as done for a later --save run.
+    """
+
+    def __init__(self, client_factory: Callable[[], MCPClient], journal_path: str,
+                 workers: int = 4, rate: float = 1.0, burst: int = 1):
+        """
+        Args:
+            client_factory: Builds a client per worker thread (requests
+                sessions must not be shared between threads)
+            journal_path: NDJSON journal file (created if missing)
+            workers: Maximum concurrent bridge calls
+            rate: Global calls per second across all workers (0 = unlimited)
+            burst: Calls allowed back-to-back after an idle period
+        """
+        self.client_factory = client_factory
+        self.journal_path = journal_path
+        self.workers = max(1, workers)
+        self.limiter = RateLimiter(rate, burst)
+        self.journal_lock = threading.Lock()
+        self.local = threading.local()
+
+    def _client(self) -> MCPClient:
+        client = getattr(self.local, "client", None)
+        if client is None:
+            client = self.local.client = self.client_factory()
+        return client
+
+    def select_posts(self, status: Optional[str] = None, template_id: Optional[int] = None,
+                     search: Optional[str] = None) -> List[Tuple[int, int]]:
+        """
+        Collect (post_id, history_id) pairs from get_generation_history
+
+        Only the newest history record per post is kept, and records without a
+        post are skipped.
+        """
+        params: Dict[str, Any] = {"per_page": BridgeMirror.HISTORY_PAGE_SIZE}
+        if status:
+            params["status"] = status
+        if template_id:
+            params["template_id"] = template_id
+        if search:
+            params["search"] = search
+
+        client = self._client()
+        selected: Dict[int, int] = {}
+        page = 1
+        while True:
+            response = client.call_tool("get_generation_history", dict(params, page=page))
+            if "error" in response:
+                raise RuntimeError(f"get_generation_history failed: {response['error'].get('message')}")
+            result = response.get("result") or {}
+            for item in result.get("items") or []:
+                if item.get("post_id"):
+                    selected.setdefault(int(item["post_id"]), int(item["id"]))
+            if page >= int((result.get("pagination") or {}).get("pages") or 0):
+                break
+            page += 1
+
+        return list(selected.items())
+
+    def completed_posts(self, component: str, save: bool = False) -> Set[int]:
+        """
+        Read post IDs already regenerated for a component from the journal
+
+        A saved regeneration satisfies both preview and save runs; a preview
+        (including entries written before save was journaled) only satisfies
+        preview runs.
+        """
+        done: Set[int] = set()
+        if not os.path.exists(self.journal_path):
+            return done
+        with open(self.journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash mid-write can leave a truncated last line
+                    continue
+                if entry.get("component") == component and entry.get("status") == "done" \
+                        and (entry.get("save", False) or not save):
+                    done.add(int(entry["post_id"]))
+        return done
+
+    def _record(self, entry: Dict[str, Any]):
+        entry["at"] = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        line = json.dumps(entry) + "\n"
+        with self.journal_lock:
+            with open(self.journal_path, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _regenerate(self, post_id: int, history_id: int, component: str, save: bool) -> bool:
+        self.limiter.acquire()
+        response = self._client().call_tool("regenerate_post_component", {
+            "post_id": post_id,
+            "history_id": history_id,
+            "component": component,
+            "save": save,
+        })
+        entry: Dict[str, Any] = {"post_id": post_id, "history_id": history_id, "component": component,
+                                 "save": save}
+        if "error" in response:
+            entry.update(status="failed", error=response["error"].get("message"))
+        else:
+            entry["status"] = "done"
+        self._record(entry)
+        return entry["status"] == "done"
+
+    def run(self, targets: Iterable[Tuple[int, int]], component: str, save: bool = False,
+            progress: Optional[Callable[[int, int, int], None]] = None) -> Dict[str, int]:
+        """
+        Regenerate a component for every target not already done
+
+        Args:
+            targets: (post_id, history_id) pairs
+            component: title, excerpt, content or featured_image
+            save: Save regenerated values to the posts (otherwise preview only)
+            progress: Optional callback receiving (finished, total, failed)
+
+        Returns:
+            Counts of skipped, done and failed posts
+        """
+        done = self.completed_posts(component, save)
+        targets = list(targets)
+        pending = [(post_id, history_id) for post_id, history_id in targets if post_id not in done]
+        counts = {"skipped": len(targets) - len(pending), "done": 0, "failed": 0}
+
+        executor = ThreadPoolExecutor(max_workers=self.workers)
+        try:
+            futures = [
+                executor.submit(self._regenerate, post_id, history_id, component, save)
+                for post_id, history_id in pending
+            ]
+            for future in as_completed(futures):
+                counts["done" if future.result() else "failed"] += 1
+                if progress:
+                    progress(counts["done"] + counts["failed"], len(pending), counts["failed"])
+        finally:
+            # On Ctrl-C, drop queued calls instead of draining thousands of them
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        return counts
+
+
+def representative_payloads() -> Dict[str, Dict[str, Any]]:
+    """
+    Build deterministic stand-ins for the bridge's largest responses
+
+    Shapes follow mcp-bridge-schema.json: a full get_generation_history page,
+    a get_history record with its generation logs, and system_status for all
+    sections. export_data is not modelled because it returns a file URL
+    rather than the exported rows.
+    """
+    words = ("scheduler", "template", "generated", "content", "WordPress", "prompt",
+             "author", "topic", "completed", "excerpt", "featured", "image", "draft")
+
+    def text(seed: int, count: int) -> str:
+        return " ".join(words[(seed * 7 + i * 3) % len(words)] for i in range(count))
+
+    history_items = [{
+        "id": 5000 - i,
+        "uuid": f"{i:08x}-4b1d-4c6f-9a3e-{i * 7919:012x}",
+        "post_id": 12000 - i,
+        "template_id": i % 12,
+        "template_name": f"Template {i % 12}: {text(i, 4)}",
+        "status": "completed" if i % 9 else "failed",
+        "generated_title": text(i, 9).title(),
+        "error_message": "" if i % 9 else "AI request failed: rate limit exceeded",
+        "created_at": f"2026-09-{1 + i % 28:02d} {i % 24:02d}:{i % 60:02d}:00",
+        "completed_at": f"2026-09-{1 + i % 28:02d} {i % 24:02d}:{(i + 2) % 60:02d}:00",
+        "post_url": f"https://example.com/{2026}/09/{text(i, 5).replace(' ', '-')}/",
+        "edit_url": f"https://example.com/wp-admin/post.php?post={12000 - i}&action=edit",
+    } for i in range(100)]
+
+    logs = [{
+        "id": 90000 + i,
+        "log_type": ("ai_request", "ai_response", "info")[i % 3],
+        "history_type_id": 1 + i % 4,
+        "details": {
+            "log_subtype": ("ai_request", "ai_response", "info")[i % 3],
+            "message": text(i, 12),
+            "prompt": text(i, 80),
+            "model": "gpt-4o-mini",
+            "tokens": {"input": 900 + i, "output": 400 + i},
+        },
+        "timestamp": f"2026-09-14 10:{i % 60:02d}:00",
+    } for i in range(60)]
+
+    history = dict(history_items[0], author_id=3, topic_id=77, creation_method="scheduled",
+                   generated_content="\n".join(f"<p>{text(i, 60)}</p>" for i in range(40)),
+                   logs=logs, log_count=len(logs))
+
+    system_info = {
+        section: {f"{section}_{i}": {"label": text(i, 4).title(), "value": text(i + 1, 6),
+                                     "status": "ok" if i % 5 else "warning"}
+                  for i in range(40)}
+        for section in ("environment", "plugin", "database", "filesystem", "cron", "logs")
+    }
+
+    return {
+        "get_generation_history": {
+            "success": True,
+            "items": history_items,
+            "pagination": {"total": 5000, "pages": 50, "current_page": 1, "per_page": 100},
+        },
+        "get_history": {"success": True, "history": history},
+        "system_status": {"success": True, "system_info": system_info},
+    }
+
+
+class StandInBridge:
+    """
+    Local HTTP server answering bridge calls with canned payloads
+
+    It honours Accept-Encoding and Content-Encoding like the real bridge and
+    can add a fixed round-trip delay and a bandwidth cap to approximate a WAN
+    link. Use as a context manager; ``url`` is set once it is listening.
+    """
+
+    def __init__(self, payloads: Dict[str, Dict[str, Any]], rtt_ms: float = 0.0, bandwidth_kbps: float = 0.0):
+        self.payloads = payloads
+        self.rtt_ms = rtt_ms
+        self.bandwidth_kbps = bandwidth_kbps
+        self.server: Optional[ThreadingHTTPServer] = None
+        self.url = ""
+
+    def __enter__(self) -> "StandInBridge":
+        bridge = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately; without this, delayed
+            # ACKs add ~40 ms to every response and swamp the measurement
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                raw = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                request = json.loads(decode_body(raw, self.headers.get("Content-Encoding", "identity")))
+                result = bridge.payloads.get(request.get("method"), {"success": True})
+                body = json.dumps({"jsonrpc": "2.0", "result": result, "id": request.get("id")}).encode("utf-8")
+
+                accepted = [e.strip() for e in self.headers.get("Accept-Encoding", "").split(",")]
+                encoding = next((e for e in accepted if e in ("zstd", "gzip", "deflate")), "identity")
+                if encoding == "zstd" and zstandard is None:
+                    encoding = "identity"
+                body = encode_body(body, encoding)
+
+                delay = bridge.rtt_ms / 1000.0
+                if bridge.bandwidth_kbps > 0:
+                    delay += (len(raw) + len(body)) * 8 / (bridge.bandwidth_kbps * 1000.0)
+                if delay:
+                    time.sleep(delay)
+
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                if encoding != "identity":
+                    self.send_header("Content-Encoding", encoding)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/mcp-bridge.php"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def benchmark_transport(iterations: int = 20, rtt_ms: float = 0.0, bandwidth_kbps: float = 0.0,
+                        compress_requests: bool = False) -> List[Dict[str, Any]]:
+    """
+    Measure bytes on the wire and latency per payload and response encoding
+
+    Args:
+        iterations: Calls per payload and encoding (after one warm-up call)
+        rtt_ms: Simulated round-trip time added by the stand-in server
+        bandwidth_kbps: Simulated link bandwidth (0 = unlimited)
+        compress_requests: gzip request bodies of at least COMPRESS_MIN_BYTES
+
+    Returns:
+        One row per (payload, encoding) with byte counts and latency percentiles
+    """
+    payloads = representative_payloads()
+    encodings = ["identity"] + list(reversed(available_encodings()))
+    rows = []
+
+    with StandInBridge(payloads, rtt_ms=rtt_ms, bandwidth_kbps=bandwidth_kbps) as bridge:
+        for method in payloads:
+            for encoding in encodings:
+                client = MCPClient(bridge.url, token="benchmark", validate=False,
+                                   accept_encoding=[] if encoding == "identity" else [encoding],
+                                   request_encoding="gzip" if compress_requests else None)
+                client.call_tool(method, {})
+                timings = []
+                for _ in range(iterations):
+                    started = time.perf_counter()
+                    response = client.call_tool(method, {})
+                    timings.append((time.perf_counter() - started) * 1000)
+                    if "error" in response:
+                        raise RuntimeError(response["error"]["message"])
+                timings.sort()
+                rows.append({
+                    "payload": method,
+                    "encoding": encoding,
+                    "request_bytes": client.last_wire_bytes[0],
+                    "response_bytes": client.last_wire_bytes[1],
+                    "p50_ms": statistics.median(timings),
+                    "p95_ms": timings[min(len(timings) - 1, int(len(timings) * 0.95))],
+                })
+
+    return rows
+
+
+class StdioSession:
+    """
+    Long-lived line-oriented JSON-RPC front end for shell automation
+
+    Each stdin line is a request ({"method": ..., "params": ..., "id": ...};
+    jsonrpc and token may be omitted) or a JSON-RPC batch array, and produces
+    exactly one stdout line. Calls reuse warm client sessions, so a script can
+    pipe thousands of calls through one process instead of paying Python
+    startup and a TLS handshake per call. With more than one worker, calls
+    run concurrently and responses are written as they complete; match them
+    to requests by ``id``.
+    """
+
+    def __init__(self, client_factory: Callable[[], MCPClient], workers: int = 1):
+        """
+        Args:
+            client_factory: Builds a client per worker thread
+            workers: Concurrent in-flight calls (1 keeps responses in order)
+        """
+        self.client_factory = client_factory
+        self.workers = max(1, workers)
+        self.local = threading.local()
+        self.output_lock = threading.Lock()
+
+    def _client(self) -> MCPClient:
+        client = getattr(self.local, "client", None)
+        if client is None:
+            client = self.local.client = self.client_factory()
+        return client
+
+    @staticmethod
+    def _error(code: int, message: str, request_id: Any = None) -> Dict[str, Any]:
+        return {"jsonrpc": "2.0", "error": {"code": code, "message": message}, "id": request_id}
+
+    def handle_request(self, request: Any) -> Dict[str, Any]:
+        """Run a single decoded request and return its JSON-RPC response"""
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            request_id = request.get("id") if isinstance(request, dict) else None
+            return self._error(-32600, "Invalid Request: missing method", request_id)
+
+        request_id = request.get("id")
+        params = request.get("params") or {}
+        try:
+            response = self._client().call_tool(request["method"], params, request_id=request_id)
+        except Exception as e:
+            return self._error(-32603, f"Internal error: {e}", request_id)
+        # Locally generated errors (validation, HTTP failures) carry no envelope
+        response.setdefault("jsonrpc", "2.0")
+        response.setdefault("id", request_id)
+        return response
+
+    def handle_line(self, line: str) -> str:
+        """Decode one input line and return one output line (without newline)"""
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            return json.dumps(self._error(-32700, f"Parse error: {e}"))
+
+        if isinstance(request, list):
+            if not request:
+                return json.dumps(self._error(-32600, "Invalid Request: empty batch"))
+            return json.dumps([self.handle_request(item) for item in request])
+        return json.dumps(self.handle_request(request))
+
+    def respond(self, line: str) -> str:
+        """Like handle_line, but turns any failure into an error line for that request"""
+        try:
+            return self.handle_line(line)
+        except Exception as e:
+            try:
+                request = json.loads(line)
+            except ValueError:
+                request = None
+            request_id = request.get("id") if isinstance(request, dict) else None
+            return json.dumps(self._error(-32603, f"Internal error: {e}", request_id))
+
+    def _write(self, out: TextIO, line: str):
+        with self.output_lock:
+            out.write(line + "\n")
+            out.flush()
+
+    def serve(self, instream: TextIO, outstream: TextIO) -> int:
+        """
+        Process requests until EOF
+
+        Returns:
+            Number of request lines handled
+        """
+        handled = 0
+        if self.workers == 1:
+            for line in instream:
+                if line.strip():
+                    self._write(outstream, self.respond(line))
+                    handled += 1
+            return handled
+
+        # Bound in-flight work so a large input is streamed, not buffered
+        slots = threading.BoundedSemaphore(self.workers * 2)
+
+        def work(line: str):
+            try:
+                self._write(outstream, self.respond(line))
+            finally:
+                slots.release()
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for line in instream:
+                if not line.strip():
+                    continue
+                slots.acquire()
+                executor.submit(work, line)
+                handled += 1
+        return handled
+
+
+def run_tool(client: MCPClient, args) -> int:
+    """Call a single tool and print the response"""
     # Parse parameters
     params = {}
     if args.params:
@@ -112,10 +1186,7 @@ def main():
         except json.JSONDecodeError as e:
             print(f"Error parsing parameters: {e}")
             return 1
-    
-    # Create client
-    client = MCPClient(args.url, args.username, args.password, args.token)
-    
+
     print(f"🔧 Calling tool: {args.tool}")
     print(f"📝 Parameters: {json.dumps(params)}")
     print("-" * 50)
@@ -129,5 +1200,156 @@ def main():
     return 0
 
 
+def run_sync(client: MCPClient, args) -> int:
+    """Mirror bridge data into a local SQLite database"""
+    print(f"🔄 Syncing bridge data into: {args.db}")
+    mirror = BridgeMirror(client, args.db)
+    try:
+        counts = mirror.sync(full=args.full)
+    except RuntimeError as e:
+        print(f"❌ Sync failed: {e}")
+        return 1
+    finally:
+        mirror.close()
+
+    for source, count in counts.items():
+        print(f"   {source}: {count} row(s)")
+    for author_id, available in mirror.truncated_topics.items():
+        print(f"⚠️ Author {author_id}: only the first {BridgeMirror.TOPICS_LIMIT} of {available} topic(s) mirrored")
+    print("✅ Sync complete")
+    return 0
+
+
+def run_regenerate(args) -> int:
+    """Regenerate a component across every post matching the history filters"""
+    def client_factory() -> MCPClient:
+        return MCPClient(args.url, args.username, args.password, args.token,
+                         schema_path=args.schema, validate=not args.no_validate,
+                         request_encoding="gzip" if args.compress_requests else None)
+
+    orchestrator = RegenerationOrchestrator(client_factory, args.journal, workers=args.workers,
+                                            rate=args.rate, burst=args.burst)
+    try:
+        targets = orchestrator.select_posts(args.status, args.template_id, args.search)
+        if args.post_ids:
+            wanted = {int(p) for p in args.post_ids.split(",") if p.strip()}
+            targets = [t for t in targets if t[0] in wanted]
+    except (RuntimeError, ValueError) as e:
+        print(f"❌ Selection failed: {e}")
+        return 1
+
+    print(f"🔁 Regenerating '{args.component}' for {len(targets)} post(s) "
+          f"({args.workers} worker(s), {args.rate}/s, journal: {args.journal})")
+
+    def progress(finished: int, total: int, failed: int):
+        if finished % 50 == 0 or finished == total:
+            print(f"   {finished}/{total} finished, {failed} failed")
+
+    counts = orchestrator.run(targets, args.component, save=args.save, progress=progress)
+    print(f"✅ Done: {counts['done']}, failed: {counts['failed']}, "
+          f"skipped (already done): {counts['skipped']}")
+    return 0 if counts["failed"] == 0 else 1
+
+
+def run_stdio(args) -> int:
+    """Serve line-delimited JSON-RPC over stdin/stdout"""
+    def client_factory() -> MCPClient:
+        return MCPClient(args.url, args.username, args.password, args.token,
+                         schema_path=args.schema, validate=not args.no_validate,
+                         request_encoding="gzip" if args.compress_requests else None)
+
+    session = StdioSession(client_factory, workers=args.workers)
+    try:
+        session.serve(sys.stdin, sys.stdout)
+    except KeyboardInterrupt:
+        return 130
+    return 0
+
+
+def run_benchmark(args) -> int:
+    """Print the transport benchmark table"""
+    bandwidth = f"{args.bandwidth_kbps:g} kbit/s" if args.bandwidth_kbps else "unlimited"
+    print(f"📦 Transport benchmark: {args.iterations} call(s) per row, "
+          f"RTT {args.rtt_ms:g} ms, bandwidth {bandwidth}")
+    rows = benchmark_transport(args.iterations, args.rtt_ms, args.bandwidth_kbps, args.compress_requests)
+
+    identity = {row["payload"]: row["response_bytes"] for row in rows if row["encoding"] == "identity"}
+    print(f"{'Payload':<24} {'Encoding':<9} {'Req B':>7} {'Resp B':>9} {'Ratio':>6} {'p50 ms':>8} {'p95 ms':>8}")
+    print("-" * 76)
+    for row in rows:
+        ratio = identity[row["payload"]] / row["response_bytes"] if row["response_bytes"] else 0
+        print(f"{row['payload']:<24} {row['encoding']:<9} {row['request_bytes']:>7} "
+              f"{row['response_bytes']:>9} {ratio:>5.1f}x {row['p50_ms']:>8.2f} {row['p95_ms']:>8.2f}")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MCP Bridge Client Example")
+    parser.add_argument("--url", help="MCP Bridge URL")
+    parser.add_argument("--username", help="WordPress username")
+    parser.add_argument("--password", help="WordPress application password")
+    parser.add_argument("--token", help="Shared secret matching AIPS_MCP_BRIDGE_TOKEN in wp-config.php")
+    parser.add_argument("--tool", default="list_tools", help="Tool to call (default: list_tools)")
+    parser.add_argument("--params", help="Tool parameters as JSON string")
+    parser.add_argument("--schema", help="Path to mcp-bridge-schema.json (default: the plugin's copy)")
+    parser.add_argument("--no-validate", action="store_true", help="Send calls without local schema validation")
+    parser.add_argument("--compress-requests", action="store_true",
+                        help="gzip request bodies of 1 KiB or more (the bridge decodes them)")
+
+    subparsers = parser.add_subparsers(dest="command")
+
+    sync_parser = subparsers.add_parser("sync", help="Incrementally mirror bridge data into SQLite")
+    sync_parser.add_argument("--db", default="aips-mirror.sqlite", help="SQLite database file (default: aips-mirror.sqlite)")
+    sync_parser.add_argument("--full", action="store_true", help="Ignore the sync watermark and re-read all history")
+    
+    regen_parser = subparsers.add_parser("regenerate", help="Regenerate a post component across many posts")
+    regen_parser.add_argument("--component", required=True, choices=["title", "excerpt", "content", "featured_image"],
+                              help="Component to regenerate")
+    regen_parser.add_argument("--status", choices=["completed", "failed", "pending"], help="History status filter")
+    regen_parser.add_argument("--template-id", type=int, help="History template filter")
+    regen_parser.add_argument("--search", help="History title search filter")
+    regen_parser.add_argument("--post-ids", help="Comma-separated post IDs to restrict the selection to")
+    regen_parser.add_argument("--save", action="store_true", help="Save regenerated values (default: preview only)")
+    regen_parser.add_argument("--workers", type=int, default=4, help="Concurrent bridge calls (default: 4)")
+    regen_parser.add_argument("--rate", type=float, default=1.0, help="Global calls per second (default: 1.0, 0 = unlimited)")
+    regen_parser.add_argument("--burst", type=int, default=1, help="Calls allowed back-to-back after idling (default: 1)")
+    regen_parser.add_argument("--journal", default="aips-regenerate-journal.ndjson",
+                              help="Resumable progress journal (default: aips-regenerate-journal.ndjson)")
+    
+    bench_parser = subparsers.add_parser("benchmark", help="Benchmark response encodings against a local stand-in server")
+    bench_parser.add_argument("--iterations", type=int, default=20, help="Calls per payload and encoding (default: 20)")
+    bench_parser.add_argument("--rtt-ms", type=float, default=0.0, help="Simulated round-trip time in ms (default: 0)")
+    bench_parser.add_argument("--bandwidth-kbps", type=float, default=0.0,
+                              help="Simulated link bandwidth in kbit/s (default: unlimited)")
+    
+    stdio_parser = subparsers.add_parser("stdio", help="Read JSON-RPC requests line by line from stdin")
+    stdio_parser.add_argument("--workers", type=int, default=1,
+                              help="Concurrent calls; above 1, responses may arrive out of order (default: 1)")
+    
+    args = parser.parse_args()
+
+    if args.command == "benchmark":
+        return run_benchmark(args)
+
+    if not args.url or not args.token:
+        parser.error("--url and --token are required")
+
+    if args.command == "regenerate":
+        return run_regenerate(args)
+
+    if args.command == "stdio":
+        return run_stdio(args)
+    
+    # Create client
+    client = MCPClient(args.url, args.username, args.password, args.token,
+                       schema_path=args.schema, validate=not args.no_validate,
+                       request_encoding="gzip" if args.compress_requests else None)
+
+    if args.command == "sync":
+        return run_sync(client, args)
+
+    return run_tool(client, args)
+
+
 if __name__ == "__main__":
     exit(main())
@@ -0,0 +1,145 @@
+"""Unit tests for the feature scanner's graph and test-selection helpers.
+
+Run with ``python3 -m unittest discover -s scripts/tests``.
+"""
+
+import contextlib
+import io
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from feature_scanner import FeatureScanner  # noqa: E402
+
+
+def write(root: Path, relative: str, content: str):
+    path = root / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding='utf-8')
+
+
+class DependencyGraphTest(unittest.TestCase):
+    """Cycle collapsing and transitive reduction of category diagrams."""
+
+    def setUp(self):
+        self.scanner = FeatureScanner(tempfile.mkdtemp())
+
+    def test_cycle_is_one_component(self):
+        edges = {'A': {'B'}, 'B': {'C'}, 'C': {'A'}, 'D': {'A'}}
+        components = FeatureScanner.strongly_connected_components(['A', 'B', 'C', 'D'], edges)
+        self.assertEqual(sorted(components), [['A', 'B', 'C'], ['D']])
+        # Reverse topological order: the cycle D depends on comes first
+        self.assertEqual(components[-1], ['D'])
+
+    def test_transitive_edge_is_dropped(self):
+        reduced = FeatureScanner.transitive_reduction([0, 1, 2], {0: {1, 2}, 1: {2}})
+        self.assertEqual(reduced, {0: {1}, 1: {2}, 2: set()})
+
+    def test_condensed_graph_collapses_cycle_and_reduces(self):
+        # Controller -> Service <-> Repository cycle, plus an implied Controller -> Repository edge
+        self.scanner.class_dependencies.update({
+            'AIPS_Controller': {'AIPS_Service', 'AIPS_Repository', 'AIPS_Logger'},
+            'AIPS_Service': {'AIPS_Repository'},
+            'AIPS_Repository': {'AIPS_Service', 'AIPS_Logger'},
+        })
+        classes = ['AIPS_Controller', 'AIPS_Service', 'AIPS_Repository', 'AIPS_Logger']
+        components, edges, omitted = self.scanner.condensed_dependency_graph(classes)
+        self.assertEqual(components, [['AIPS_Controller'], ['AIPS_Repository', 'AIPS_Service'], ['AIPS_Logger']])
+        self.assertEqual(edges, {0: {1}, 1: {2}, 2: set()})
+        self.assertEqual(omitted, 1)
+
+
+class PartitionGraphTest(unittest.TestCase):
+    """Large diagrams are split into parts within the node and edge budgets."""
+
+    def setUp(self):
+        self.scanner = FeatureScanner(tempfile.mkdtemp())
+
+    def assertWithinBudgets(self, parts, edges):
+        for part in parts:
+            members = set(part)
+            self.assertLessEqual(len(part), self.scanner.MERMAID_NODE_BUDGET)
+            inner = sum(1 for node in part for target in edges.get(node, ()) if target in members)
+            self.assertLessEqual(inner, self.scanner.MERMAID_EDGE_BUDGET)
+
+    def test_chain_is_split_by_node_budget(self):
+        count = 3 * self.scanner.MERMAID_NODE_BUDGET
+        edges = {node: {node + 1} for node in range(count - 1)}
+        parts = self.scanner.partition_graph(count, edges)
+        self.assertEqual(sorted(node for part in parts for node in part), list(range(count)))
+        self.assertEqual(len(parts), 3)
+        self.assertWithinBudgets(parts, edges)
+
+    def test_dense_graph_is_split_by_edge_budget(self):
+        count = self.scanner.MERMAID_NODE_BUDGET
+        edges = {node: set(range(node + 1, count)) for node in range(count)}
+        parts = self.scanner.partition_graph(count, edges)
+        self.assertGreater(len(parts), 1)
+        self.assertWithinBudgets(parts, edges)
+
+    def test_isolated_nodes_are_packed_together(self):
+        parts = self.scanner.partition_graph(5, {})
+        self.assertEqual(parts, [[0, 1, 2, 3, 4]])
+
+
+class SelectTestsTest(unittest.TestCase):
+    """Change sets mapped to the PHPUnit test files they affect."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.root = Path(tempfile.mkdtemp())
+        write(cls.root, 'ai-post-scheduler.php', "<?php\n/*\n * Plugin Name: Test Plugin\n */\n")
+        write(cls.root, 'phpunit.xml', "<phpunit></phpunit>\n")
+        write(cls.root, 'includes/class-aips-repository.php',
+              "<?php\nclass AIPS_Repository {\n    public function find() { return 1; }\n}\n")
+        write(cls.root, 'includes/class-aips-service.php',
+              "<?php\nclass AIPS_Service {\n    public function __construct() {\n"
+              "        $this->repository = new AIPS_Repository();\n    }\n}\n")
+        write(cls.root, 'includes/class-aips-controller.php',
+              "<?php\nclass AIPS_Controller {\n    public function __construct() {\n"
+              "        $this->service = new AIPS_Service();\n    }\n}\n")
+        write(cls.root, 'includes/helpers.php', "<?php\nfunction aips_helper() {}\n")
+        write(cls.root, 'tests/bootstrap.php', "<?php\n")
+        write(cls.root, 'tests/test-repository.php',
+              "<?php\nclass Test_Repository extends WP_UnitTestCase {\n"
+              "    public function test_find() { $r = new AIPS_Repository(); }\n}\n")
+        write(cls.root, 'tests/test-service.php',
+              "<?php\nclass Test_Service extends WP_UnitTestCase {\n"
+              "    public function test_build() { $s = new AIPS_Service(); }\n}\n")
+        write(cls.root, 'tests/test-controller.php',
+              "<?php\nclass Test_Controller extends WP_UnitTestCase {\n"
+              "    public function test_build() { $c = new AIPS_Controller(); }\n}\n")
+        cls.scanner = FeatureScanner(str(cls.root))
+        with contextlib.redirect_stdout(io.StringIO()):
+            cls.scanner.scan_all_files()
+
+    def test_run_all_file_selects_every_test(self):
+        result = self.scanner.select_tests(['phpunit.xml'])
+        self.assertEqual(result['run_all'], 'phpunit.xml')
+        self.assertEqual(sorted(result['selected']),
+                         ['tests/test-controller.php', 'tests/test-repository.php', 'tests/test-service.php'])
+
+    def test_changed_test_file_is_selected(self):
+        result = self.scanner.select_tests(['tests/test-service.php'])
+        self.assertIsNone(result['run_all'])
+        self.assertEqual(result['selected'], {'tests/test-service.php': 'changed'})
+
+    def test_untracked_path_is_reported(self):
+        result = self.scanner.select_tests(['includes/helpers.php'])
+        self.assertEqual(result['untracked'], ['includes/helpers.php'])
+        self.assertEqual(result['selected'], {})
+
+    def test_deeper_dependents_are_reported_not_selected(self):
+        result = self.scanner.select_tests(['includes/class-aips-repository.php'])
+        self.assertEqual(result['changed'], {'AIPS_Repository'})
+        self.assertEqual(result['affected'], {'AIPS_Service'})
+        self.assertEqual(result['deeper'], {'AIPS_Controller'})
+        self.assertEqual(sorted(result['selected']), ['tests/test-repository.php', 'tests/test-service.php'])
+        self.assertEqual(result['related'], {'tests/test-controller.php': 'references AIPS_Controller'})
+
+
+if __name__ == '__main__':
+    unittest.main()